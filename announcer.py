@@ -0,0 +1,93 @@
+"""Outbound announcement queue — coalesces bursts of short notices per channel.
+
+`Announcer.announce()` never awaits: it appends a line to the channel's pending list
+and, if needed, starts that channel's flush task. The flush task waits a short window,
+sends everything gathered as one message, and keeps a minimum gap between sends to the
+same channel, so a burst of level-ups becomes one or two messages instead of dozens of
+rate-limited sends blocking the caller.
+"""
+
+import asyncio
+import time
+
+# Seconds to gather lines before sending
+ANNOUNCE_WINDOW = 2.0
+# Minimum seconds between messages to one channel (Discord allows 5 per 5 seconds)
+MIN_SEND_INTERVAL = 1.0
+# Lines kept per channel per flush; extra lines are counted and summarised
+MAX_PENDING = 40
+# Discord's message length limit
+MESSAGE_LIMIT = 2000
+
+
+def _chunk_lines(lines: list):
+    """Join lines into messages that fit within the length limit."""
+    chunk = ""
+    for line in lines:
+        line = line[:MESSAGE_LIMIT]
+        if chunk and len(chunk) + 1 + len(line) > MESSAGE_LIMIT:
+            yield chunk
+            chunk = ""
+        chunk = f"{chunk}\n{line}" if chunk else line
+    if chunk:
+        yield chunk
+
+
+class Announcer:
+    """Per-channel coalescing send queues."""
+
+    def __init__(self, bot, window: float = ANNOUNCE_WINDOW, min_interval: float = MIN_SEND_INTERVAL):
+        self.bot = bot
+        self.window = window
+        self.min_interval = min_interval
+        # channel_id -> [channel, lines, dropped]
+        self.pending = {}
+        # channel_id -> flush task
+        self._tasks = {}
+
+    def announce(self, channel, line: str):
+        """Queue a line for `channel`. Returns immediately."""
+        entry = self.pending.get(channel.id)
+        if entry is None:
+            entry = self.pending[channel.id] = [channel, [], 0]
+        if len(entry[1]) < MAX_PENDING:
+            entry[1].append(line)
+        else:
+            entry[2] += 1
+        if channel.id not in self._tasks:
+            self._tasks[channel.id] = self.bot.loop.create_task(self._flush(channel.id))
+
+    def stop(self):
+        """Cancel pending sends (call from cog_unload)."""
+        for task in list(self._tasks.values()):
+            task.cancel()
+        self._tasks.clear()
+        self.pending.clear()
+
+    async def _flush(self, channel_id: int):
+        """Send whatever has gathered for a channel, until nothing new arrives."""
+        last_sent = 0.0
+        try:
+            while True:
+                await asyncio.sleep(max(self.window, last_sent + self.min_interval - time.monotonic()))
+                entry = self.pending.pop(channel_id, None)
+                if entry is None:
+                    return
+                channel, lines, dropped = entry
+                if dropped:
+                    lines.append(f"…and {dropped} more")
+                for message in _chunk_lines(lines):
+                    if last_sent:
+                        gap = last_sent + self.min_interval - time.monotonic()
+                        if gap > 0:
+                            await asyncio.sleep(gap)
+                    try:
+                        await channel.send(message)
+                    except Exception as e:
+                        print(f"[announcer] Failed to send to channel {channel_id}: {e}")
+                    last_sent = time.monotonic()
+        except asyncio.CancelledError:
+            return
+        finally:
+            if self._tasks.get(channel_id) is asyncio.current_task():
+                del self._tasks[channel_id]
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmarks for pure hot functions.
+Times level math, trivia answer matching, blackjack hands, slot spins and the
+game step/render methods in isolation, and compares each against a stored
+baseline. Run it alongside validate_bot.py before deploying.
+
+Usage:
+    python3 benchmark_bot.py --save          # record a baseline on this machine
+    python3 benchmark_bot.py                 # compare against it (exit 1 on regression, 2 if no baseline)
+    python3 benchmark_bot.py --tolerance 0.5 # allow up to 50% slower than baseline
+    python3 benchmark_bot.py trivia          # only benchmarks whose name contains "trivia"
+
+Baselines are machine-specific - record one on the host you deploy from. The baseline
+file is not committed; without one the check fails unless --allow-missing-baseline is given.
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import timeit
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent
+BASELINE_FILE = ROOT / "benchmark_baseline.json"
+# Allowed slowdown relative to the baseline (0.30 = 30% slower)
+DEFAULT_TOLERANCE = 0.30
+# Timing rounds per benchmark; the fastest is kept, since noise only ever adds time
+REPEATS = 5
+
+
+def build_benchmarks() -> dict:
+    """Return {name: zero-argument callable}. Each callable runs one iteration."""
+    sys.path.insert(0, str(ROOT))
+    random.seed(1234)
+
+    from cards import Hand, Shoe, dealer_play
+    from casino_rules import CLASSIC_SLOTS
+    from cogs.games import Games
+    from cogs.rank import calculate_level
+    from cogs.trivia import Trivia
+
+    trivia = Trivia(None)
+    answers = trivia._normalize_answers("Canberra | Australian Capital Territory")
+
+    shoe = Shoe(rng=random.Random(1))
+
+    def blackjack_hand():
+        shoe.start_hand()
+        player = Hand((shoe.draw(), shoe.draw()))
+        dealer = Hand((shoe.draw(), shoe.draw()))
+        while player.total < 17:
+            player.add(shoe.draw())
+        dealer_play(dealer, shoe)
+        return player.format(), dealer.format(hide_first=True)
+
+    slot_rng = random.Random(2)
+
+    def life_step(width, height):
+        # step() builds a new grid, so resetting to the same start board each call is free
+        game = Games.GameOfLife(width, height)
+        game.randomize()
+        start = game.grid
+
+        def run():
+            game.grid = start
+            game.step()
+        return run
+
+    life = Games.GameOfLife()
+    life.randomize()
+    pong = Games.PongGame()
+    snake = Games.SnakeGame()
+    snake.snake = [(x, 5) for x in range(2, 12)]
+
+    xp_values = [random.randint(0, 5_000_000) for _ in range(1000)]
+
+    return {
+        "rank.calculate_level (x1000)": lambda: [calculate_level(xp) for xp in xp_values],
+        "trivia.normalize_text": lambda: trivia._normalize_text("  What's the Capital of AUSTRALIA?!  "),
+        "trivia.is_match (exact)": lambda: trivia._is_match("canberra", answers),
+        "trivia.is_match (substring)": lambda: trivia._is_match("I'm pretty sure it's Canberra", answers),
+        "trivia.is_match (fuzzy miss)": lambda: trivia._is_match("melbourne victoria", answers),
+        "cards.blackjack_hand": blackjack_hand,
+        "casino.slots_spin": lambda: CLASSIC_SLOTS.payout(10, CLASSIC_SLOTS.spin(slot_rng)),
+        "games.life_step (20x10)": life_step(20, 10),
+        "games.life_step (60x40)": life_step(60, 40),
+        "games.life_render": life.render,
+        "games.pong_render": pong.render,
+        "games.snake_render": snake.render,
+    }
+
+
+def _reference_workload():
+    """Fixed pure-Python work used to scale results to the current machine speed."""
+    total = 0
+    for i in range(2000):
+        total += i * i % 7
+    return total
+
+
+REFERENCE = "__reference__"
+
+
+def measure(func) -> float:
+    """Return the best per-call time in microseconds."""
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()  # Enough calls to take at least 0.2s
+    best = min(timer.repeat(repeat=REPEATS, number=number))
+    return best / number * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark pure hot functions against a stored baseline.")
+    parser.add_argument("filters", nargs="*", help="Only run benchmarks whose name contains one of these")
+    parser.add_argument("--save", action="store_true", help="Write the results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help=f"Allowed slowdown vs baseline (default {DEFAULT_TOLERANCE})")
+    parser.add_argument("--baseline", default=str(BASELINE_FILE), help="Baseline JSON file")
+    parser.add_argument("--allow-missing-baseline", action="store_true",
+                        help="Just print timings (exit 0) when there is no baseline yet")
+    args = parser.parse_args()
+
+    print("⏱️  Micro-benchmarks\n")
+
+    baseline = {}
+    if os.path.exists(args.baseline) and not args.save:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+    elif not args.save:
+        if not args.allow_missing_baseline:
+            print(f"🛑 No baseline at {args.baseline} - run once with --save on this host to record one")
+            return 2
+        print(f"⚠️  No baseline at {args.baseline} - run with --save to record one\n")
+
+    benchmarks = build_benchmarks()
+    if args.filters:
+        benchmarks = {n: f for n, f in benchmarks.items() if any(s in n for s in args.filters)}
+
+    # Results are compared after scaling by the reference workload, so a host that is
+    # uniformly slower or busier than when the baseline was recorded doesn't fail every check
+    reference = measure(_reference_workload)
+    scale = baseline[REFERENCE] / reference if REFERENCE in baseline else 1.0
+    results = {REFERENCE: reference}
+    regressions = []
+    for name, func in benchmarks.items():
+        micros = measure(func)
+        results[name] = micros
+        base = baseline.get(name)
+        if base is None:
+            print(f"   {name:<32} {micros:>12.3f} µs")
+            continue
+        change = micros * scale / base - 1
+        ok = change <= args.tolerance
+        if not ok:
+            regressions.append(name)
+        print(f"{'✅' if ok else '❌'} {name:<32} {micros:>12.3f} µs  ({change * 100:+.1f}% vs {base:.3f} µs)")
+
+    if args.save:
+        saved = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline) as f:
+                saved = json.load(f)
+        saved.update(results)
+        with open(args.baseline, "w") as f:
+            json.dump(saved, f, indent=4, sort_keys=True)
+        print(f"\n💾 Saved baseline for {len(results) - 1} benchmark(s) to {args.baseline}")
+        return 0
+
+    if baseline and REFERENCE in baseline:
+        print(f"\nMachine speed vs baseline: {scale:.2f}x (results above are compared after scaling)")
+
+    if regressions:
+        print(f"\n🛑 {len(regressions)} benchmark(s) regressed more than {args.tolerance * 100:.0f}%:")
+        for name in regressions:
+            print(f"   - {name}")
+        return 1
+
+    if baseline:
+        print(f"\n✅ No regressions beyond {args.tolerance * 100:.0f}%")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,7 +1,11 @@
 import os
-import logging
 import json
 
+import botlog
+import history
+import loop_watchdog
+import metrics
+
 import discord
 from discord.ext import commands
 from discord import app_commands
@@ -14,8 +18,9 @@ __version__ = "0.0.3-alpha"
 load_dotenv()
 TOKEN = os.getenv("DISCORD_TOKEN")
 
-# Configure logging - INFO level to reduce noise, DEBUG for development
-logging.basicConfig(level=logging.INFO)
+# Configure logging - queue-backed; set LOG_LEVEL=DEBUG (or use /debug_logging) for debug events
+botlog.setup()
+gateway_log = botlog.get_logger("gateway")
 
 # Discord intents
 intents = discord.Intents.default()
@@ -58,22 +63,21 @@ class MyBot(commands.Bot):
         except Exception as e:
             print(f"[autorole] Failed to assign role: {e}")
 
-    async def on_socket_response(self, msg):
-        """
-        Log important gateway events to help debug interaction issues.
-        Only logs INTERACTION_CREATE, APPLICATION_COMMAND_CREATE, and READY events.
-        """
-        try:
-            t = msg.get("t")
-            if t in ("INTERACTION_CREATE", "APPLICATION_COMMAND_CREATE", "READY"):
-                op = msg.get("op")
-                d_keys = list(msg.get('d', {}).keys()) if isinstance(msg.get('d'), dict) else None
-                print(f"[socket] t={t} op={op} d_keys={d_keys}")
-        except Exception as e:
-            print(f"[socket] Logging failed: {e}")
+    async def on_gateway_event(self, event_type: str):
+        """Log gateway event types (sampled). Only registered while debug logging is on."""
+        botlog.log_event(gateway_log, event_type)
+
+    def _toggle_gateway_logging(self, enabled: bool):
+        # Listening to every gateway event costs a task per event, so only do it when someone is reading
+        self.remove_listener(self.on_gateway_event, "on_socket_event_type")
+        if enabled:
+            self.add_listener(self.on_gateway_event, "on_socket_event_type")
 
     async def setup_hook(self):
         """Runs before the bot connects — load cogs here."""
+        botlog.on_debug_change(self._toggle_gateway_logging)
+        self._toggle_gateway_logging(botlog.debug_enabled())
+
         await self.load_extension("cogs.general")
         await self.load_extension("cogs.rank")
         await self.load_extension("cogs.fun")
@@ -82,6 +86,30 @@ class MyBot(commands.Bot):
         await self.load_extension("cogs.trivia")
         await self.load_extension("cogs.casino")
 
+        # Metrics exporters (configured via METRICS_PORT / METRICS_FILE)
+        self.metrics_tasks = await metrics.start(self)
+
+        # Loop lag monitor and stall profiler (configured via WATCHDOG_LAG_LIMIT)
+        self.watchdog = loop_watchdog.start(self)
+
+        # XP/balance history, flushed to SQLite in batches (see history.py)
+        self.history_task = history.start(self)
+
+    async def close(self):
+        if getattr(self, "watchdog", None):
+            self.watchdog.stop()
+        if getattr(self, "history_task", None):
+            self.history_task.cancel()
+            await history.stop()
+        await super().close()
+
+    async def on_app_command_completion(self, interaction: discord.Interaction, command):
+        """Record per-command latency, measured from when Discord created the interaction."""
+        name = command.qualified_name
+        latency = (discord.utils.utcnow() - interaction.created_at).total_seconds()
+        metrics.COMMAND_LATENCY.observe(latency, command=name)
+        metrics.COMMANDS_TOTAL.inc(command=name)
+
 
 # Create bot instance
 bot = MyBot()
@@ -100,9 +128,13 @@ async def on_ready():
     print("Slash commands synced.")
     print("Bot is ready.")
 
-if TOKEN is None:
-    print("Error: DISCORD_TOKEN not found in environment variables.")
-    print("Please create a .env file with DISCORD_TOKEN set.")
-    exit(1)
+# Guarded so the export worker process (started with "spawn", which re-imports this
+# module) doesn't start a second bot
+if __name__ == "__main__":
+    if TOKEN is None:
+        print("Error: DISCORD_TOKEN not found in environment variables.")
+        print("Please create a .env file with DISCORD_TOKEN set.")
+        exit(1)
 
-bot.run(TOKEN)
+    # Logging is already set up by botlog, so discord.py should not add its own handler
+    bot.run(TOKEN, log_handler=None)
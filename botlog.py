@@ -0,0 +1,125 @@
+"""Structured, sampled logging for high-volume debug events.
+
+Log records are put on a queue by the calling code and formatted and written by a
+background listener thread, so the event loop never waits on stdout. Debug events
+(gateway events, interactions) are sampled per event type and cost a single level
+check while debug logging is off.
+
+    from botlog import get_logger, log_event
+    log = get_logger("interaction")
+    log_event(log, "interaction", id=interaction.id, user=interaction.user.id)
+
+Configured with environment variables (both optional):
+    LOG_LEVEL         Level for the bot's own loggers (default INFO; DEBUG turns on debug events)
+    LOG_SAMPLE_RATES  Per-event sample rates, e.g. "interaction=0.1,MESSAGE_CREATE=0.001"
+"""
+
+import atexit
+import logging
+import logging.handlers
+import os
+import queue
+import random
+
+LOG_FORMAT = "%(asctime)s %(levelname)-8s %(name)s %(message)s"
+
+# Fraction of debug events logged, by event name; other events use DEFAULT_SAMPLE_RATE
+SAMPLE_RATES = {
+    "READY": 1.0,
+    "RESUMED": 1.0,
+    "INTERACTION_CREATE": 1.0,
+    "APPLICATION_COMMAND_CREATE": 1.0,
+    "interaction": 1.0,
+}
+DEFAULT_SAMPLE_RATE = 0.01
+
+_ROOT = "bot"
+_listener = None
+# Called with True/False whenever debug logging is switched
+_debug_hooks = []
+
+
+class StructuredFormatter(logging.Formatter):
+    """Appends the record's `fields` as key=value pairs."""
+
+    def format(self, record):
+        text = super().format(record)
+        fields = getattr(record, "fields", None)
+        if fields:
+            text += " " + " ".join(f"{key}={value}" for key, value in fields.items())
+        return text
+
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """Queues records unformatted; the listener thread does all formatting."""
+
+    def prepare(self, record):
+        if record.exc_info:
+            # Tracebacks reference frames, so render them before they go away
+            return super().prepare(record)
+        return record
+
+
+def _parse_sample_rates(text: str):
+    for item in text.split(","):
+        if "=" not in item:
+            continue
+        event, rate = item.split("=", 1)
+        try:
+            SAMPLE_RATES[event.strip()] = min(1.0, max(0.0, float(rate)))
+        except ValueError:
+            print(f"[logging] Ignoring bad sample rate: {item!r}")
+
+
+def setup():
+    """Route all logging through a queue and a background writer thread. Call once at startup."""
+    global _listener
+    if _listener is not None:
+        return
+
+    log_queue = queue.SimpleQueue()
+    stream = logging.StreamHandler()
+    stream.setFormatter(StructuredFormatter(LOG_FORMAT))
+
+    root = logging.getLogger()
+    root.handlers[:] = [_DeferredQueueHandler(log_queue)]
+    root.setLevel(logging.INFO)
+
+    _listener = logging.handlers.QueueListener(log_queue, stream, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
+
+    _parse_sample_rates(os.getenv("LOG_SAMPLE_RATES", ""))
+    level = os.getenv("LOG_LEVEL", "INFO").upper()
+    logging.getLogger(_ROOT).setLevel(getattr(logging, level, logging.INFO))
+
+
+def get_logger(name: str) -> logging.Logger:
+    """Return a logger under the bot's namespace (e.g. "bot.gateway")."""
+    return logging.getLogger(f"{_ROOT}.{name}")
+
+
+def debug_enabled() -> bool:
+    return logging.getLogger(_ROOT).isEnabledFor(logging.DEBUG)
+
+
+def on_debug_change(hook):
+    """Register `hook(enabled)` to run whenever debug logging is switched."""
+    _debug_hooks.append(hook)
+
+
+def set_debug(enabled: bool):
+    """Switch debug logging for the bot's loggers at runtime."""
+    logging.getLogger(_ROOT).setLevel(logging.DEBUG if enabled else logging.INFO)
+    for hook in _debug_hooks:
+        hook(enabled)
+
+
+def log_event(logger: logging.Logger, event: str, **fields):
+    """Log a sampled debug event. Field values are only turned into text on the writer thread."""
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+    rate = SAMPLE_RATES.get(event, DEFAULT_SAMPLE_RATE)
+    if rate < 1.0 and random.random() >= rate:
+        return
+    logger.debug(event, extra={"fields": fields})
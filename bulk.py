@@ -0,0 +1,130 @@
+"""Bulk admin edits — target resolution and chunked application with progress.
+
+Targets come from any mix of a role, a pasted list of mentions/ids and a CSV attachment
+(`user_id[,amount]` per line; a header row is skipped). Changes are applied in memory in
+chunks, yielding to the event loop between chunks and reporting progress now and then;
+the caller saves once at the end.
+"""
+
+import asyncio
+import csv
+import io
+import re
+import time
+
+# Users changed between yields to the event loop
+CHUNK_SIZE = 2000
+# Seconds between progress updates
+PROGRESS_INTERVAL = 2.0
+# Largest CSV attachment accepted (bytes)
+MAX_CSV_BYTES = 5 * 1024 * 1024
+
+_USER_ID = re.compile(r"\d{15,20}")
+
+
+def parse_user_list(text: str) -> list:
+    """User ids from mentions or raw ids separated by anything."""
+    return [int(match) for match in _USER_ID.findall(text or "")]
+
+
+def parse_csv(data: bytes, default_amount: int) -> tuple:
+    """Read `user_id[,amount]` rows. Returns ({user_id: amount}, [error lines])."""
+    targets, errors = {}, []
+    reader = csv.reader(io.StringIO(data.decode("utf-8-sig", errors="replace")))
+    for line_no, row in enumerate(reader, start=1):
+        if not row or not row[0].strip():
+            continue
+        try:
+            user_id = int(row[0].strip().strip("<@!>"))
+            amount = int(row[1]) if len(row) > 1 and row[1].strip() else default_amount
+        except ValueError:
+            if line_no > 1:
+                errors.append(f"line {line_no}: {','.join(row)[:60]}")
+            continue  # first line is a header
+        targets[user_id] = amount
+    return targets, errors
+
+
+def collect_targets(amount: int, role=None, users: str = None, csv_data: bytes = None) -> tuple:
+    """Merge every target source into ({user_id: amount}, [errors]). CSV amounts win."""
+    targets, errors = {}, []
+    if role is not None:
+        for member in role.members:
+            if not member.bot:
+                targets[member.id] = amount
+    for user_id in parse_user_list(users):
+        targets[user_id] = amount
+    if csv_data is not None:
+        rows, errors = parse_csv(csv_data, amount)
+        targets.update(rows)
+    return targets, errors
+
+
+def summarize(targets: dict, describe) -> str:
+    """A short preview: count, total and the first few changes (`describe(user_id, amount)`)."""
+    lines = [f"**{len(targets):,}** users, total **{sum(targets.values()):+,}**"]
+    for user_id, amount in list(targets.items())[:5]:
+        lines.append(f"• {describe(user_id, amount)}")
+    if len(targets) > 5:
+        lines.append(f"• …and {len(targets) - 5:,} more")
+    return "\n".join(lines)
+
+
+async def apply_in_chunks(targets: dict, apply_one, report=None) -> int:
+    """Call `apply_one(user_id, amount)` for every target, yielding between chunks.
+
+    `report(done, total)` is awaited at most every PROGRESS_INTERVAL seconds. Returns the
+    number of users applied.
+    """
+    total = len(targets)
+    last_report = time.monotonic()
+    for done, (user_id, amount) in enumerate(targets.items(), start=1):
+        apply_one(user_id, amount)
+        if done % CHUNK_SIZE == 0:
+            await asyncio.sleep(0)
+            if report is not None and time.monotonic() - last_report >= PROGRESS_INTERVAL:
+                last_report = time.monotonic()
+                try:
+                    await report(done, total)
+                except Exception as e:
+                    print(f"[bulk] Progress update failed: {e}")
+    return total
+
+
+async def run(interaction, action: str, amount: int, role, users: str, file, dry_run: bool,
+              describe, apply_one, finish):
+    """Shared flow for bulk admin commands, after the admin check.
+
+    Resolves targets, then either previews them (`dry_run`) or applies `apply_one` to each
+    with progress updates and calls `finish()` once (the single save).
+    """
+    await interaction.response.defer(ephemeral=True)
+
+    csv_data = None
+    if file is not None:
+        if file.size > MAX_CSV_BYTES:
+            await interaction.followup.send(f"CSV is too large (max {MAX_CSV_BYTES // 1024 // 1024} MB).", ephemeral=True)
+            return
+        csv_data = await file.read()
+
+    targets, errors = collect_targets(amount, role, users, csv_data)
+    if not targets:
+        await interaction.followup.send("No users matched - give a role, a list of users or a CSV file.", ephemeral=True)
+        return
+
+    preview = summarize(targets, describe)
+    if errors:
+        preview += f"\n⚠️ Skipped {len(errors)} unreadable CSV line(s): {'; '.join(errors[:3])}"
+    if dry_run:
+        await interaction.followup.send(f"🧪 Dry run - {action}\n{preview}\nNothing was changed.", ephemeral=True)
+        return
+
+    message = await interaction.followup.send(f"⏳ {action}: 0/{len(targets):,}", ephemeral=True, wait=True)
+
+    async def report(done, total):
+        await message.edit(content=f"⏳ {action}: {done:,}/{total:,}")
+
+    start = time.perf_counter()
+    await apply_in_chunks(targets, apply_one, report)
+    finish()
+    await message.edit(content=f"✅ {action} - done in {time.perf_counter() - start:.1f}s\n{preview}")
@@ -0,0 +1,137 @@
+"""Card engine for blackjack — integer-encoded cards, a multi-deck shoe, and incremental hand totals.
+
+Cards are ints 0-51: `card // 4` is the rank index (0 = '2' ... 12 = 'A') and `card % 4` the suit.
+Values and labels are looked up from precomputed tables, so dealing never allocates per card.
+
+Run `python3 cards.py` for a throughput benchmark (hands dealt per second).
+"""
+
+import random
+import time
+
+RANKS = ['2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K', 'A']
+SUITS = ['♠️', '♥️', '♦️', '♣️']
+
+# Blackjack value of each card (aces count 11; Hand demotes them to 1 as needed)
+CARD_VALUES = tuple(int(r) if r.isdigit() else (11 if r == 'A' else 10) for r in RANKS for _ in SUITS)
+# Display label of each card, e.g. "10♥️"
+CARD_LABELS = tuple(f"{r}{s}" for r in RANKS for s in SUITS)
+HIDDEN_CARD = '🂠'
+
+# Defaults for the casino shoe
+SHOE_DECKS = 6
+SHOE_PENETRATION = 0.75  # Fraction of the shoe dealt before the cut card comes out
+
+
+class Hand:
+    """A blackjack hand that keeps its best total up to date as cards are added."""
+
+    __slots__ = ("cards", "total", "soft_aces")
+
+    def __init__(self, cards=()):
+        # Card ids fit in a byte, so a bytearray keeps open hands small
+        self.cards = bytearray()
+        self.total = 0
+        # Aces currently counted as 11
+        self.soft_aces = 0
+        for card in cards:
+            self.add(card)
+
+    def add(self, card: int) -> int:
+        """Add a card and return the new total."""
+        self.cards.append(card)
+        value = CARD_VALUES[card]
+        self.total += value
+        if value == 11:
+            self.soft_aces += 1
+        while self.total > 21 and self.soft_aces:
+            self.total -= 10
+            self.soft_aces -= 1
+        return self.total
+
+    @property
+    def is_soft(self) -> bool:
+        return self.soft_aces > 0
+
+    @property
+    def is_blackjack(self) -> bool:
+        return self.total == 21 and len(self.cards) == 2
+
+    @property
+    def is_bust(self) -> bool:
+        return self.total > 21
+
+    def format(self, hide_first: bool = False) -> str:
+        """Format the hand for display, optionally hiding the hole card."""
+        labels = [CARD_LABELS[c] for c in self.cards]
+        if hide_first and labels:
+            labels[0] = HIDDEN_CARD
+        return ' '.join(labels)
+
+
+class Shoe:
+    """A multi-deck shoe with a cut card. Keep one per table so it persists between hands."""
+
+    __slots__ = ("cards", "pos", "cut", "rng")
+
+    def __init__(self, decks: int = SHOE_DECKS, penetration: float = SHOE_PENETRATION, rng=None):
+        self.cards = bytearray(range(52)) * decks
+        self.cut = int(len(self.cards) * penetration)
+        self.rng = rng or random
+        self.shuffle()
+
+    def shuffle(self):
+        """Shuffle every card back into the shoe."""
+        self.rng.shuffle(self.cards)
+        self.pos = 0
+
+    @property
+    def needs_shuffle(self) -> bool:
+        """True once the cut card has been reached."""
+        return self.pos >= self.cut
+
+    @property
+    def remaining(self) -> int:
+        return len(self.cards) - self.pos
+
+    def start_hand(self):
+        """Call before dealing a new hand; reshuffles if the cut card came out last hand."""
+        if self.needs_shuffle:
+            self.shuffle()
+
+    def draw(self) -> int:
+        """Deal the next card."""
+        if self.pos >= len(self.cards):
+            # Only reachable with very small shoes; never deal from an empty shoe
+            self.shuffle()
+        card = self.cards[self.pos]
+        self.pos += 1
+        return card
+
+
+def dealer_play(hand: Hand, shoe: Shoe) -> int:
+    """Dealer draws to 17 (stands on all 17s). Returns the final total."""
+    while hand.total < 17:
+        hand.add(shoe.draw())
+    return hand.total
+
+
+def benchmark(hands: int = 200_000, decks: int = SHOE_DECKS) -> float:
+    """Deal `hands` complete hands (player hits below 17, dealer plays out) and return hands/sec."""
+    shoe = Shoe(decks)
+    start = time.perf_counter()
+    for _ in range(hands):
+        shoe.start_hand()
+        player = Hand((shoe.draw(), shoe.draw()))
+        dealer = Hand((shoe.draw(), shoe.draw()))
+        while player.total < 17:
+            player.add(shoe.draw())
+        if not player.is_bust:
+            dealer_play(dealer, shoe)
+    elapsed = time.perf_counter() - start
+    return hands / elapsed
+
+
+if __name__ == "__main__":
+    rate = benchmark()
+    print(f"🃏 Dealt {rate:,.0f} hands/sec ({SHOE_DECKS}-deck shoe)")
@@ -0,0 +1,210 @@
+"""Casino payout rules — pure functions shared by the Casino cog and the offline simulator.
+
+Every function here returns the *total* amount paid back to the player (stake included),
+so a payout of 0 is a loss and a payout equal to the bet is a push.
+"""
+
+import random
+
+from cards import Hand
+
+# ==================== ROULETTE ====================
+
+# Roulette wheel - 0-36, green 0
+RED_NUMBERS = frozenset({1, 3, 5, 7, 9, 12, 14, 16, 18, 19, 21, 23, 25, 27, 30, 32, 34, 36})
+BLACK_NUMBERS = frozenset({2, 4, 6, 8, 10, 11, 13, 15, 17, 20, 22, 24, 26, 28, 29, 31, 33, 35})
+ROULETTE_POCKETS = 37
+
+
+def roulette_color(result: int):
+    """Return (label, emoji) for a pocket."""
+    if result == 0:
+        return "🟢 Green", "🟢"
+    if result in RED_NUMBERS:
+        return "🔴 Red", "🔴"
+    return "⚫ Black", "⚫"
+
+
+def is_valid_roulette_bet(bet_type: str) -> bool:
+    """Numbers must be 0-36; any other text is accepted (unknown words simply never win)."""
+    bet_type = bet_type.lower()
+    return not bet_type.isdigit() or 0 <= int(bet_type) <= 36
+
+
+def roulette_payout(bet: int, bet_type: str, result: int) -> int:
+    """Return the payout for a roulette bet given the winning pocket."""
+    bet_type = bet_type.lower()
+    if bet_type == "red" and result in RED_NUMBERS:
+        return bet * 2  # 1:1 payout
+    if bet_type == "black" and result in BLACK_NUMBERS:
+        return bet * 2  # 1:1 payout
+    if bet_type == "odd" and result > 0 and result % 2 == 1:
+        return bet * 2  # 1:1 payout
+    if bet_type == "even" and result > 0 and result % 2 == 0:
+        return bet * 2  # 1:1 payout
+    if bet_type.isdigit() and int(bet_type) == result:
+        return bet * 36  # 35:1 payout
+    return 0
+
+
+def spin_roulette(rng=random) -> int:
+    """Spin the wheel."""
+    return rng.randint(0, 36)
+
+
+# ==================== SLOTS ====================
+
+# Slot symbols with weighted probabilities
+# Symbol: (emoji, weight, multiplier)
+SLOT_SYMBOLS = (
+    ('🍒', 35, 2),   # Cherry - common, 2x
+    ('🍋', 30, 3),   # Lemon - common, 3x
+    ('🍊', 20, 5),   # Orange - uncommon, 5x
+    ('🍇', 10, 10),  # Grape - rare, 10x
+    ('💎', 4, 25),   # Diamond - very rare, 25x
+    ('7️⃣', 1, 100),  # Seven - jackpot, 100x
+)
+# Two matching symbols return 1.5x the bet
+SLOT_PAIR_MULTIPLIER = 1.5
+
+
+def build_alias_table(weights):
+    """Build a Walker/Vose alias table. Returns (prob, alias) lists for O(1) sampling.
+
+    To sample: pick column i uniformly, keep it with probability prob[i], else take alias[i].
+    """
+    n = len(weights)
+    total = float(sum(weights))
+    scaled = [w * n / total for w in weights]
+    prob = [1.0] * n
+    alias = list(range(n))
+    small = [i for i, p in enumerate(scaled) if p < 1.0]
+    large = [i for i, p in enumerate(scaled) if p >= 1.0]
+    while small and large:
+        s, l = small.pop(), large.pop()
+        prob[s] = scaled[s]
+        alias[s] = l
+        scaled[l] -= 1.0 - scaled[s]
+        (small if scaled[l] < 1.0 else large).append(l)
+    # Leftovers are 1.0 up to float rounding
+    return prob, alias
+
+
+class SlotMachine:
+    """A three-reel slot machine: symbols, paytable and one alias table per reel.
+
+    Build once and reuse; spins only draw random numbers and index precomputed tables.
+    """
+
+    def __init__(self, symbols=SLOT_SYMBOLS, reel_weights=None, pair_multiplier=SLOT_PAIR_MULTIPLIER):
+        """`symbols` is a sequence of (emoji, weight, multiplier). `reel_weights` optionally gives
+        a separate weight list per reel (three lists, same order as `symbols`)."""
+        self.symbols = tuple((emoji, weight, mult) for emoji, weight, mult in symbols)
+        self.emojis = tuple(emoji for emoji, _, _ in self.symbols)
+        self.multipliers = {emoji: mult for emoji, _, mult in self.symbols}
+        self.pair_multiplier = pair_multiplier
+        if reel_weights is None:
+            reel_weights = [[weight for _, weight, _ in self.symbols]] * 3
+        if len(reel_weights) != 3 or any(len(w) != len(self.symbols) for w in reel_weights):
+            raise ValueError("reel_weights needs three weight lists matching the symbols")
+        self.reel_weights = tuple(tuple(w) for w in reel_weights)
+        # One (prob, alias) pair per reel
+        self.reels = tuple(build_alias_table(weights) for weights in self.reel_weights)
+        # Alias tables resolved to emojis, so a spin never builds intermediate lists
+        self._emoji_reels = tuple(
+            (prob, tuple(self.emojis[j] for j in alias)) for prob, alias in self.reels
+        )
+        self._n = float(len(self.symbols))
+
+    def spin(self, rng=random) -> tuple:
+        """Spin all three reels and return the symbols shown."""
+        n = self._n
+        emojis = self.emojis
+        rand = rng.random
+        (p0, a0), (p1, a1), (p2, a2) = self._emoji_reels
+        u = rand() * n
+        i = int(u)
+        r0 = emojis[i] if u - i < p0[i] else a0[i]
+        u = rand() * n
+        i = int(u)
+        r1 = emojis[i] if u - i < p1[i] else a1[i]
+        u = rand() * n
+        i = int(u)
+        r2 = emojis[i] if u - i < p2[i] else a2[i]
+        return r0, r1, r2
+
+    def spin_indices(self, count: int, rng=random):
+        """Yield `count` spins as tuples of symbol indices (for simulations and benchmarks)."""
+        n = self._n
+        rand = rng.random
+        (p0, a0), (p1, a1), (p2, a2) = self.reels
+        for _ in range(count):
+            u = rand() * n
+            i = int(u)
+            r0 = i if u - i < p0[i] else a0[i]
+            u = rand() * n
+            i = int(u)
+            r1 = i if u - i < p1[i] else a1[i]
+            u = rand() * n
+            i = int(u)
+            r2 = i if u - i < p2[i] else a2[i]
+            yield r0, r1, r2
+
+    def payout(self, bet: int, reels) -> tuple:
+        """Return (payout, multiplier) for a spin."""
+        a, b, c = reels
+        if a == b == c:
+            # All three match - big win
+            multiplier = self.multipliers[a]
+            return bet * multiplier, multiplier
+        if a == b or b == c or a == c:
+            # Two match - small win (1.5x total return = 0.5x profit)
+            return int(bet * self.pair_multiplier), self.pair_multiplier
+        return 0, 0
+
+    def paytable(self) -> str:
+        """Paytable text for embeds."""
+        lines = ["**Paytable:**"]
+        lines += [f"{emoji} x3 = {mult}x" for emoji, _, mult in self.symbols]
+        lines.append(f"Any 2 match = {self.pair_multiplier}x")
+        return "\n".join(lines)
+
+
+# The default machine used when a guild has no custom reel set
+CLASSIC_SLOTS = SlotMachine()
+
+
+def slot_machine_from_config(config: dict) -> SlotMachine:
+    """Build a machine from a guild's `slots` settings entry.
+
+    Expected shape: {"symbols": [[emoji, weight, multiplier], ...],
+                     "reel_weights": [[...], [...], [...]] (optional),
+                     "pair_multiplier": 1.5 (optional)}
+    """
+    return SlotMachine(
+        symbols=config.get("symbols", SLOT_SYMBOLS),
+        reel_weights=config.get("reel_weights"),
+        pair_multiplier=config.get("pair_multiplier", SLOT_PAIR_MULTIPLIER),
+    )
+
+
+# ==================== BLACKJACK ====================
+
+def blackjack_natural_payout(bet: int, player: Hand, dealer: Hand):
+    """Settle naturals on the initial deal. Returns the payout, or None if play continues."""
+    if not player.is_blackjack:
+        return None
+    if dealer.is_blackjack:
+        return bet  # Push
+    return int(bet * 2.5)  # Blackjack pays 3:2
+
+
+def blackjack_payout(bet: int, player: Hand, dealer: Hand) -> int:
+    """Settle a finished hand (after the dealer has played)."""
+    if player.is_bust:
+        return 0
+    if dealer.is_bust or player.total > dealer.total:
+        return bet * 2
+    if player.total < dealer.total:
+        return 0
+    return bet  # Push
@@ -1,69 +1,216 @@
 """Casino cog — blackjack, roulette, and slots games where users can bet credits."""
 
-import random
+import asyncio
+import json
+import os
+import sys
+import time
 
 import discord
 from discord.ext import commands
 from discord import app_commands
 
+import dedup
+from cards import Hand, Shoe, dealer_play
+from casino_rules import (
+    CLASSIC_SLOTS,
+    blackjack_natural_payout,
+    blackjack_payout,
+    is_valid_roulette_bet,
+    roulette_color,
+    roulette_payout,
+    slot_machine_from_config,
+    spin_roulette,
+)
+from metrics import BLACKJACK_SESSION_BYTES, BLACKJACK_SESSIONS
+
+SETTINGS_FILE = "data/settings.json"
+
+# Open blackjack hands expire (and are refunded) after this many seconds without a Hit/Stand
+BLACKJACK_TTL = 120
+# How often the sweeper looks for expired hands (seconds)
+SWEEP_INTERVAL = 30
+
+
+def load_slot_machines():
+    """Build per-guild slot machines from the optional `slots` entry in settings.json."""
+    machines = {}
+    if not os.path.exists(SETTINGS_FILE):
+        return machines
+    try:
+        with open(SETTINGS_FILE, "r") as f:
+            settings = json.load(f)
+        for gid, config in settings.items():
+            if isinstance(config, dict) and config.get("slots"):
+                machines[int(gid)] = slot_machine_from_config(config["slots"])
+    except Exception as e:
+        print(f"[casino] Failed to load slot reel sets, using defaults: {e}")
+    return machines
+
+
+class BlackjackSession:
+    """Compact state for one open blackjack hand."""
+
+    __slots__ = ("player_hand", "dealer_hand", "bet", "channel_id", "message_id", "expires_at")
+
+    def __init__(self, player_hand: Hand, dealer_hand: Hand, bet: int, channel_id: int):
+        self.player_hand = player_hand
+        self.dealer_hand = dealer_hand
+        self.bet = bet
+        self.channel_id = channel_id
+        self.message_id = None
+        self.touch()
+
+    def touch(self):
+        """Push the expiry back after player activity."""
+        self.expires_at = time.monotonic() + BLACKJACK_TTL
+
+
+class BlackjackSessions:
+    """Open blackjack hands keyed by user id, with TTL expiry and size gauges."""
+
+    def __init__(self):
+        self._sessions = {}
+
+    def __contains__(self, user_id: int) -> bool:
+        return user_id in self._sessions
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def get(self, user_id: int):
+        return self._sessions.get(user_id)
+
+    def open(self, user_id: int, session: BlackjackSession):
+        self._sessions[user_id] = session
+
+    def close(self, user_id: int, message_id: int = None):
+        """Remove and return a user's session (None if already closed).
+
+        With `message_id`, only the session shown on that message is closed, so a view left
+        over from an earlier hand can't close the user's current one.
+        """
+        session = self._sessions.get(user_id)
+        if session is None or (message_id is not None and session.message_id != message_id):
+            return None
+        return self._sessions.pop(user_id)
+
+    def close_all(self) -> list:
+        """Remove and return (user_id, session) for every open hand."""
+        sessions = list(self._sessions.items())
+        self._sessions.clear()
+        return sessions
+
+    def pop_expired(self, now: float = None) -> list:
+        """Remove and return (user_id, session) for every hand past its TTL."""
+        now = time.monotonic() if now is None else now
+        expired = [uid for uid, session in self._sessions.items() if session.expires_at <= now]
+        return [(uid, self._sessions.pop(uid)) for uid in expired]
+
+    def bytes_held(self) -> int:
+        """Approximate memory held by open hands."""
+        total = sys.getsizeof(self._sessions)
+        for session in self._sessions.values():
+            total += sys.getsizeof(session)
+            for hand in (session.player_hand, session.dealer_hand):
+                total += sys.getsizeof(hand) + sys.getsizeof(hand.cards)
+        return total
+
 
 class Casino(commands.Cog):
     """Casino games for betting credits: blackjack, roulette, and slots."""
 
     def __init__(self, bot):
         self.bot = bot
-        # active_games: user_id -> game state dict
-        self.active_games = {}
-
-    def _create_deck(self):
-        """Create a standard 52-card deck."""
-        suits = ['♠️', '♥️', '♦️', '♣️']
-        ranks = ['2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K', 'A']
-        deck = [{'rank': rank, 'suit': suit} for suit in suits for rank in ranks]
-        random.shuffle(deck)
-        return deck
-
-    def _card_value(self, card):
-        """Return numeric value of a card for blackjack."""
-        rank = card['rank']
-        if rank in ['J', 'Q', 'K']:
-            return 10
-        elif rank == 'A':
-            return 11  # Aces are 11 by default, adjusted later if needed
-        else:
-            return int(rank)
+        # active_games: user_id -> BlackjackSession, swept when hands go stale
+        self.active_games = BlackjackSessions()
+        self._sweeper = None
+        # shoes: channel_id -> Shoe, kept between hands until the cut card comes out
+        self.shoes = {}
+        # slot_machines: guild_id -> SlotMachine for guilds with a custom reel set
+        self.slot_machines = load_slot_machines()
+
+    async def cog_load(self):
+        self._sweeper = self.bot.loop.create_task(self._sweep_loop())
+        BLACKJACK_SESSIONS.set_function(lambda: len(self.active_games))
+        BLACKJACK_SESSION_BYTES.set_function(self.active_games.bytes_held)
+
+    async def cog_unload(self):
+        if self._sweeper and not self._sweeper.done():
+            self._sweeper.cancel()
+
+    def gauges(self) -> dict:
+        """Current blackjack session gauges."""
+        return {
+            "blackjack_sessions": len(self.active_games),
+            "blackjack_session_bytes": self.active_games.bytes_held(),
+        }
 
-    def _calculate_hand_value(self, hand):
-        """Calculate the total value of a hand, adjusting for aces."""
-        value = sum(self._card_value(card) for card in hand)
-        aces = sum(1 for card in hand if card['rank'] == 'A')
-        
-        # Adjust for aces if bust
-        while value > 21 and aces > 0:
-            value -= 10
-            aces -= 1
-        
-        return value
+    async def _sweep_loop(self):
+        """Refund and close blackjack hands nobody has touched within the TTL."""
+        try:
+            while True:
+                await asyncio.sleep(SWEEP_INTERVAL)
+                for user_id, game in self.active_games.pop_expired():
+                    await self._expire_hand(user_id, game)
+        except asyncio.CancelledError:
+            return
 
-    def _format_hand(self, hand, hide_first=False):
-        """Format a hand for display."""
-        if hide_first:
-            cards = ['🂠'] + [f"{card['rank']}{card['suit']}" for card in hand[1:]]
-        else:
-            cards = [f"{card['rank']}{card['suit']}" for card in hand]
-        return ' '.join(cards)
+    async def expire_hand(self, user_id: int, message_id: int):
+        """Close the user's hand shown on `message_id` (if still open) and refund the bet."""
+        game = self.active_games.close(user_id, message_id)
+        if game:
+            await self._expire_hand(user_id, game)
+
+    async def _expire_hand(self, user_id: int, game: BlackjackSession):
+        econ_cog = self.bot.get_cog('Economy')
+        if econ_cog:
+            try:
+                econ_cog.release_bet(user_id, game.bet)
+            except Exception as e:
+                print(f"[blackjack] Failed to refund expired bet: {e}")
+        await self._end_hand_message(game, f"⌛ This hand expired. Your bet of 🪙 {game.bet} credits was refunded.")
+
+    def cancel_all_hands(self):
+        """Close every open hand without paying out (used when the economy is reset).
+
+        The hands are closed immediately; their messages are updated in the background.
+        """
+        games = [game for _, game in self.active_games.close_all()]
+        if games:
+            self.bot.loop.create_task(self._cancel_messages(games))
+
+    async def _cancel_messages(self, games: list):
+        for game in games:
+            await self._end_hand_message(game, "🚫 This hand was cancelled by an economy reset.")
+
+    async def _end_hand_message(self, game: BlackjackSession, content: str):
+        """Replace a closed hand's buttons with a note."""
+        channel = self.bot.get_channel(game.channel_id)
+        if channel and game.message_id:
+            try:
+                await channel.get_partial_message(game.message_id).edit(content=content, view=None)
+            except Exception:
+                pass
+
+    def _shoe(self, channel_id: int) -> Shoe:
+        """Return the shoe for a channel's table, creating it on first use."""
+        shoe = self.shoes.get(channel_id)
+        if shoe is None:
+            shoe = self.shoes[channel_id] = Shoe()
+        return shoe
 
     def _get_game_embed(self, game, user, final=False):
         """Create an embed showing the current game state."""
         embed = discord.Embed(title="🎰 Blackjack", color=discord.Color.gold())
         
-        dealer_hand = self._format_hand(game['dealer_hand'], hide_first=not final)
-        player_hand = self._format_hand(game['player_hand'])
+        dealer_hand = game.dealer_hand.format(hide_first=not final)
+        player_hand = game.player_hand.format()
         
-        player_value = self._calculate_hand_value(game['player_hand'])
+        player_value = game.player_hand.total
         
         embed.add_field(
-            name="Dealer's Hand" + (f" ({self._calculate_hand_value(game['dealer_hand'])})" if final else ""),
+            name="Dealer's Hand" + (f" ({game.dealer_hand.total})" if final else ""),
             value=dealer_hand,
             inline=False
         )
@@ -72,13 +219,15 @@ class Casino(commands.Cog):
             value=player_hand,
             inline=False
         )
-        embed.add_field(name="Bet", value=f"🪙 {game['bet']} credits", inline=True)
+        embed.add_field(name="Bet", value=f"🪙 {game.bet} credits", inline=True)
         
         return embed
 
     @app_commands.command(name="blackjack", description="Play blackjack and bet your credits")
     async def blackjack(self, interaction: discord.Interaction, bet: int):
         """Start a game of blackjack with a specified bet amount."""
+        if not dedup.first_delivery(interaction, "blackjack"):
+            return
         await interaction.response.defer()
 
         user_id = interaction.user.id
@@ -93,66 +242,50 @@ class Casino(commands.Cog):
             await interaction.followup.send("Bet must be greater than 0.", ephemeral=True)
             return
 
-        # Check if user has enough credits
+        # Check if user has enough credits before dealing, so a refused bet doesn't use up cards
         econ_cog = self.bot.get_cog('Economy')
         if not econ_cog:
             await interaction.followup.send("Economy system not available.", ephemeral=True)
             return
-
-        econ_cog._ensure_user(user_id)
-        user_balance = econ_cog.economy[str(user_id)]['balance']
-
+        user_balance = econ_cog.economy.get(str(user_id), {}).get('balance', 0)
         if user_balance < bet:
             await interaction.followup.send(f"You don't have enough credits! Your balance: 🪙 {user_balance}", ephemeral=True)
             return
 
-        # Deduct bet from balance
-        if not econ_cog._remove_balance(user_id, bet):
-            await interaction.followup.send("Failed to place bet.", ephemeral=True)
-            return
+        # Initialize game from the channel's shoe
+        shoe = self._shoe(interaction.channel_id)
+        shoe.start_hand()
+        player_hand = Hand((shoe.draw(), shoe.draw()))
+        dealer_hand = Hand((shoe.draw(), shoe.draw()))
 
-        # Initialize game
-        deck = self._create_deck()
-        player_hand = [deck.pop(), deck.pop()]
-        dealer_hand = [deck.pop(), deck.pop()]
-
-        game = {
-            'deck': deck,
-            'player_hand': player_hand,
-            'dealer_hand': dealer_hand,
-            'bet': bet,
-            'channel_id': interaction.channel_id
-        }
+        game = BlackjackSession(player_hand, dealer_hand, bet, interaction.channel_id)
 
-        self.active_games[user_id] = game
+        # A natural settles right away; otherwise the bet is held until the hand finishes
+        payout = blackjack_natural_payout(bet, player_hand, dealer_hand)
+        if econ_cog.settle_bet(user_id, bet, payout or 0, hold=payout is None) is None:
+            user_balance = econ_cog.economy[str(user_id)]['balance']
+            await interaction.followup.send(f"You don't have enough credits! Your balance: 🪙 {user_balance}", ephemeral=True)
+            return
 
         # Check for natural blackjack
-        player_value = self._calculate_hand_value(player_hand)
-        dealer_value = self._calculate_hand_value(dealer_hand)
-
-        if player_value == 21:
-            # Player has blackjack
-            if dealer_value == 21:
-                # Push
-                econ_cog._add_balance(user_id, bet)
-                embed = self._get_game_embed(game, interaction.user, final=True)
+        if payout is not None:
+            embed = self._get_game_embed(game, interaction.user, final=True)
+            if payout == bet:
                 embed.add_field(name="Result", value="🤝 Push! Both have blackjack. Bet returned.", inline=False)
             else:
                 # Player wins with blackjack (pays 3:2)
-                winnings = int(bet * 2.5)
-                econ_cog._add_balance(user_id, winnings)
-                embed = self._get_game_embed(game, interaction.user, final=True)
-                embed.add_field(name="Result", value=f"🎉 Blackjack! You win 🪙 {winnings - bet} credits!", inline=False)
-            
-            del self.active_games[user_id]
+                embed.add_field(name="Result", value=f"🎉 Blackjack! You win 🪙 {payout - bet} credits!", inline=False)
             await interaction.followup.send(embed=embed)
             return
 
+        self.active_games.open(user_id, game)
+
         # Regular game - show initial state with buttons
         embed = self._get_game_embed(game, interaction.user)
         
         view = BlackjackView(self, interaction.user)
-        await interaction.followup.send(embed=embed, view=view)
+        message = await interaction.followup.send(embed=embed, view=view)
+        game.message_id = view.message_id = message.id
 
     async def hit(self, interaction: discord.Interaction):
         """Player draws another card."""
@@ -164,23 +297,25 @@ class Casino(commands.Cog):
             return
 
         # Draw a card
-        game['player_hand'].append(game['deck'].pop())
-        player_value = self._calculate_hand_value(game['player_hand'])
+        game.touch()
+        player_value = game.player_hand.add(self._shoe(game.channel_id).draw())
 
         if player_value > 21:
             # Bust
+            self.active_games.close(user_id)
+            econ_cog = self.bot.get_cog('Economy')
+            if econ_cog:
+                econ_cog.release_bet(user_id, 0)
             embed = self._get_game_embed(game, interaction.user, final=True)
-            embed.add_field(name="Result", value=f"💥 Bust! You lose 🪙 {game['bet']} credits.", inline=False)
-            del self.active_games[user_id]
+            embed.add_field(name="Result", value=f"💥 Bust! You lose 🪙 {game.bet} credits.", inline=False)
             await interaction.response.edit_message(embed=embed, view=None)
         elif player_value == 21:
             # Auto-stand on 21
             await self.stand(interaction)
         else:
-            # Continue game
+            # Continue game - the message keeps its view, whose timeout restarts on each press
             embed = self._get_game_embed(game, interaction.user)
-            view = BlackjackView(self, interaction.user)
-            await interaction.response.edit_message(embed=embed, view=view)
+            await interaction.response.edit_message(embed=embed)
 
     async def stand(self, interaction: discord.Interaction):
         """Player stands - dealer plays and game resolves."""
@@ -191,35 +326,31 @@ class Casino(commands.Cog):
             await interaction.response.send_message("No active game found.", ephemeral=True)
             return
 
-        # Dealer plays - must hit on 16 or less, stand on 17 or more
-        while self._calculate_hand_value(game['dealer_hand']) < 17:
-            game['dealer_hand'].append(game['deck'].pop())
+        self.active_games.close(user_id)
 
-        player_value = self._calculate_hand_value(game['player_hand'])
-        dealer_value = self._calculate_hand_value(game['dealer_hand'])
+        # Dealer plays - must hit on 16 or less, stand on 17 or more
+        dealer_value = dealer_play(game.dealer_hand, self._shoe(game.channel_id))
+        player_value = game.player_hand.total
 
         econ_cog = self.bot.get_cog('Economy')
         embed = self._get_game_embed(game, interaction.user, final=True)
 
+        payout = blackjack_payout(game.bet, game.player_hand, game.dealer_hand)
+        econ_cog.release_bet(user_id, payout)
+
         if dealer_value > 21:
             # Dealer bust - player wins
-            winnings = game['bet'] * 2
-            econ_cog._add_balance(user_id, winnings)
-            embed.add_field(name="Result", value=f"🎉 Dealer busts! You win 🪙 {game['bet']} credits!", inline=False)
+            embed.add_field(name="Result", value=f"🎉 Dealer busts! You win 🪙 {game.bet} credits!", inline=False)
         elif player_value > dealer_value:
             # Player wins
-            winnings = game['bet'] * 2
-            econ_cog._add_balance(user_id, winnings)
-            embed.add_field(name="Result", value=f"🎉 You win 🪙 {game['bet']} credits!", inline=False)
+            embed.add_field(name="Result", value=f"🎉 You win 🪙 {game.bet} credits!", inline=False)
         elif player_value < dealer_value:
             # Dealer wins
-            embed.add_field(name="Result", value=f"😢 Dealer wins. You lose 🪙 {game['bet']} credits.", inline=False)
+            embed.add_field(name="Result", value=f"😢 Dealer wins. You lose 🪙 {game.bet} credits.", inline=False)
         else:
             # Push
-            econ_cog._add_balance(user_id, game['bet'])
             embed.add_field(name="Result", value="🤝 Push! Bet returned.", inline=False)
 
-        del self.active_games[user_id]
         await interaction.response.edit_message(embed=embed, view=None)
 
     @app_commands.command(name="roulette", description="Bet on roulette - red, black, odd, even, or a number")
@@ -229,6 +360,8 @@ class Casino(commands.Cog):
     )
     async def roulette(self, interaction: discord.Interaction, bet: int, bet_type: str):
         """Play roulette with various betting options."""
+        if not dedup.first_delivery(interaction, "roulette"):
+            return
         await interaction.response.defer()
 
         user_id = interaction.user.id
@@ -238,85 +371,35 @@ class Casino(commands.Cog):
             await interaction.followup.send("Bet must be greater than 0.", ephemeral=True)
             return
 
+        # Validate number is within roulette range
+        if not is_valid_roulette_bet(bet_type):
+            await interaction.followup.send("Invalid number! Must be 0-36.", ephemeral=True)
+            return
+
         # Check if user has enough credits
         econ_cog = self.bot.get_cog('Economy')
         if not econ_cog:
             await interaction.followup.send("Economy system not available.", ephemeral=True)
             return
 
-        econ_cog._ensure_user(user_id)
-        user_balance = econ_cog.economy[str(user_id)]['balance']
-
-        if user_balance < bet:
+        # Spin the wheel
+        result = spin_roulette()
+        color, color_emoji = roulette_color(result)
+
+        # Check if user won, then take the bet and pay out in one update
+        payout = roulette_payout(bet, bet_type, result)
+        won = payout > 0
+        if econ_cog.settle_bet(user_id, bet, payout) is None:
+            user_balance = econ_cog.economy[str(user_id)]['balance']
             await interaction.followup.send(f"You don't have enough credits! Your balance: 🪙 {user_balance}", ephemeral=True)
             return
 
-        # Deduct bet from balance
-        if not econ_cog._remove_balance(user_id, bet):
-            await interaction.followup.send("Failed to place bet.", ephemeral=True)
-            return
-
-        # Roulette wheel - 0-36
-        # Red: 1,3,5,7,9,12,14,16,18,19,21,23,25,27,30,32,34,36
-        # Black: 2,4,6,8,10,11,13,15,17,20,22,24,26,28,29,31,33,35
-        # Green: 0
-        red_numbers = {1,3,5,7,9,12,14,16,18,19,21,23,25,27,30,32,34,36}
-        black_numbers = {2,4,6,8,10,11,13,15,17,20,22,24,26,28,29,31,33,35}
-
-        # Spin the wheel
-        result = random.randint(0, 36)
-        
-        # Determine color
-        if result == 0:
-            color = "🟢 Green"
-            color_emoji = "🟢"
-        elif result in red_numbers:
-            color = "🔴 Red"
-            color_emoji = "🔴"
-        else:
-            color = "⚫ Black"
-            color_emoji = "⚫"
-
-        # Check if user won
-        bet_type_lower = bet_type.lower()
-        won = False
-        payout = 0
-
-        if bet_type_lower == "red" and result in red_numbers:
-            won = True
-            payout = bet * 2  # 1:1 payout
-        elif bet_type_lower == "black" and result in black_numbers:
-            won = True
-            payout = bet * 2  # 1:1 payout
-        elif bet_type_lower == "odd" and result > 0 and result % 2 == 1:
-            won = True
-            payout = bet * 2  # 1:1 payout
-        elif bet_type_lower == "even" and result > 0 and result % 2 == 0:
-            won = True
-            payout = bet * 2  # 1:1 payout
-        elif bet_type_lower.isdigit():
-            # Betting on a specific number
-            bet_number = int(bet_type_lower)
-            # Validate number is within roulette range
-            if bet_number < 0 or bet_number > 36:
-                # Invalid number - refund bet
-                econ_cog._add_balance(user_id, bet)
-                await interaction.followup.send(
-                    "Invalid number! Must be 0-36. Bet refunded.",
-                    ephemeral=True,
-                )
-                return
-            if bet_number == result:
-                won = True
-                payout = bet * 36  # 35:1 payout
-
         # Create result embed
         embed = discord.Embed(title="🎡 Roulette", color=discord.Color.gold())
         embed.add_field(name="Your Bet", value=f"{bet_type} for 🪙 {bet} credits", inline=False)
         embed.add_field(name="Result", value=f"{color_emoji} **{result}** {color}", inline=False)
 
         if won:
-            econ_cog._add_balance(user_id, payout)
             profit = payout - bet
             embed.add_field(name="Outcome", value=f"🎉 You win 🪙 {profit} credits!", inline=False)
             embed.color = discord.Color.green()
@@ -329,6 +412,8 @@ class Casino(commands.Cog):
     @app_commands.command(name="slots", description="Play the slot machine")
     async def slots(self, interaction: discord.Interaction, bet: int):
         """Play the slot machine - match 3 symbols to win."""
+        if not dedup.first_delivery(interaction, "slots"):
+            return
         await interaction.response.defer()
 
         user_id = interaction.user.id
@@ -344,63 +429,24 @@ class Casino(commands.Cog):
             await interaction.followup.send("Economy system not available.", ephemeral=True)
             return
 
-        econ_cog._ensure_user(user_id)
-        user_balance = econ_cog.economy[str(user_id)]['balance']
-
-        if user_balance < bet:
+        # Spin the slots
+        machine = self.slot_machines.get(interaction.guild_id, CLASSIC_SLOTS)
+        reels = machine.spin()
+
+        # Check for wins, then take the bet and pay out in one update
+        payout, multiplier = machine.payout(bet, reels)
+        won = payout > 0
+        if econ_cog.settle_bet(user_id, bet, payout) is None:
+            user_balance = econ_cog.economy[str(user_id)]['balance']
             await interaction.followup.send(f"You don't have enough credits! Your balance: 🪙 {user_balance}", ephemeral=True)
             return
 
-        # Deduct bet from balance
-        if not econ_cog._remove_balance(user_id, bet):
-            await interaction.followup.send("Failed to place bet.", ephemeral=True)
-            return
-
-        # Slot symbols with weighted probabilities
-        # Symbol: (emoji, weight, multiplier)
-        symbols = [
-            ('🍒', 35, 2),   # Cherry - common, 2x
-            ('🍋', 30, 3),   # Lemon - common, 3x
-            ('🍊', 20, 5),   # Orange - uncommon, 5x
-            ('🍇', 10, 10),  # Grape - rare, 10x
-            ('💎', 4, 25),   # Diamond - very rare, 25x
-            ('7️⃣', 1, 100)  # Seven - jackpot, 100x
-        ]
-
-        # Create weighted list for random selection
-        weighted_symbols = []
-        for emoji, weight, _ in symbols:
-            weighted_symbols.extend([emoji] * weight)
-
-        # Spin the slots
-        reels = [random.choice(weighted_symbols) for _ in range(3)]
-
-        # Check for wins
-        won = False
-        payout = 0
-        multiplier = 0
-
-        if reels[0] == reels[1] == reels[2]:
-            # All three match - big win
-            won = True
-            for emoji, _, mult in symbols:
-                if emoji == reels[0]:
-                    multiplier = mult
-                    break
-            payout = bet * multiplier
-        elif reels[0] == reels[1] or reels[1] == reels[2] or reels[0] == reels[2]:
-            # Two match - small win (1.5x total return = 0.5x profit)
-            won = True
-            multiplier = 1.5
-            payout = int(bet * multiplier)
-
         # Create result embed
         embed = discord.Embed(title="🎰 Slot Machine", color=discord.Color.gold())
         embed.add_field(name="Your Bet", value=f"🪙 {bet} credits", inline=False)
         embed.add_field(name="Result", value=f"**{reels[0]} | {reels[1]} | {reels[2]}**", inline=False)
 
         if won:
-            econ_cog._add_balance(user_id, payout)
             profit = payout - bet
             if reels[0] == reels[1] == reels[2]:
                 embed.add_field(name="Outcome", value=f"🎉 **JACKPOT!** Three {reels[0]}! You win 🪙 {profit} credits! (x{multiplier})", inline=False)
@@ -413,11 +459,7 @@ class Casino(commands.Cog):
             embed.color = discord.Color.red()
 
         # Add paytable info
-        paytable = "**Paytable:**\n"
-        for emoji, _, mult in symbols:
-            paytable += f"{emoji} x3 = {mult}x\n"
-        paytable += "Any 2 match = 1.5x"
-        embed.add_field(name="Payouts", value=paytable, inline=False)
+        embed.add_field(name="Payouts", value=machine.paytable(), inline=False)
 
         await interaction.followup.send(embed=embed)
 
@@ -426,9 +468,11 @@ class BlackjackView(discord.ui.View):
     """View with Hit and Stand buttons for blackjack."""
 
     def __init__(self, casino_cog, user):
-        super().__init__(timeout=120)  # 2 minute timeout
+        super().__init__(timeout=BLACKJACK_TTL)
         self.casino_cog = casino_cog
         self.user = user
+        # The message showing this hand, set once it's sent
+        self.message_id = None
 
     async def interaction_check(self, interaction: discord.Interaction) -> bool:
         """Only allow the game owner to use buttons."""
@@ -439,25 +483,27 @@ class BlackjackView(discord.ui.View):
 
     @discord.ui.button(label="Hit", style=discord.ButtonStyle.primary, emoji="🎴")
     async def hit_button(self, interaction: discord.Interaction, button: discord.ui.Button):
+        if not dedup.first_delivery(interaction, "hit"):
+            return
         await self.casino_cog.hit(interaction)
+        self._stop_if_finished()
 
     @discord.ui.button(label="Stand", style=discord.ButtonStyle.secondary, emoji="✋")
     async def stand_button(self, interaction: discord.Interaction, button: discord.ui.Button):
+        if not dedup.first_delivery(interaction, "stand"):
+            return
         await self.casino_cog.stand(interaction)
+        self._stop_if_finished()
 
-    async def on_timeout(self):
-        """Handle timeout - auto-stand."""
+    def _stop_if_finished(self):
+        """Stop listening (and cancel the timeout) once this view's hand is over."""
         game = self.casino_cog.active_games.get(self.user.id)
-        if game:
-            # Clean up abandoned game - return bet
-            econ_cog = self.casino_cog.bot.get_cog('Economy')
-            if econ_cog:
-                try:
-                    econ_cog._add_balance(self.user.id, game['bet'])
-                except Exception as e:
-                    print(f"[blackjack] Failed to refund bet on timeout: {e}")
-            if self.user.id in self.casino_cog.active_games:
-                del self.casino_cog.active_games[self.user.id]
+        if game is None or game.message_id != self.message_id:
+            self.stop()
+
+    async def on_timeout(self):
+        """Handle timeout - close the abandoned hand and return the bet."""
+        await self.casino_cog.expire_hand(self.user.id, self.message_id)
 
 
 async def setup(bot):
@@ -3,10 +3,19 @@
 import discord
 from discord.ext import commands
 from discord import app_commands
+import asyncio
 import json
 import os
 import time
 
+import bulk
+import dedup
+import history
+import rewards
+from daily import DailyClaims
+from metrics import ECONOMY_WRITES, PERSIST_SECONDS
+from paginator import LeaderboardView
+from ranking import RankingIndex
 from utils import is_admin
 
 ECONOMY_FILE = "data/economy.json"
@@ -20,26 +29,34 @@ DAILY_REWARD = 100
 def load_economy():
     """Load economy data from JSON."""
     if not os.path.exists(ECONOMY_FILE):
-        return {"users": {}, "daily_cooldowns": {}}
+        return {"users": {}}
     with open(ECONOMY_FILE, "r") as f:
         data = json.load(f)
         # Migrate old format to new format
         if "users" not in data:
-            data = {"users": data, "daily_cooldowns": {}}
+            data = {"users": data}
         return data
 
 
 def save_economy(data):
-    """Save economy data to JSON."""
-    with open(ECONOMY_FILE, "w") as f:
+    """Save economy data to JSON.
+
+    Writes to a temp file and swaps it in, so a crash mid-write can't leave a truncated file.
+    """
+    start = time.perf_counter()
+    tmp_file = ECONOMY_FILE + ".tmp"
+    with open(tmp_file, "w") as f:
         json.dump(data, f, indent=4)
+    os.replace(tmp_file, ECONOMY_FILE)
+    ECONOMY_WRITES.inc()
+    PERSIST_SECONDS.observe(time.perf_counter() - start, file="economy")
 
 
-def save_economy_with_cooldowns(economy_data, cooldowns):
-    """Save economy data and cooldowns together."""
+def save_economy_with_escrow(economy_data, escrow=None):
+    """Save economy data and held casino bets together."""
     data = {
         "users": economy_data,
-        "daily_cooldowns": {str(k): v for k, v in cooldowns.items()}
+        "escrow": {str(k): v for k, v in (escrow or {}).items()}
     }
     save_economy(data)
 
@@ -51,13 +68,74 @@ class Economy(commands.Cog):
         self.bot = bot
         data = load_economy()
         self.economy = data.get("users", {})
-        self.daily_cooldowns = {int(k): v for k, v in data.get("daily_cooldowns", {}).items()}  # user_id: timestamp
+        # Who has claimed /daily today (and yesterday), kept in its own append-only log
+        self.daily_claims = DailyClaims()
+        self.escrow = {}  # user_id: credits held for an unfinished casino round
+        # Per-guild balance order and rendered /rich pages, updated as balances change
+        self.balance_index = RankingIndex(bot, "balance", self.economy, "balance")
+        # Weekly rewards and scheduled payouts, run by one loop (see rewards.py)
+        self.schedule = rewards.Schedule()
+        self._schedule_task = None
+
+        # Bets still held from before a restart belong to hands that can no longer finish - refund them
+        held = {int(k): v for k, v in data.get("escrow", {}).items() if v}
+        if held:
+            for user_id, amount in held.items():
+                self._ensure_user(user_id)
+                self.economy[str(user_id)]["balance"] += amount
+            self._save()
+            print(f"[economy] Refunded {len(held)} casino bet(s) left open by a restart")
+
+        # Daily cooldowns used to live in economy.json - move them to the claim log once
+        legacy = data.get("daily_cooldowns")
+        if legacy:
+            self.daily_claims.migrate(legacy)
+            self._save()
+            print(f"[economy] Moved {len(legacy)} daily cooldown(s) to {self.daily_claims.path}")
+
+    async def cog_load(self):
+        self._schedule_task = self.bot.loop.create_task(self._run_schedule())
+
+    async def cog_unload(self):
+        if self._schedule_task and not self._schedule_task.done():
+            self._schedule_task.cancel()
+
+    def _save(self):
+        """Persist balances and held bets."""
+        save_economy_with_escrow(self.economy, self.escrow)
 
     def _ensure_user(self, user_id: int):
         """Ensure a user exists in the economy system."""
         uid = str(user_id)
         if uid not in self.economy:
             self.economy[uid] = {"balance": 0, "total_earned": 0}
+            self.balance_index.changed(user_id)
+
+    def _balance_changed(self, user_id: int, delta: int):
+        """Re-rank the user and record the change for /rank_history (both in memory)."""
+        self.balance_index.changed(user_id)
+        history.record(user_id, "balance", delta)
+
+    def _credit(self, user_id: int, amount: int) -> int:
+        """Change a balance in memory without re-ranking or saving (batch paths).
+
+        Negative amounts never take a balance below zero. Returns the change applied.
+        """
+        account = self.economy.setdefault(str(user_id), {"balance": 0, "total_earned": 0})
+        delta = max(amount, -account["balance"])
+        account["balance"] += delta
+        account["total_earned"] += max(0, delta)
+        history.record(user_id, "balance", delta)
+        return delta
+
+    def credit_batch(self, awards: dict) -> int:
+        """Credit {user_id: amount} with one index rebuild and one save. Returns the total paid."""
+        if not awards:
+            return 0
+        total = sum(self._credit(user_id, amount) for user_id, amount in awards.items())
+        self.balance_index.reset()
+        self._save()
+        return total
 
     def _add_balance(self, user_id: int, amount: int):
         """Add currency to a user's balance."""
@@ -65,7 +143,8 @@ class Economy(commands.Cog):
         self._ensure_user(user_id)
         self.economy[uid]["balance"] += amount
         self.economy[uid]["total_earned"] += max(0, amount)
-        save_economy_with_cooldowns(self.economy, self.daily_cooldowns)
+        self._balance_changed(user_id, amount)
+        self._save()
 
     def _remove_balance(self, user_id: int, amount: int) -> bool:
         """Remove currency from a user's balance. Returns True if successful."""
@@ -74,9 +153,44 @@ class Economy(commands.Cog):
         if self.economy[uid]["balance"] < amount:
             return False
         self.economy[uid]["balance"] -= amount
-        save_economy_with_cooldowns(self.economy, self.daily_cooldowns)
+        self._balance_changed(user_id, -amount)
+        self._save()
         return True
 
+    def settle_bet(self, user_id: int, bet: int, payout: int = 0, hold: bool = False):
+        """Take `bet` and pay `payout` for a casino round as one balance update and one save.
+
+        Returns the new balance, or None (and changes nothing) if the user can't cover the bet.
+        The check and the update run without awaiting, so concurrent rounds from the same user
+        can't both pass the balance check.
+
+        With `hold=True` the bet is kept in escrow until `release_bet` is called, for rounds
+        that finish later (blackjack). Escrowed bets are refunded if the bot restarts first.
+        """
+        uid = str(user_id)
+        self._ensure_user(user_id)
+        account = self.economy[uid]
+        if account["balance"] < bet:
+            return None
+        account["balance"] += payout - bet
+        account["total_earned"] += max(0, payout)
+        if hold:
+            self.escrow[user_id] = self.escrow.get(user_id, 0) + bet
+        self._balance_changed(user_id, payout - bet)
+        self._save()
+        return account["balance"]
+
+    def release_bet(self, user_id: int, payout: int = 0):
+        """Finish a held round: clear the user's escrow and pay `payout` in one save."""
+        self.escrow.pop(user_id, None)
+        self._ensure_user(user_id)
+        account = self.economy[str(user_id)]
+        account["balance"] += payout
+        account["total_earned"] += max(0, payout)
+        self._balance_changed(user_id, payout)
+        self._save()
+        return account["balance"]
+
     @app_commands.command(name="balance", description="Check your wallet balance")
     async def balance(self, interaction: discord.Interaction, member: discord.Member = None):
         """View your or another user's current balance."""
@@ -93,39 +207,62 @@ class Economy(commands.Cog):
         )
         embed.add_field(name="Balance", value=f"{CURRENCY_NAME} {balance}", inline=True)
         embed.add_field(name="Total Earned", value=f"{CURRENCY_NAME} {total_earned}", inline=True)
+        if interaction.guild:
+            # Binary search in the guild's ranking index - no sort per call
+            standing = self.balance_index.for_guild(interaction.guild).standing(member.id)
+            if standing:
+                position, top = standing
+                embed.add_field(name="Server Rank", value=f"#{position:,} (top {top:.1f}%)", inline=True)
         embed.set_thumbnail(url=member.avatar.url if member.avatar else None)
 
         await interaction.response.send_message(embed=embed)
 
     @app_commands.command(name="daily", description="Claim your daily bonus")
     async def daily(self, interaction: discord.Interaction):
-        """Claim a daily bonus (once per 24 hours)."""
+        """Claim a daily bonus (once per UTC day)."""
+        if not dedup.first_delivery(interaction, "daily"):
+            return
         uid = interaction.user.id
-        now = time.time()
 
-        last_claim = self.daily_cooldowns.get(uid, 0)
-        if now - last_claim < 86400:  # 24 hours in seconds
-            hours_left = (86400 - (now - last_claim)) / 3600
+        # One appended line in the claim log; the balance change is the only full save
+        if not self.daily_claims.claim(uid):
+            hours_left = self.daily_claims.seconds_until_reset() / 3600
             await interaction.response.send_message(
                 f"You've already claimed today! Come back in {hours_left:.1f} hours.",
                 ephemeral=True
             )
             return
 
-        self._add_balance(interaction.user.id, DAILY_REWARD)
-        self.daily_cooldowns[uid] = now
-        save_economy_with_cooldowns(self.economy, self.daily_cooldowns)
-
+        # Streak and weekly counts live on the account, so they're saved with the balance
+        self._ensure_user(uid)
+        account = self.economy[str(uid)]
+        streak = account.get("streak", 0) + 1 if self.daily_claims.claimed(uid, days_ago=1) else 1
+        week = rewards.week_of(time.time())
+        account["week_claims"] = account.get("week_claims", 0) + 1 if account.get("week") == week else 1
+        account["week"] = week
+        account["streak"] = streak
+        bonus = rewards.streak_bonus(streak)
+        self._add_balance(uid, DAILY_REWARD + bonus)
+
+        description = f"You received {CURRENCY_NAME} {DAILY_REWARD + bonus}"
+        if bonus:
+            description += f" (including a {streak}-day streak bonus of {bonus})"
         embed = discord.Embed(
             title="Daily Bonus Claimed!",
             color=discord.Color.green(),
-            description=f"You received {CURRENCY_NAME} {DAILY_REWARD}"
+            description=description
+        )
+        embed.set_footer(
+            text=f"This week: {account['week_claims']}/{rewards.WEEKLY_MIN_CLAIMS} claims for the "
+                 f"{rewards.WEEKLY_REWARD} weekly reward"
         )
         await interaction.response.send_message(embed=embed)
 
     @app_commands.command(name="pay", description="Send currency to another user")
     async def pay(self, interaction: discord.Interaction, member: discord.Member, amount: int):
         """Transfer currency to another user."""
+        if not dedup.first_delivery(interaction, "pay"):
+            return
         if member.bot:
             await interaction.response.send_message("Cannot send currency to bots.", ephemeral=True)
             return
@@ -163,48 +300,40 @@ class Economy(commands.Cog):
         except discord.Forbidden:
             pass
 
+    @commands.Cog.listener()
+    async def on_member_join(self, member: discord.Member):
+        self.balance_index.member_joined(member.guild.id, member.id)
+
+    @commands.Cog.listener()
+    async def on_member_remove(self, member: discord.Member):
+        self.balance_index.member_left(member.guild.id, member.id)
+
     @app_commands.command(name="rich", description="Show the wealthiest users")
-    async def rich(self, interaction: discord.Interaction):
-        """Display the richest members by balance."""
+    async def rich(self, interaction: discord.Interaction, page: int = 1):
+        """Display the richest members by balance, 10 per page with page buttons."""
         self._ensure_user(interaction.user.id)
 
-        sorted_users = sorted(
-            self.economy.items(),
-            key=lambda x: x[1]["balance"],
-            reverse=True
-        )
-
         guild = interaction.guild
         if not guild:
             await interaction.response.send_message("This command must be used in a server (guild).", ephemeral=True)
             return
 
-        guild_users = [(uid, data) for uid, data in sorted_users if guild.get_member(int(uid))]
-
-        if not guild_users:
+        if not len(self.balance_index.for_guild(guild)):
             await interaction.response.send_message("No economy data for members on this server.")
             return
 
-        embed = discord.Embed(
-            title="💰 Richest Members",
-            color=discord.Color.gold()
+        # Pages come from the guild's ranking index, cached until someone on them moves
+        view = LeaderboardView(
+            self.balance_index, guild, interaction.user.id, "💰 Richest Members", discord.Color.gold(),
+            lambda balance: f"{CURRENCY_NAME} {balance}", page
         )
-
-        for i, (user_id, data) in enumerate(guild_users[:10], start=1):
-            user = guild.get_member(int(user_id))
-            name = user.display_name if user else f"Unknown ({user_id})"
-            balance = data["balance"]
-            embed.add_field(
-                name=f"#{i} — {name}",
-                value=f"{CURRENCY_NAME} {balance}",
-                inline=False
-            )
-
-        await interaction.response.send_message(embed=embed)
+        await view.send(interaction)
 
     @app_commands.command(name="give_currency", description="Give currency to a user (admin only)")
     async def give_currency(self, interaction: discord.Interaction, member: discord.Member, amount: int):
         """Admin command to grant currency."""
+        if not dedup.first_delivery(interaction, "give_currency"):
+            return
         if not is_admin(interaction.user.id):
             await interaction.response.send_message(
                 "Missing permissions (admin only).",
@@ -221,9 +350,150 @@ class Economy(commands.Cog):
             f"Gave {CURRENCY_NAME} {amount} to {member.mention}"
         )
 
+    @app_commands.command(name="currency_bulk", description="Give or take currency for a role, a list of users or a CSV file (admin only)")
+    @app_commands.describe(
+        amount="Credits per user, negative to take (CSV rows may give their own)",
+        role="Everyone with this role",
+        users="Mentions or user ids",
+        file="CSV with user_id[,amount] per line",
+        dry_run="Preview the changes without applying them"
+    )
+    async def currency_bulk(self, interaction: discord.Interaction, amount: int, role: discord.Role = None,
+                            users: str = None, file: discord.Attachment = None, dry_run: bool = False):
+        """Apply many balance changes in memory, then save once."""
+        if not dedup.first_delivery(interaction, "currency_bulk"):
+            return
+        if not is_admin(interaction.user.id):
+            await interaction.response.send_message(
+                "Missing permissions (admin only).",
+                ephemeral=True
+            )
+            return
+
+        def finish():
+            # Rebuilding the index once is cheaper than re-ranking every user
+            self.balance_index.reset()
+            self._save()
+
+        def describe(user_id, value):
+            return f"<@{user_id}>: {value:+,} {CURRENCY_NAME}"
+
+        await bulk.run(interaction, "Currency", amount, role, users, file, dry_run, describe, self._credit, finish)
+
+    # ==================== SCHEDULED REWARDS ====================
+
+    async def _run_schedule(self):
+        try:
+            await self.bot.wait_until_ready()
+            await self.schedule.run(self._run_job)
+        except asyncio.CancelledError:
+            return
+
+    async def _run_job(self, job):
+        """Pay out one scheduled reward in a single batch."""
+        if job.kind == "weekly":
+            # Reward the week that just ended
+            week = rewards.week_of(job.due) - 1
+            awards = {
+                int(uid): rewards.WEEKLY_REWARD
+                for uid, account in self.economy.items()
+                if account.get("week") == week and account.get("week_claims", 0) >= rewards.WEEKLY_MIN_CLAIMS
+            }
+            self.credit_batch(awards)
+            print(f"[rewards] Weekly reward paid to {len(awards)} user(s)")
+            return
+
+        guild = self.bot.get_guild(job.guild_id)
+        if guild is None:
+            print(f"[rewards] Skipping payout {job.id}: guild {job.guild_id} not available")
+            return
+        role = guild.get_role(job.role_id) if job.role_id else None
+        members = role.members if role else guild.members
+        awards = {member.id: job.amount for member in members if not member.bot}
+        self.credit_batch(awards)
+        print(f"[rewards] Payout {job.id}: {job.amount} to {len(awards)} member(s) of {guild.name}")
+
+        channel = self.bot.get_channel(job.channel_id) if job.channel_id else None
+        if channel is not None and awards:
+            target = role.mention if role else "everyone"
+            try:
+                await channel.send(
+                    f"💸 Scheduled payout: {target} received {CURRENCY_NAME} {job.amount} "
+                    f"({len(awards):,} members)",
+                    allowed_mentions=discord.AllowedMentions.none()
+                )
+            except discord.HTTPException as e:
+                print(f"[rewards] Failed to announce payout {job.id}: {e}")
+
+    @app_commands.command(name="schedule_payout", description="Schedule a server-wide payout (admin only)")
+    @app_commands.describe(
+        amount="Credits per member",
+        in_hours="Hours from now until the first payout (0 = now)",
+        every_hours="Repeat every this many hours (0 = once)",
+        role="Only pay members with this role"
+    )
+    async def schedule_payout(self, interaction: discord.Interaction, amount: int, in_hours: float = 0.0,
+                              every_hours: float = 0.0, role: discord.Role = None):
+        if not dedup.first_delivery(interaction, "schedule_payout"):
+            return
+        if not is_admin(interaction.user.id):
+            await interaction.response.send_message("Missing permissions (admin only).", ephemeral=True)
+            return
+        if not interaction.guild:
+            await interaction.response.send_message("This command must be used in a server (guild).", ephemeral=True)
+            return
+        if amount <= 0 or in_hours < 0 or every_hours < 0 or 0 < every_hours < 1:
+            await interaction.response.send_message(
+                "Amount must be positive, times can't be negative, and repeats must be at least an hour apart.",
+                ephemeral=True
+            )
+            return
+
+        job = self.schedule.add(
+            "payout", time.time() + in_hours * 3600, every=every_hours * 3600, amount=amount,
+            guild_id=interaction.guild.id, role_id=role.id if role else None, channel_id=interaction.channel_id
+        )
+        repeat = f", then every {every_hours:g}h" if every_hours else ""
+        await interaction.response.send_message(
+            f"🗓️ Payout #{job.id}: {CURRENCY_NAME} {amount} to {role.mention if role else 'every member'} "
+            f"<t:{int(job.due)}:R>{repeat}.",
+            ephemeral=True
+        )
+
+    @app_commands.command(name="scheduled_payouts", description="List scheduled rewards (admin only)")
+    async def scheduled_payouts(self, interaction: discord.Interaction):
+        if not is_admin(interaction.user.id):
+            await interaction.response.send_message("Missing permissions (admin only).", ephemeral=True)
+            return
+
+        lines = []
+        for job in sorted(self.schedule.jobs.values(), key=lambda job: job.due):
+            if job.kind == "weekly":
+                lines.append(f"**Weekly reward** - next <t:{int(job.due)}:R>")
+            elif job.guild_id == interaction.guild_id:
+                target = f"<@&{job.role_id}>" if job.role_id else "every member"
+                repeat = f", every {job.every / 3600:g}h" if job.every else ""
+                lines.append(f"**#{job.id}** - {job.amount} to {target} <t:{int(job.due)}:R>{repeat}")
+        await interaction.response.send_message("\n".join(lines) or "Nothing scheduled.", ephemeral=True)
+
+    @app_commands.command(name="cancel_payout", description="Cancel a scheduled payout (admin only)")
+    async def cancel_payout(self, interaction: discord.Interaction, payout_id: int):
+        if not dedup.first_delivery(interaction, "cancel_payout"):
+            return
+        if not is_admin(interaction.user.id):
+            await interaction.response.send_message("Missing permissions (admin only).", ephemeral=True)
+            return
+        job = self.schedule.jobs.get(payout_id)
+        if job is None or job.guild_id != interaction.guild_id or not self.schedule.cancel(payout_id):
+            await interaction.response.send_message(f"No payout #{payout_id} on this server.", ephemeral=True)
+            return
+        await interaction.response.send_message(f"Cancelled payout #{payout_id}.", ephemeral=True)
+
     @app_commands.command(name="reset_economy", description="Reset all economy data (admin only)")
     async def reset_economy(self, interaction: discord.Interaction, confirm: bool = False):
         """Reset all currency balances (requires confirmation)."""
+        if not dedup.first_delivery(interaction, "reset_economy"):
+            return
         if not is_admin(interaction.user.id):
             await interaction.response.send_message(
                 "Missing permissions (admin only).",
@@ -238,9 +508,15 @@ class Economy(commands.Cog):
             )
             return
 
+        # Close open blackjack hands first, so none pays out of the wiped escrow later
+        casino_cog = self.bot.get_cog('Casino')
+        if casino_cog:
+            casino_cog.cancel_all_hands()
         self.economy = {}
-        self.daily_cooldowns = {}
-        save_economy_with_cooldowns(self.economy, self.daily_cooldowns)
+        self.daily_claims.reset()
+        self.escrow = {}
+        self.balance_index.reset(self.economy)
+        self._save()
         await interaction.response.send_message("✅ Economy data reset.")
 
 
@@ -1,6 +1,5 @@
 """Interactive games cog — Pong, Snake, and Conway's Game of Life."""
 
-import asyncio
 import random
 from typing import Optional
 
@@ -8,13 +7,21 @@ import discord
 from discord.ext import commands
 from discord import app_commands
 
+from metrics import GAME_SESSIONS
+from sessions import GameSession, SessionManager
+
 
 class Games(commands.Cog):
     """Interactive games like Pong, Snake, and Conway's Game of Life."""
 
     def __init__(self, bot):
         self.bot = bot
-        self.active_games = {}  # user_id -> game state
+        # All running games, keyed by message id and advanced by one shared loop
+        self.sessions = SessionManager(bot)
+        GAME_SESSIONS.set_function(lambda: len(self.sessions))
+
+    def cog_unload(self):
+        self.sessions.stop()
 
     # ==================== PONG ====================
     
@@ -101,20 +108,14 @@ class Games(commands.Cog):
 
     @app_commands.command(name="pong", description="Play a game of Pong")
     async def pong(self, interaction: discord.Interaction):
-        """Start an interactive Pong game."""
-        user_id = interaction.user.id
-        
-        if user_id in self.active_games:
-            await interaction.response.send_message("You already have an active game! Finish it first.", ephemeral=True)
-            return
-        
+        """Start an interactive Pong game. A second player can join to take the right paddle."""
         game = self.PongGame()
-        self.active_games[user_id] = ("pong", game)
-        
+        session = GameSession("pong", game, interaction.user.id, max_players=2, interval=0.5)
+
         # Create view with buttons
-        view = PongView(self, user_id, game)
+        view = PongView(self, session)
         await interaction.response.send_message(game.render(), view=view)
-        view.message = await interaction.original_response()
+        await self.sessions.add(session, await interaction.original_response())
 
     # ==================== SNAKE ====================
     
@@ -196,18 +197,12 @@ class Games(commands.Cog):
     @app_commands.command(name="snake", description="Play Snake game")
     async def snake(self, interaction: discord.Interaction):
         """Start an interactive Snake game."""
-        user_id = interaction.user.id
-        
-        if user_id in self.active_games:
-            await interaction.response.send_message("You already have an active game! Finish it first.", ephemeral=True)
-            return
-        
         game = self.SnakeGame()
-        self.active_games[user_id] = ("snake", game)
-        
-        view = SnakeView(self, user_id, game)
+        session = GameSession("snake", game, interaction.user.id, interval=0.8)
+
+        view = SnakeView(self, session)
         await interaction.response.send_message(game.render(), view=view)
-        view.message = await interaction.original_response()
+        await self.sessions.add(session, await interaction.original_response())
 
     # ==================== CONWAY'S GAME OF LIFE ====================
     
@@ -261,6 +256,10 @@ class Games(commands.Cog):
             
             self.grid = new_grid
             self.generation += 1
+
+        def update(self):
+            """Advance one generation (called by the session loop during auto-play)."""
+            self.step()
         
         def clear(self):
             """Clear the grid."""
@@ -281,228 +280,163 @@ class Games(commands.Cog):
 
     @app_commands.command(name="gameoflife", description="Conway's Game of Life simulator")
     async def gameoflife(self, interaction: discord.Interaction):
-        """Start Conway's Game of Life simulator."""
-        user_id = interaction.user.id
-        
-        if user_id in self.active_games:
-            await interaction.response.send_message("You already have an active game! Finish it first.", ephemeral=True)
-            return
-        
+        """Start Conway's Game of Life simulator. Other users can join to share the board."""
         game = self.GameOfLife()
         game.randomize()
-        self.active_games[user_id] = ("gameoflife", game)
-        
-        view = GameOfLifeView(self, user_id, game)
+        session = GameSession("gameoflife", game, interaction.user.id, max_players=10)
+
+        view = GameOfLifeView(self, session)
         await interaction.response.send_message(game.render(), view=view)
-        view.message = await interaction.original_response()
+        await self.sessions.add(session, await interaction.original_response())
 
 
 # ==================== VIEWS (BUTTON CONTROLS) ====================
 
-class PongView(discord.ui.View):
-    def __init__(self, cog, user_id, game):
-        super().__init__(timeout=180)
+class SessionView(discord.ui.View):
+    """Base view for game sessions: only players may press buttons, and presses keep the session alive."""
+
+    def __init__(self, cog, session):
+        # Idle sessions are ended by the SessionManager, so the view itself never times out
+        super().__init__(timeout=None)
         self.cog = cog
-        self.user_id = user_id
-        self.game = game
-        self.message = None
-        self.auto_play_task = None
-        self.start_auto_play()
-    
-    def start_auto_play(self):
-        """Start automatic game updates."""
-        self.auto_play_task = asyncio.create_task(self.auto_play_loop())
-    
-    async def auto_play_loop(self):
-        """Auto-update game every 0.5 seconds."""
-        try:
-            while self.game.running:
-                await asyncio.sleep(0.5)
-                self.game.update()
-                if self.message:
-                    try:
-                        await self.message.edit(content=self.game.render(), view=self)
-                    except:
-                        break
-        except asyncio.CancelledError:
-            pass
-    
-    @discord.ui.button(label="↑ Left", style=discord.ButtonStyle.primary, row=0)
-    async def left_up(self, interaction: discord.Interaction, button: discord.ui.Button):
-        if interaction.user.id != self.user_id:
+        self.session = session
+        self.game = session.game
+        session.view = self
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        if not self.session.is_player(interaction.user.id):
             await interaction.response.send_message("This isn't your game!", ephemeral=True)
+            return False
+        self.cog.sessions.touch(self.session)
+        return True
+
+    async def join(self, interaction: discord.Interaction):
+        """Add the pressing user to the session."""
+        if not self.session.add_player(interaction.user.id):
+            await interaction.response.send_message("This game is full or you've already joined.", ephemeral=True)
+            return
+        self.cog.sessions.touch(self.session)
+        await interaction.response.send_message(f"{interaction.user.mention} joined the game!")
+
+    async def quit_session(self, interaction: discord.Interaction, suffix: str):
+        """End the session (host only)."""
+        if interaction.user.id != self.session.owner_id:
+            await interaction.response.send_message("Only the host can end this game.", ephemeral=True)
             return
-        self.game.move_paddle(True, -1)
+        self.cog.sessions.remove(self.session)
+        await interaction.response.edit_message(content=f"{self.game.render()}\n{suffix}", view=None)
+
+
+class PongView(SessionView):
+    """Left paddle belongs to the host, right paddle to the second player (or the host when solo)."""
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        # Anyone may press Join; everything else is player-only
+        if interaction.data.get("custom_id") == self.join_button.custom_id:
+            return True
+        return await super().interaction_check(interaction)
+
+    def _controls(self, interaction: discord.Interaction, is_left: bool) -> bool:
+        players = self.session.players
+        if is_left:
+            return interaction.user.id == players[0]
+        return interaction.user.id == players[-1]
+
+    async def _move(self, interaction: discord.Interaction, is_left: bool, direction: int):
+        if not self._controls(interaction, is_left):
+            await interaction.response.send_message("That's not your paddle!", ephemeral=True)
+            return
+        self.game.move_paddle(is_left, direction)
         await interaction.response.defer()
-    
+
+    @discord.ui.button(label="↑ Left", style=discord.ButtonStyle.primary, row=0)
+    async def left_up(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self._move(interaction, True, -1)
+
     @discord.ui.button(label="↓ Left", style=discord.ButtonStyle.primary, row=0)
     async def left_down(self, interaction: discord.Interaction, button: discord.ui.Button):
-        if interaction.user.id != self.user_id:
-            await interaction.response.send_message("This isn't your game!", ephemeral=True)
-            return
-        self.game.move_paddle(True, 1)
-        await interaction.response.defer()
-    
+        await self._move(interaction, True, 1)
+
     @discord.ui.button(label="↑ Right", style=discord.ButtonStyle.danger, row=0)
     async def right_up(self, interaction: discord.Interaction, button: discord.ui.Button):
-        if interaction.user.id != self.user_id:
-            await interaction.response.send_message("This isn't your game!", ephemeral=True)
-            return
-        self.game.move_paddle(False, -1)
-        await interaction.response.defer()
-    
+        await self._move(interaction, False, -1)
+
     @discord.ui.button(label="↓ Right", style=discord.ButtonStyle.danger, row=0)
     async def right_down(self, interaction: discord.Interaction, button: discord.ui.Button):
-        if interaction.user.id != self.user_id:
-            await interaction.response.send_message("This isn't your game!", ephemeral=True)
-            return
-        self.game.move_paddle(False, 1)
-        await interaction.response.defer()
-    
+        await self._move(interaction, False, 1)
+
+    @discord.ui.button(label="Join", style=discord.ButtonStyle.success, row=1)
+    async def join_button(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self.join(interaction)
+
     @discord.ui.button(label="Quit", style=discord.ButtonStyle.secondary, row=1)
     async def quit(self, interaction: discord.Interaction, button: discord.ui.Button):
-        if interaction.user.id != self.user_id:
-            await interaction.response.send_message("This isn't your game!", ephemeral=True)
-            return
         self.game.running = False
-        if self.auto_play_task:
-            self.auto_play_task.cancel()
-        self.cog.active_games.pop(self.user_id, None)
-        await interaction.response.edit_message(content=f"{self.game.render()}\n**Game Over!**", view=None)
-        self.stop()
+        await self.quit_session(interaction, "**Game Over!**")
 
 
-class SnakeView(discord.ui.View):
-    def __init__(self, cog, user_id, game):
-        super().__init__(timeout=180)
-        self.cog = cog
-        self.user_id = user_id
-        self.game = game
-        self.message = None
-        self.auto_move_task = None
-        self.start_auto_move()
-    
-    def start_auto_move(self):
-        """Start automatic snake movement."""
-        self.auto_move_task = asyncio.create_task(self.auto_move_loop())
-    
-    async def auto_move_loop(self):
-        """Auto-move snake every 0.8 seconds."""
-        try:
-            while not self.game.game_over:
-                await asyncio.sleep(0.8)
-                self.game.update()
-                if self.message:
-                    try:
-                        if self.game.game_over:
-                            await self.message.edit(content=self.game.render(), view=None)
-                            self.cog.active_games.pop(self.user_id, None)
-                            self.stop()
-                        else:
-                            await self.message.edit(content=self.game.render(), view=self)
-                    except:
-                        break
-        except asyncio.CancelledError:
-            pass
-    
+class SnakeView(SessionView):
     @discord.ui.button(emoji="⬆️", style=discord.ButtonStyle.primary, row=0)
     async def up(self, interaction: discord.Interaction, button: discord.ui.Button):
-        if interaction.user.id != self.user_id:
-            await interaction.response.send_message("This isn't your game!", ephemeral=True)
-            return
         self.game.set_direction((0, -1))
         await interaction.response.defer()
-    
+
     @discord.ui.button(emoji="⬇️", style=discord.ButtonStyle.primary, row=1)
     async def down(self, interaction: discord.Interaction, button: discord.ui.Button):
-        if interaction.user.id != self.user_id:
-            await interaction.response.send_message("This isn't your game!", ephemeral=True)
-            return
         self.game.set_direction((0, 1))
         await interaction.response.defer()
-    
+
     @discord.ui.button(emoji="⬅️", style=discord.ButtonStyle.primary, row=1)
     async def left(self, interaction: discord.Interaction, button: discord.ui.Button):
-        if interaction.user.id != self.user_id:
-            await interaction.response.send_message("This isn't your game!", ephemeral=True)
-            return
         self.game.set_direction((-1, 0))
         await interaction.response.defer()
-    
+
     @discord.ui.button(emoji="➡️", style=discord.ButtonStyle.primary, row=1)
     async def right(self, interaction: discord.Interaction, button: discord.ui.Button):
-        if interaction.user.id != self.user_id:
-            await interaction.response.send_message("This isn't your game!", ephemeral=True)
-            return
         self.game.set_direction((1, 0))
         await interaction.response.defer()
-    
+
     @discord.ui.button(label="Quit", style=discord.ButtonStyle.danger, row=2)
     async def quit(self, interaction: discord.Interaction, button: discord.ui.Button):
-        if interaction.user.id != self.user_id:
-            await interaction.response.send_message("This isn't your game!", ephemeral=True)
-            return
-        if self.auto_move_task:
-            self.auto_move_task.cancel()
-        self.cog.active_games.pop(self.user_id, None)
-        await interaction.response.edit_message(content=f"{self.game.render()}\n**Quit!**", view=None)
-        self.stop()
+        await self.quit_session(interaction, "**Quit!**")
 
 
-class GameOfLifeView(discord.ui.View):
-    def __init__(self, cog, user_id, game):
-        super().__init__(timeout=300)
-        self.cog = cog
-        self.user_id = user_id
-        self.game = game
-        self.message = None
-    
+class GameOfLifeView(SessionView):
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        # Anyone may press Join; everything else is player-only
+        if interaction.data.get("custom_id") == self.join_button.custom_id:
+            return True
+        return await super().interaction_check(interaction)
+
     @discord.ui.button(label="Step", style=discord.ButtonStyle.primary, row=0)
     async def step(self, interaction: discord.Interaction, button: discord.ui.Button):
-        if interaction.user.id != self.user_id:
-            await interaction.response.send_message("This isn't your game!", ephemeral=True)
-            return
         self.game.step()
         await interaction.response.edit_message(content=self.game.render(), view=self)
-    
+
     @discord.ui.button(label="Auto (10x)", style=discord.ButtonStyle.success, row=0)
     async def auto_step(self, interaction: discord.Interaction, button: discord.ui.Button):
-        if interaction.user.id != self.user_id:
-            await interaction.response.send_message("This isn't your game!", ephemeral=True)
-            return
+        # The shared session loop runs the 10 steps; no per-game task needed
+        self.session.start_auto(0.3, updates=10)
         await interaction.response.defer()
-        for _ in range(10):
-            self.game.step()
-            await asyncio.sleep(0.3)
-            try:
-                await interaction.edit_original_response(content=self.game.render(), view=self)
-            except:
-                break
-    
+
     @discord.ui.button(label="Randomize", style=discord.ButtonStyle.secondary, row=0)
     async def randomize(self, interaction: discord.Interaction, button: discord.ui.Button):
-        if interaction.user.id != self.user_id:
-            await interaction.response.send_message("This isn't your game!", ephemeral=True)
-            return
         self.game.randomize()
         await interaction.response.edit_message(content=self.game.render(), view=self)
-    
+
     @discord.ui.button(label="Clear", style=discord.ButtonStyle.secondary, row=0)
     async def clear(self, interaction: discord.Interaction, button: discord.ui.Button):
-        if interaction.user.id != self.user_id:
-            await interaction.response.send_message("This isn't your game!", ephemeral=True)
-            return
+        self.session.stop_auto()
         self.game.clear()
         await interaction.response.edit_message(content=self.game.render(), view=self)
-    
+
+    @discord.ui.button(label="Join", style=discord.ButtonStyle.success, row=1)
+    async def join_button(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self.join(interaction)
+
     @discord.ui.button(label="Quit", style=discord.ButtonStyle.danger, row=1)
     async def quit(self, interaction: discord.Interaction, button: discord.ui.Button):
-        if interaction.user.id != self.user_id:
-            await interaction.response.send_message("This isn't your game!", ephemeral=True)
-            return
-        self.cog.active_games.pop(self.user_id, None)
-        await interaction.response.edit_message(content=f"{self.game.render()}\n**Session ended!**", view=None)
-        self.stop()
+        await self.quit_session(interaction, "**Session ended!**")
 
 
 async def setup(bot):
@@ -1,13 +1,44 @@
 import discord
 from discord.ext import commands
 from discord import app_commands
+import asyncio
+import multiprocessing
+import os
 import subprocess
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime, timezone
 
+import export_data
+import history
+from botlog import get_logger, log_event, set_debug, debug_enabled
+from utils import is_admin
+
+log = get_logger("interaction")
+
+EXPORT_DIR = "exports"
+# Exported files larger than this are left on disk instead of attached
+ATTACH_LIMIT = 8 * 1024 * 1024
+
 
 class General(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
+        self.export_pool = None
+
+    async def cog_load(self):
+        # One long-lived worker for /export_data. "spawn" starts a fresh interpreter, so the
+        # worker doesn't inherit the log listener, watchdog or executor threads mid-operation
+        self.export_pool = self._new_export_pool()
+
+    async def cog_unload(self):
+        if self.export_pool is not None:
+            self.export_pool.shutdown(wait=False, cancel_futures=True)
+            self.export_pool = None
+
+    @staticmethod
+    def _new_export_pool():
+        return ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn"))
 
     @app_commands.command(name="ping", description="Check bot latency")
     async def ping(self, interaction: discord.Interaction):
@@ -131,14 +162,67 @@ class General(commands.Cog):
 
     @commands.Cog.listener()
     async def on_interaction(self, interaction: discord.Interaction):
-        """Log interactions for debugging purposes."""
+        """Log interactions (sampled) while debug logging is on."""
+        if not debug_enabled():
+            return
+        name = interaction.data.get("name") if isinstance(interaction.data, dict) else None
+        log_event(log, "interaction", id=interaction.id, user=interaction.user.id, name=name,
+                  type=interaction.type.name)
+
+    @app_commands.command(name="debug_logging", description="Turn debug logging on or off (admin only)")
+    @app_commands.describe(enabled="Whether debug events should be logged")
+    async def debug_logging(self, interaction: discord.Interaction, enabled: bool):
+        """Switch debug logging at runtime without restarting the bot."""
+        if not is_admin(interaction.user.id):
+            await interaction.response.send_message("Missing permissions (admin only).", ephemeral=True)
+            return
+        set_debug(enabled)
+        state = "enabled" if enabled else "disabled"
+        await interaction.response.send_message(f"🪵 Debug logging {state}.", ephemeral=True)
+
+    @app_commands.command(name="export_data", description="Export rank, economy and history data as files (admin only)")
+    @app_commands.describe(table="ranks, economy, history or all", format="csv or parquet")
+    async def export_data(self, interaction: discord.Interaction, table: str = "all", format: str = "csv"):
+        """Stream data files to CSV/Parquet in a worker process and attach the results."""
+        if not is_admin(interaction.user.id):
+            await interaction.response.send_message("Missing permissions (admin only).", ephemeral=True)
+            return
+
+        tables = export_data.TABLES if table == "all" else [table]
+        if any(t not in export_data.TABLES for t in tables) or format not in ("csv", "parquet"):
+            await interaction.response.send_message(
+                f"Table must be one of {', '.join(export_data.TABLES)} or all; format must be csv or parquet.",
+                ephemeral=True
+            )
+            return
+
+        await interaction.response.defer(ephemeral=True)
+        # Write out buffered history so the export is current
+        await history.flush()
+
+        # Parsing and writing run in a separate process so the event loop never waits on them
+        loop = asyncio.get_running_loop()
         try:
-            name = None
-            if hasattr(interaction, "data") and interaction.data:
-                name = interaction.data.get("name") if isinstance(interaction.data, dict) else None
-            print(f"[interaction] id={interaction.id} user={interaction.user} name={name} type={interaction.type}")
+            results = await loop.run_in_executor(self.export_pool, export_data.export, tables, EXPORT_DIR, format)
+        except BrokenProcessPool as e:
+            # The worker died (killed or out of memory); start a new one for next time
+            self.export_pool.shutdown(wait=False)
+            self.export_pool = self._new_export_pool()
+            await interaction.followup.send(f"❌ Export failed: {e}", ephemeral=True)
+            return
         except Exception as e:
-            print(f"[interaction] Logging failed: {e}")
+            await interaction.followup.send(f"❌ Export failed: {e}", ephemeral=True)
+            return
+
+        files, lines = [], []
+        for name, path, rows in results:
+            size = os.path.getsize(path)
+            if size <= ATTACH_LIMIT:
+                files.append(discord.File(path))
+                lines.append(f"✅ **{name}**: {rows:,} rows")
+            else:
+                lines.append(f"✅ **{name}**: {rows:,} rows ({size / 1024 / 1024:.1f} MB, saved to `{path}`)")
+        await interaction.followup.send("\n".join(lines), files=files, ephemeral=True)
 
     @commands.Cog.listener()
     async def on_command_error(self, ctx, error):
@@ -1,14 +1,29 @@
 import discord
 from discord.ext import commands
 from discord import app_commands
+import asyncio
+import io
 import json
 import os
 import time
-import random
 
+from announcer import Announcer
+import bulk
+import history
+from levels import DEFAULT_CURVE, curve_from_config
+from metrics import MESSAGES_TOTAL, PERSIST_SECONDS, XP_AWARDED, XP_AWARDS_TOTAL, XP_SPAM_PENALTIES
+from paginator import LeaderboardView
+import ranking
+from ranking import RankingIndex
+from spam import SpamTracker
 from utils import is_admin
+from voice_xp import VoiceTracker
+from xp_rules import compile_rules
 
 RANK_FILE = "data/ranks.json"
+SETTINGS_FILE = "data/settings.json"
+# How often voice time is credited as XP (seconds)
+VOICE_TICK = 60
 os.makedirs("data", exist_ok=True)
 
 def load_ranks():
@@ -22,8 +37,17 @@ def load_ranks():
         return data
 
 def save_ranks(data):
-    with open(RANK_FILE, "w") as f:
+    """Save rank data to JSON.
+
+    Writes to a temp file and swaps it in, so a crash mid-write can't leave a truncated
+    file and a reader (such as /export_data) keeps the complete old file.
+    """
+    start = time.perf_counter()
+    tmp_file = RANK_FILE + ".tmp"
+    with open(tmp_file, "w") as f:
         json.dump(data, f, indent=4)
+    os.replace(tmp_file, RANK_FILE)
+    PERSIST_SECONDS.observe(time.perf_counter() - start, file="ranks")
 
 
 def save_ranks_with_cooldowns(ranks_data, cooldowns):
@@ -35,8 +59,32 @@ def save_ranks_with_cooldowns(ranks_data, cooldowns):
     save_ranks(data)
 
 def calculate_level(xp: int) -> int:
-    # Level curve: level = sqrt(xp / 50)
-    return int((xp / 50) ** 0.5)
+    # Level curve: level = floor(sqrt(xp / 50)), looked up in an integer threshold table
+    return DEFAULT_CURVE.level(xp)
+
+
+def load_settings():
+    """Read settings.json (per-guild config), or an empty dict."""
+    if not os.path.exists(SETTINGS_FILE):
+        return {}
+    try:
+        with open(SETTINGS_FILE, "r") as f:
+            return json.load(f)
+    except Exception as e:
+        print(f"[rank] Failed to read {SETTINGS_FILE}: {e}")
+        return {}
+
+
+def load_level_curves(settings):
+    """Build per-guild level curves from the optional `level_curve` entry in settings.json."""
+    curves = {}
+    try:
+        for gid, config in settings.items():
+            if isinstance(config, dict) and config.get("level_curve"):
+                curves[int(gid)] = curve_from_config(config["level_curve"])
+    except Exception as e:
+        print(f"[rank] Failed to load level curves, using the default: {e}")
+    return curves
 
 
 class RankSystem(commands.Cog):
@@ -45,28 +93,110 @@ class RankSystem(commands.Cog):
         data = load_ranks()
         self.ranks = data.get("users", {})
         self.cooldowns = {int(k): v for k, v in data.get("xp_cooldowns", {}).items()}  # user_id: timestamp
-
-    async def award_xp(self, user_id: int, amount: int):
-        """Add XP and check for level-up."""
+        # Recent message rates and content per user/channel, for spam-weighted XP
+        self.spam = SpamTracker()
+        # Members in voice channels, credited by one ticker instead of per-user timers
+        self.voice = VoiceTracker()
+        self._voice_task = None
+        # Level-up messages, merged per channel and sent off the message path
+        self.announcer = Announcer(bot)
+        # Per-guild XP order and rendered leaderboard pages, updated as XP changes
+        self.xp_index = RankingIndex(bot, "xp", self.ranks, "xp")
+        self.load_rules()
+
+    async def cog_load(self):
+        self._voice_task = self.bot.loop.create_task(self._voice_loop())
+
+    async def cog_unload(self):
+        if self._voice_task and not self._voice_task.done():
+            self._voice_task.cancel()
+        self.announcer.stop()
+
+    def load_rules(self):
+        """(Re)load level curves and XP rules from settings.json."""
+        settings = load_settings()
+        # level_curves: guild_id -> LevelCurve for guilds with a custom curve
+        self.level_curves = load_level_curves(settings)
+        # xp_rules: compiled per-guild/per-channel message XP rules
+        self.xp_rules = compile_rules(settings)
+        # Rendered pages show levels on the guild curve
+        self.xp_index.cache.clear()
+
+    def announce_level_up(self, channel, mention: str, level: int):
+        """Queue a level-up announcement; bursts in one channel are merged into one message."""
+        self.announcer.announce(channel, f"🎉 **{mention} leveled up to Level {level}!**")
+
+    def curve_for(self, guild_id):
+        """The level curve used to display levels in a guild."""
+        return self.level_curves.get(guild_id, DEFAULT_CURVE)
+
+    async def award_xp(self, user_id: int, amount: int, guild_id: int = None):
+        """Add XP and check for level-up.
+
+        The stored level always follows the default curve; the level-up check (and the
+        returned level) uses the curve of `guild_id` when one is given.
+        """
+        new_level = self._add_xp(user_id, amount, guild_id)
+        save_ranks_with_cooldowns(self.ranks, self.cooldowns)
+        return new_level
+
+    def award_xp_batch(self, awards: dict) -> list:
+        """Add XP for many users with a single save.
+
+        `awards` maps (guild_id, user_id) to an amount. Returns [((guild_id, user_id), new_level)]
+        for everyone who levelled up.
+        """
+        level_ups = []
+        for (guild_id, user_id), amount in awards.items():
+            new_level = self._add_xp(user_id, amount, guild_id)
+            if new_level:
+                level_ups.append(((guild_id, user_id), new_level))
+        if awards:
+            save_ranks_with_cooldowns(self.ranks, self.cooldowns)
+        return level_ups
+
+    def _add_xp(self, user_id: int, amount: int, guild_id: int = None):
+        """Add XP in memory. Returns the new level (on the guild's curve) on level-up, else None."""
         user_id = str(user_id)
 
         if user_id not in self.ranks:
             self.ranks[user_id] = {"xp": 0, "level": 0}
 
         user = self.ranks[user_id]
-        old_level = user["level"]
+        curve = self.curve_for(guild_id)
+        old_level = curve.level(user["xp"])
 
         # Add XP
+        XP_AWARDS_TOTAL.inc()
+        XP_AWARDED.inc(amount)
         user["xp"] += amount
         user["level"] = calculate_level(user["xp"])
-
-        save_ranks_with_cooldowns(self.ranks, self.cooldowns)
+        self.xp_index.changed(int(user_id))
+        history.record(user_id, "xp", amount)
 
         # Level up!
-        if user["level"] > old_level:
-            return user["level"]
+        new_level = curve.level(user["xp"])
+        if new_level > old_level:
+            return new_level
         return None
 
+    def _set_xp(self, user_id: int, xp: int, reindex: bool = True) -> int:
+        """Set a user's XP in memory (admin edits; no level-up message). Returns the XP set.
+
+        Bulk edits pass `reindex=False` and reset the ranking index once at the end.
+        """
+        uid = str(user_id)
+        if uid not in self.ranks:
+            self.ranks[uid] = {"xp": 0, "level": 0}
+        user = self.ranks[uid]
+        xp = max(0, xp)
+        history.record(user_id, "xp", xp - user["xp"])
+        user["xp"] = xp
+        user["level"] = calculate_level(xp)
+        if reindex:
+            self.xp_index.changed(int(user_id))
+        return xp
+
     @commands.Cog.listener()
     async def on_message(self, message: discord.Message):
         """Award XP per message with cooldown to prevent spam abuse."""
@@ -77,24 +207,113 @@ class RankSystem(commands.Cog):
         if not message.guild:
             return
 
+        MESSAGES_TOTAL.inc()
+
+        rule = self.xp_rules.rule_for(message.guild.id, message.channel)
+        if not rule.enabled:
+            return
+
         user_id = message.author.id
         now = time.time()
 
-        # 10-second XP cooldown per user
+        # Every message counts towards the spam score, even inside the cooldown
+        spam_factor = self.spam.record(user_id, message.channel.id, message.content, now)
+
+        # Per-user XP cooldown (10 seconds unless the guild or channel sets its own)
         last = self.cooldowns.get(user_id, 0)
-        if now - last < 10:
+        if now - last < rule.cooldown:
             return
 
         self.cooldowns[user_id] = now
 
-        # XP between 15 and 25 per message
-        xp_gain = random.randint(15, 25)
+        # 15-25 XP per message by default, scaled by multipliers, role boosts and length
+        xp_gain = rule.xp_for(message)
+        if spam_factor < 1.0:
+            # Bursts and repeated messages earn less
+            XP_SPAM_PENALTIES.inc()
+            xp_gain = int(xp_gain * spam_factor)
+        if xp_gain <= 0:
+            return
 
-        new_level = await self.award_xp(user_id, xp_gain)
+        new_level = await self.award_xp(user_id, xp_gain, message.guild.id)
         if new_level:
-            await message.channel.send(
-                f"🎉 **{message.author.mention} leveled up to Level {new_level}!**"
-            )
+            self.announce_level_up(message.channel, message.author.mention, new_level)
+
+    # ==================== VOICE XP ====================
+
+    def _voice_state(self, guild, state, humans: int = None):
+        """Return (eligible, rate) for a member's voice state.
+
+        Only members who can hear and aren't alone earn voice XP, so idling in an empty
+        channel or sitting deafened doesn't count.
+        """
+        channel = state.channel
+        rule = self.xp_rules.rule_for(guild.id, channel)
+        rate = rule.voice_xp * rule.multiplier if rule.enabled else 0
+        if humans is None:
+            humans = sum(1 for m in channel.members if not m.bot)
+        eligible = rate > 0 and humans >= 2 and not (state.self_deaf or state.deaf or state.afk)
+        return eligible, rate
+
+    @commands.Cog.listener()
+    async def on_voice_state_update(self, member: discord.Member, before, after):
+        """Track joins, moves, leaves and deafens. Never saves - the ticker credits XP."""
+        if member.bot:
+            return
+        key = (member.guild.id, member.id)
+        now = time.time()
+        if after.channel is None:
+            self.voice.leave(key, now)
+        else:
+            eligible, rate = self._voice_state(member.guild, after)
+            self.voice.update(key, after.channel.id, now, eligible, rate)
+
+    async def _voice_loop(self):
+        """Credit voice XP for everyone in voice once per VOICE_TICK."""
+        try:
+            await self.bot.wait_until_ready()
+            now = time.time()
+            # Pick up members who were already in voice when the bot started
+            for guild in self.bot.guilds:
+                for channel in list(guild.voice_channels) + list(guild.stage_channels):
+                    for member in channel.members:
+                        if not member.bot and member.voice:
+                            eligible, rate = self._voice_state(guild, member.voice)
+                            self.voice.update((guild.id, member.id), channel.id, now, eligible, rate)
+
+            while True:
+                await asyncio.sleep(VOICE_TICK)
+                try:
+                    await self._credit_voice()
+                except Exception as e:
+                    print(f"[rank] Voice XP tick failed: {e}")
+        except asyncio.CancelledError:
+            return
+
+    async def _credit_voice(self):
+        now = time.time()
+        awards = self.voice.collect(now)
+
+        # Refresh eligibility (others may have joined or left) and rates for the next period
+        humans = {}
+        for (guild_id, user_id), session in self.voice.sessions.items():
+            guild = self.bot.get_guild(guild_id)
+            member = guild.get_member(user_id) if guild else None
+            if member is None or member.voice is None or member.voice.channel is None:
+                session.eligible = False
+                continue
+            channel = member.voice.channel
+            if channel.id not in humans:
+                humans[channel.id] = sum(1 for m in channel.members if not m.bot)
+            session.eligible, session.rate = self._voice_state(guild, member.voice, humans[channel.id])
+
+        if not awards:
+            return
+        level_ups = self.award_xp_batch({key: xp for key, (xp, _) in awards.items()})
+        for (guild_id, user_id), new_level in level_ups:
+            channel = self.bot.get_channel(awards[(guild_id, user_id)][1])
+            if channel is not None:
+                self.announce_level_up(channel, f"<@{user_id}>", new_level)
 
     # Slash Command: /rank
     @app_commands.command(name="rank", description="Check your XP and level")
@@ -108,8 +327,14 @@ class RankSystem(commands.Cog):
             title=f"{member.display_name}'s Rank",
             color=discord.Color.blurple()
         )
-        embed.add_field(name="Level", value=stats["level"])
+        embed.add_field(name="Level", value=self.curve_for(interaction.guild_id).level(stats["xp"]))
         embed.add_field(name="XP", value=stats["xp"])
+        if interaction.guild:
+            # Binary search in the guild's ranking index - no sort per call
+            standing = self.xp_index.for_guild(interaction.guild).standing(member.id)
+            if standing:
+                position, top = standing
+                embed.add_field(name="Server Rank", value=f"#{position:,} (top {top:.1f}%)")
         embed.set_thumbnail(url=member.avatar.url if member.avatar else None)
 
         await interaction.response.send_message(embed=embed)
@@ -120,13 +345,10 @@ class RankSystem(commands.Cog):
             await interaction.response.send_message("Missing permissions (admin only).", ephemeral=True)
             return
 
-        uid = str(member.id)
-        if uid not in self.ranks:
-            self.ranks[uid] = {"xp": 0, "level": 0}
-        self.ranks[uid]["xp"] = max(0, amount)
-        self.ranks[uid]["level"] = calculate_level(self.ranks[uid]["xp"])
+        xp = self._set_xp(member.id, amount)
         save_ranks_with_cooldowns(self.ranks, self.cooldowns)
-        await interaction.response.send_message(f"Set {member.display_name}'s XP to {self.ranks[uid]['xp']} (Level {self.ranks[uid]['level']}).")
+        level = self.curve_for(interaction.guild_id).level(xp)
+        await interaction.response.send_message(f"Set {member.display_name}'s XP to {xp} (Level {level}).")
 
     @app_commands.command(name="xp_add", description="Add XP to a user (admin only)")
     async def xp_add(self, interaction: discord.Interaction, member: discord.Member, amount: int):
@@ -134,14 +356,47 @@ class RankSystem(commands.Cog):
             await interaction.response.send_message("Missing permissions (admin only).", ephemeral=True)
             return
 
-        uid = str(member.id)
-        if uid not in self.ranks:
-            self.ranks[uid] = {"xp": 0, "level": 0}
-        self.ranks[uid]["xp"] = max(0, self.ranks[uid]["xp"] + amount)
-        old_level = self.ranks[uid]["level"]
-        self.ranks[uid]["level"] = calculate_level(self.ranks[uid]["xp"])
+        curve = self.curve_for(interaction.guild_id)
+        old_xp = self.ranks.get(str(member.id), {}).get("xp", 0)
+        old_level = curve.level(old_xp)
+        xp = self._set_xp(member.id, old_xp + amount)
         save_ranks_with_cooldowns(self.ranks, self.cooldowns)
-        await interaction.response.send_message(f"Added {amount} XP to {member.display_name}. Level: {old_level} → {self.ranks[uid]['level']}")
+        await interaction.response.send_message(f"Added {amount} XP to {member.display_name}. Level: {old_level} → {curve.level(xp)}")
+
+    @app_commands.command(name="xp_bulk", description="Add or set XP for a role, a list of users or a CSV file (admin only)")
+    @app_commands.describe(
+        amount="XP per user (CSV rows may give their own)",
+        mode="add or set",
+        role="Everyone with this role",
+        users="Mentions or user ids",
+        file="CSV with user_id[,amount] per line",
+        dry_run="Preview the changes without applying them"
+    )
+    async def xp_bulk(self, interaction: discord.Interaction, amount: int, mode: str = "add",
+                      role: discord.Role = None, users: str = None, file: discord.Attachment = None,
+                      dry_run: bool = False):
+        """Apply many XP changes in memory, then save once."""
+        if not is_admin(interaction.user.id):
+            await interaction.response.send_message("Missing permissions (admin only).", ephemeral=True)
+            return
+        if mode not in ("add", "set"):
+            await interaction.response.send_message("Mode must be add or set.", ephemeral=True)
+            return
+
+        def apply_one(user_id, value):
+            if mode == "add":
+                value += self.ranks.get(str(user_id), {}).get("xp", 0)
+            self._set_xp(user_id, value, reindex=False)
+
+        def finish():
+            # Rebuilding the index once is cheaper than re-ranking every user
+            self.xp_index.reset()
+            save_ranks_with_cooldowns(self.ranks, self.cooldowns)
+
+        def describe(user_id, value):
+            return f"<@{user_id}>: {value:+,} XP" if mode == "add" else f"<@{user_id}>: set to {value:,} XP"
+
+        await bulk.run(interaction, f"XP {mode}", amount, role, users, file, dry_run, describe, apply_one, finish)
 
     @app_commands.command(name="xp_recalc", description="Recalculate levels for all users from XP (admin only)")
     async def xp_recalc(self, interaction: discord.Interaction):
@@ -149,32 +404,63 @@ class RankSystem(commands.Cog):
             await interaction.response.send_message("Missing permissions (admin only).", ephemeral=True)
             return
 
-        for uid, data in self.ranks.items():
-            data["level"] = calculate_level(data.get("xp", 0))
-        save_ranks_with_cooldowns(self.ranks, self.cooldowns)
-        await interaction.response.send_message("Recalculated levels for all users.")
+        # One batched lookup over every user's XP, then a single save
+        start = time.perf_counter()
+        users = list(self.ranks.values())
+        levels = DEFAULT_CURVE.levels([data.get("xp", 0) for data in users])
+        changed = 0
+        for data, level in zip(users, levels):
+            if data.get("level") != level:
+                data["level"] = level
+                changed += 1
+        if changed:
+            save_ranks_with_cooldowns(self.ranks, self.cooldowns)
+        elapsed = (time.perf_counter() - start) * 1000
+        await interaction.response.send_message(
+            f"Recalculated levels for {len(users)} users ({changed} changed) in {elapsed:.0f} ms."
+        )
 
-    # Slash Command: /leaderboard
-    @app_commands.command(name="leaderboard", description="Show the top users by level")
-    async def leaderboard(self, interaction: discord.Interaction, page: int = 1):
-        """Display the server leaderboard (10 users per page)."""
-        sorted_users = sorted(
-            self.ranks.items(),
-            key=lambda x: x[1]["xp"],
-            reverse=True
+    @app_commands.command(name="xp_rules_reload", description="Reload XP rules and level curves from settings (admin only)")
+    async def xp_rules_reload(self, interaction: discord.Interaction):
+        if not is_admin(interaction.user.id):
+            await interaction.response.send_message("Missing permissions (admin only).", ephemeral=True)
+            return
+
+        self.load_rules()
+        rule = self.xp_rules.rule_for(interaction.guild_id, interaction.channel)
+        state = (
+            f"{rule.min_xp}-{rule.max_xp} XP x{rule.multiplier:g}, {rule.cooldown:g}s cooldown"
+            if rule.enabled else "no XP"
+        )
+        await interaction.response.send_message(
+            f"Reloaded XP rules for {len(self.xp_rules.guilds)} guild(s). This channel: {state}.",
+            ephemeral=True
         )
 
-        # Filter to members present in this guild
+    @commands.Cog.listener()
+    async def on_member_join(self, member: discord.Member):
+        self.xp_index.member_joined(member.guild.id, member.id)
+
+    @commands.Cog.listener()
+    async def on_member_remove(self, member: discord.Member):
+        self.xp_index.member_left(member.guild.id, member.id)
+
+    # Slash Command: /leaderboard
+    @app_commands.command(name="leaderboard", description="Show the top users by level")
+    async def leaderboard(self, interaction: discord.Interaction, page: int = 1, image: bool = False):
+        """Display the server leaderboard (10 users per page) with page buttons, or one page as an image."""
         guild = interaction.guild
         if not guild:
             await interaction.response.send_message("This command must be used in a server (guild).", ephemeral=True)
             return
 
-        guild_users = [(uid, data) for uid, data in sorted_users if guild.get_member(int(uid))]
+        if image and ranking.Image is None:
+            await interaction.response.send_message("Image leaderboards need Pillow installed (`pip install Pillow`).", ephemeral=True)
+            return
 
-        # Pagination
-        per_page = 10
-        total_pages = (len(guild_users) + per_page - 1) // per_page
+        # Pages come from the guild's ranking index and are cached until someone on them moves
+        curve = self.curve_for(guild.id)
+        total_pages = (len(self.xp_index.for_guild(guild)) + ranking.PAGE_SIZE - 1) // ranking.PAGE_SIZE
         if total_pages == 0:
             await interaction.response.send_message("No ranked members found on this server.")
             return
@@ -182,26 +468,30 @@ class RankSystem(commands.Cog):
         if page < 1 or page > total_pages:
             page = 1
 
-        start = (page - 1) * per_page
-        end = start + per_page
-
-        embed = discord.Embed(
-            title="🏆 Server Leaderboard",
-            color=discord.Color.gold()
-        )
-
-        for i, (user_id, data) in enumerate(guild_users[start:end], start=start + 1):
-            user = guild.get_member(int(user_id))
-            name = user.display_name if user else f"Unknown ({user_id})"
-
-            embed.add_field(
-                name=f"#{i} — {name}",
-                value=f"Level {data['level']} • {data['xp']} XP",
-                inline=False
+        def format_xp(xp):
+            return f"Level {curve.level(xp)} • {xp} XP"
+
+        if image:
+            png = self.xp_index.image(guild.id, page)
+            if png is None:
+                rows, _ = self.xp_index.rows(guild, page, format_xp)
+                # Drawing takes a few ms - keep it off the event loop
+                await interaction.response.defer()
+                png = await asyncio.to_thread(ranking.render_image, "Server Leaderboard", rows)
+                self.xp_index.put_image(guild.id, page, png)
+                send = interaction.followup.send
+            else:
+                send = interaction.response.send_message
+            await send(
+                content=f"🏆 Page {page} of {total_pages}",
+                file=discord.File(io.BytesIO(png), filename="leaderboard.png")
             )
+            return
 
-        embed.set_footer(text=f"Page {page} of {total_pages}")
-        await interaction.response.send_message(embed=embed)
+        view = LeaderboardView(
+            self.xp_index, guild, interaction.user.id, "🏆 Server Leaderboard", discord.Color.gold(), format_xp, page
+        )
+        await view.send(interaction)
 
     @app_commands.command(name="next_level", description="See how much XP you need for the next level")
     async def next_level(self, interaction: discord.Interaction, member: discord.Member = None):
@@ -211,19 +501,15 @@ class RankSystem(commands.Cog):
         stats = self.ranks.get(user_id, {"xp": 0, "level": 0})
 
         current_xp = stats["xp"]
-        current_level = stats["level"]
-        next_level = current_level + 1
-
-        # XP needed: level = sqrt(xp / 50), so xp = level^2 * 50
-        current_level_xp = int((current_level ** 2) * 50)
-        next_level_xp = int((next_level ** 2) * 50)
-
-        xp_in_level = current_xp - current_level_xp
-        xp_needed = next_level_xp - current_xp
+        curve = self.curve_for(interaction.guild_id)
+        current_level, xp_in_level, total_in_level = curve.progress(current_xp)
+        # A capped curve has no next level once the top is reached
+        at_max = total_in_level == 0
+        next_level = "Max" if at_max else current_level + 1
+        xp_needed = 0 if at_max else curve.xp_for(current_level + 1) - current_xp
 
         # Progress bar
-        total_in_level = next_level_xp - current_level_xp
-        progress = xp_in_level / total_in_level if total_in_level > 0 else 0
+        progress = 1 if at_max else xp_in_level / total_in_level
         bar_length = 20
         filled = int(bar_length * progress)
         bar = "█" * filled + "░" * (bar_length - filled)
@@ -235,11 +521,36 @@ class RankSystem(commands.Cog):
         embed.add_field(name="Current Level", value=current_level, inline=True)
         embed.add_field(name="Next Level", value=next_level, inline=True)
         embed.add_field(name="Progress", value=f"`{bar}` {progress*100:.1f}%", inline=False)
-        embed.add_field(name="XP in Level", value=f"{xp_in_level}/{total_in_level}", inline=True)
+        embed.add_field(name="XP in Level", value="—" if at_max else f"{xp_in_level}/{total_in_level}", inline=True)
         embed.add_field(name="XP Needed", value=f"{xp_needed} more", inline=True)
 
         await interaction.response.send_message(embed=embed)
 
+    @app_commands.command(name="rank_history", description="Show daily XP and credits earned over time")
+    @app_commands.describe(member="Whose history to show", days="How many days back (7-90)")
+    async def rank_history(self, interaction: discord.Interaction, member: discord.Member = None, days: int = 30):
+        """Sparklines of a member's daily XP and balance changes."""
+        member = member or interaction.user
+        days = min(max(days, 7), 90)
+
+        embed = discord.Embed(
+            title=f"{member.display_name}'s Last {days} Days",
+            color=discord.Color.blurple()
+        )
+        for metric, label in (("xp", "XP"), ("balance", "Credits")):
+            values = await history.series(member.id, metric, days)
+            if not any(values):
+                embed.add_field(name=label, value="No activity", inline=False)
+                continue
+            total = sum(values)
+            embed.add_field(
+                name=f"{label} ({total:+,} total, best day {max(values):+,})",
+                value=f"`{history.sparkline(values)}`",
+                inline=False
+            )
+        embed.set_footer(text="Oldest day on the left, today on the right")
+        await interaction.response.send_message(embed=embed)
+
 
 async def setup(bot):
     await bot.add_cog(RankSystem(bot))
@@ -535,12 +535,14 @@ class Trivia(commands.Cog):
             rank_cog = self.bot.get_cog('RankSystem')
             econ_cog = self.bot.get_cog('Economy')
 
-            level_up_msg = None
             if rank_cog:
                 try:
-                    new_level = await rank_cog.award_xp(message.author.id, awarded_xp)
+                    new_level = await rank_cog.award_xp(
+                        message.author.id, awarded_xp, message.guild.id if message.guild else None
+                    )
                     if new_level:
-                        level_up_msg = f" They leveled up to Level {new_level}! 🎉"
+                        # Goes through the rank cog's queue so answer bursts don't spam the channel
+                        rank_cog.announce_level_up(channel, message.author.mention, new_level)
                 except Exception as e:
                     print(f"Error awarding XP: {e}")
 
@@ -0,0 +1,96 @@
+"""Daily claim store — day-bucketed sets of user ids, persisted as an append-only log.
+
+Claiming appends one short `<day> <user_id>` line to `data/daily_claims.log` instead of
+rewriting economy.json. Only today's and yesterday's buckets are kept; when the UTC day
+rolls over, older buckets are dropped and the log is rewritten with what's left (a few
+lines per active user at most).
+"""
+
+import os
+import time
+
+DAILY_FILE = "data/daily_claims.log"
+# Days of claims kept (today and yesterday)
+KEEP_DAYS = 2
+
+
+def day_of(ts: float) -> int:
+    """Days since the epoch (UTC)."""
+    return int(ts // 86400)
+
+
+class DailyClaims:
+    """Who has claimed on each of the last KEEP_DAYS days."""
+
+    def __init__(self, path: str = DAILY_FILE, now: float = None):
+        self.path = path
+        # day -> set of user ids
+        self.days = {}
+        self._today = day_of(now if now is not None else time.time())
+        self._load()
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, "r") as f:
+            for line in f:
+                try:
+                    day, user_id = map(int, line.split())
+                except ValueError:
+                    continue  # partial line from a crash mid-append
+                if day > self._today - KEEP_DAYS:
+                    self.days.setdefault(day, set()).add(user_id)
+
+    def _roll(self, now: float):
+        """Drop buckets older than KEEP_DAYS when the day changes, and compact the log."""
+        today = day_of(now)
+        if today == self._today:
+            return
+        self._today = today
+        for day in [d for d in self.days if d <= today - KEEP_DAYS]:
+            del self.days[day]
+        self._rewrite()
+
+    def _rewrite(self):
+        tmp_file = self.path + ".tmp"
+        with open(tmp_file, "w") as f:
+            for day, users in sorted(self.days.items()):
+                f.writelines(f"{day} {user_id}\n" for user_id in users)
+        os.replace(tmp_file, self.path)
+
+    def claimed(self, user_id: int, now: float = None, days_ago: int = 0) -> bool:
+        """Whether the user claimed today (or `days_ago` days before today)."""
+        now = now if now is not None else time.time()
+        self._roll(now)
+        return user_id in self.days.get(self._today - days_ago, ())
+
+    def claim(self, user_id: int, now: float = None) -> bool:
+        """Record today's claim with one appended line. False if already claimed today."""
+        now = now if now is not None else time.time()
+        self._roll(now)
+        claimed = self.days.setdefault(self._today, set())
+        if user_id in claimed:
+            return False
+        claimed.add(user_id)
+        with open(self.path, "a") as f:
+            f.write(f"{self._today} {user_id}\n")
+        return True
+
+    def seconds_until_reset(self, now: float = None) -> float:
+        now = now if now is not None else time.time()
+        return (day_of(now) + 1) * 86400 - now
+
+    def migrate(self, cooldowns: dict, now: float = None):
+        """Import old {user_id: last_claim_timestamp} cooldowns from economy.json."""
+        now = now if now is not None else time.time()
+        self._roll(now)
+        for user_id, ts in cooldowns.items():
+            day = day_of(ts)
+            if day > self._today - KEEP_DAYS:
+                self.days.setdefault(day, set()).add(int(user_id))
+        self._rewrite()
+
+    def reset(self):
+        """Forget every claim (economy reset)."""
+        self.days.clear()
+        self._rewrite()
@@ -0,0 +1,63 @@
+"""Interaction dedup — remembers recently handled interaction ids.
+
+An interaction delivered twice (a gateway resume replaying events, or a reconnect while
+a slow command is still running) carries the same id both times. Commands that move
+credits check `first_delivery()` before doing anything, so a repeat becomes a no-op
+instead of a second bet, payment or full economy save.
+
+Ids live in an LRU map with a TTL and a hard size cap, so memory stays bounded.
+"""
+
+import time
+from collections import OrderedDict
+
+from metrics import DUPLICATE_INTERACTIONS
+
+# Interaction tokens are valid for 15 minutes; nothing can be redelivered after that
+DEDUP_TTL = 15 * 60
+# Ids remembered before the oldest are dropped
+MAX_TRACKED = 20_000
+
+
+class InteractionDedup:
+    """Bounded LRU of interaction ids handled in the last DEDUP_TTL seconds."""
+
+    def __init__(self, ttl: float = DEDUP_TTL, max_tracked: int = MAX_TRACKED):
+        self.ttl = ttl
+        self.max_tracked = max_tracked
+        # interaction id -> time first seen, oldest first
+        self._seen = OrderedDict()
+
+    def __len__(self):
+        return len(self._seen)
+
+    def _expire(self, now: float):
+        cutoff = now - self.ttl
+        while self._seen:
+            oldest, seen_at = next(iter(self._seen.items()))
+            if seen_at > cutoff:
+                break
+            del self._seen[oldest]
+
+    def seen(self, interaction_id: int, now: float = None) -> bool:
+        """Record the id. True if it was already handled within the TTL."""
+        now = now if now is not None else time.monotonic()
+        self._expire(now)
+        if interaction_id in self._seen:
+            return True
+        self._seen[interaction_id] = now
+        if len(self._seen) > self.max_tracked:
+            self._seen.popitem(last=False)
+        return False
+
+
+_interactions = InteractionDedup()
+
+
+def first_delivery(interaction, command: str) -> bool:
+    """False (and counted) if this interaction was already handled - the caller should return."""
+    if _interactions.seen(interaction.id):
+        DUPLICATE_INTERACTIONS.inc(command=command)
+        print(f"[dedup] Ignored repeated interaction {interaction.id} ({command})")
+        return False
+    return True
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Data export.
+Streams rank, economy and history data to CSV (or Parquet) files in chunks, without
+loading a whole data file into memory: the JSON files are decoded one user at a time
+and history is read from SQLite with a cursor.
+
+Usage:
+    python3 export_data.py                          # every table to ./exports as CSV
+    python3 export_data.py ranks economy --out /tmp/dump
+    python3 export_data.py history --format parquet
+
+Parquet needs pyarrow; CSV uses only the standard library. The bot's `/export_data`
+admin command runs the same `export()` in a worker process.
+"""
+
+import argparse
+import csv
+import json
+import os
+import sqlite3
+import sys
+import time
+from datetime import date, timedelta
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow is optional - only needed for --format parquet
+    pa = None
+
+RANK_FILE = "data/ranks.json"
+ECONOMY_FILE = "data/economy.json"
+HISTORY_FILE = "data/history.db"
+
+TABLES = ["ranks", "economy", "history"]
+# Rows buffered per write
+CHUNK_ROWS = 50_000
+# Bytes read from a JSON file at a time
+READ_SIZE = 1 << 16
+
+_EPOCH = date(1970, 1, 1)
+_decoder = json.JSONDecoder()
+
+
+def iter_json_users(path: str, key: str = "users"):
+    """Yield (user_id, entry) pairs from the `key` object of a data file, one at a time.
+
+    Handles both the current {"users": {...}, ...} layout (with "users" first, as the bot
+    writes it) and the old flat layout.
+    """
+    if not os.path.exists(path):
+        return
+    with open(path, "r") as f:
+        buf = f.read(READ_SIZE)
+        pos = 0
+
+        def fill():
+            # Drop what's been parsed and read more; False at end of file
+            nonlocal buf, pos
+            more = f.read(READ_SIZE)
+            buf = buf[pos:] + more
+            pos = 0
+            return bool(more)
+
+        def skip_ws():
+            nonlocal pos
+            while True:
+                while pos < len(buf) and buf[pos] in " \t\r\n,:":
+                    pos += 1
+                if pos < len(buf) or not fill():
+                    return
+
+        def decode():
+            nonlocal pos
+            while True:
+                try:
+                    value, end = _decoder.raw_decode(buf, pos)
+                    # A number at the end of the buffer may continue in the next read
+                    if end < len(buf) or not fill():
+                        pos = end
+                        return value
+                except json.JSONDecodeError:
+                    if not fill():
+                        raise
+
+        skip_ws()
+        if buf[pos:pos + 1] != "{":
+            raise ValueError(f"{path} is not a JSON object")
+        pos += 1
+        # Find the users object; in the old layout the top level is the users object
+        skip_ws()
+        if pos >= len(buf):
+            raise ValueError(f"{path} ends before its closing '}}'")
+        if buf[pos:pos + 1] == "}":
+            return
+        first = decode()
+        skip_ws()
+        if first != key:
+            value = decode()
+            yield first, value
+        else:
+            pos += 1  # the users object's "{"
+        while True:
+            skip_ws()
+            if pos >= len(buf):
+                raise ValueError(f"{path} ends before its closing '}}'")
+            if buf[pos] == "}":
+                return
+            user_id = decode()
+            skip_ws()
+            entry = decode()
+            yield user_id, entry
+
+
+def iter_ranks(data_dir: str = "."):
+    for uid, entry in iter_json_users(os.path.join(data_dir, RANK_FILE)):
+        yield int(uid), entry.get("xp", 0), entry.get("level", 0)
+
+
+def iter_economy(data_dir: str = "."):
+    for uid, entry in iter_json_users(os.path.join(data_dir, ECONOMY_FILE)):
+        yield int(uid), entry.get("balance", 0), entry.get("total_earned", 0)
+
+
+def iter_history(data_dir: str = "."):
+    path = os.path.join(data_dir, HISTORY_FILE)
+    if not os.path.exists(path):
+        return
+    db = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+    try:
+        cursor = db.execute("SELECT user_id, metric, day, delta FROM history ORDER BY user_id, metric, day")
+        while True:
+            rows = cursor.fetchmany(CHUNK_ROWS)
+            if not rows:
+                return
+            for user_id, metric, day, delta in rows:
+                yield user_id, metric, (_EPOCH + timedelta(days=day)).isoformat(), delta
+    finally:
+        db.close()
+
+
+# table -> (columns, row iterator, pyarrow types)
+SOURCES = {
+    "ranks": (("user_id", "xp", "level"), iter_ranks, ("int64", "int64", "int64")),
+    "economy": (("user_id", "balance", "total_earned"), iter_economy, ("int64", "int64", "int64")),
+    "history": (("user_id", "metric", "day", "delta"), iter_history, ("int64", "string", "string", "int64")),
+}
+
+
+def _chunks(rows):
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= CHUNK_ROWS:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _write_csv(path: str, columns, rows) -> int:
+    count = 0
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(columns)
+        for chunk in _chunks(rows):
+            writer.writerows(chunk)
+            count += len(chunk)
+    return count
+
+
+def _write_parquet(path: str, columns, rows, types) -> int:
+    schema = pa.schema([(name, getattr(pa, kind)()) for name, kind in zip(columns, types)])
+    count = 0
+    with pq.ParquetWriter(path, schema) as writer:
+        for chunk in _chunks(rows):
+            arrays = [pa.array(col, type=field.type) for col, field in zip(zip(*chunk), schema)]
+            writer.write_table(pa.Table.from_arrays(arrays, schema=schema))
+            count += len(chunk)
+    return count
+
+
+def export(tables=None, out_dir: str = "exports", fmt: str = "csv", data_dir: str = ".") -> list:
+    """Export tables to `out_dir`. Returns [(table, path, rows)].
+
+    Plain function of its arguments so it can run in a ProcessPoolExecutor.
+    """
+    if fmt == "parquet" and pa is None:
+        raise RuntimeError("Parquet export needs pyarrow installed (pip install pyarrow)")
+    os.makedirs(out_dir, exist_ok=True)
+    stamp = time.strftime("%Y%m%d-%H%M%S")
+    results = []
+    for table in tables or TABLES:
+        columns, source, types = SOURCES[table]
+        path = os.path.join(out_dir, f"{table}-{stamp}.{fmt}")
+        if fmt == "parquet":
+            rows = _write_parquet(path, columns, source(data_dir), types)
+        else:
+            rows = _write_csv(path, columns, source(data_dir))
+        results.append((table, path, rows))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export rank, economy and history data in chunks.")
+    parser.add_argument("tables", nargs="*", help=f"Tables to export ({', '.join(TABLES)}); default is all")
+    parser.add_argument("--out", default="exports", help="Output directory")
+    parser.add_argument("--format", default="csv", choices=["csv", "parquet"])
+    parser.add_argument("--data-dir", default=".", help="Directory containing data/")
+    args = parser.parse_args()
+
+    unknown = [t for t in args.tables if t not in TABLES]
+    if unknown:
+        parser.error(f"unknown table(s): {', '.join(unknown)} (choose from {', '.join(TABLES)})")
+
+    print("📦 Data Export\n")
+    start = time.perf_counter()
+    try:
+        results = export(args.tables, args.out, args.format, args.data_dir)
+    except (RuntimeError, ValueError, OSError, sqlite3.Error) as e:
+        print(f"❌ {e}")
+        return 1
+    for table, path, rows in results:
+        print(f"✅ {table}: {rows:,} rows → {path}")
+    print(f"\nDone in {time.perf_counter() - start:.2f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,185 @@
+"""XP and balance history — per-user daily deltas in SQLite, for `/rank_history`.
+
+Recording is an in-memory dict update, so `award_xp` and the economy balance helpers
+stay as fast as before:
+
+    import history
+    history.record(user_id, "xp", amount)
+
+A background task (started from bot.py) flushes the pending deltas to `data/history.db`
+every HISTORY_FLUSH_INTERVAL seconds as one upsert batch in a worker thread. Rows older
+than HISTORY_DAILY_DAYS are merged into one row per week, so the table grows with
+active users rather than with messages. Nothing is recorded while the store isn't open
+(it failed to open, or an offline tool imported the cogs without starting it).
+
+Environment variables (both optional):
+    HISTORY_FLUSH_INTERVAL   Seconds between flushes (default 60)
+    HISTORY_DAILY_DAYS       Days kept at daily resolution before merging into weeks (default 90)
+"""
+
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+HISTORY_FILE = "data/history.db"
+DEFAULT_FLUSH_INTERVAL = 60
+DEFAULT_DAILY_DAYS = 90
+SPARK_CHARS = "▁▂▃▄▅▆▇█"
+# Most unwritten deltas kept when flushes keep failing; a failed batch beyond this is dropped
+MAX_PENDING = 500_000
+
+# (user_id, metric, day) -> delta not yet written
+_pending = {}
+_store = None
+
+
+def _day(ts: float) -> int:
+    """Days since the epoch (UTC)."""
+    return int(ts // 86400)
+
+
+def record(user_id: int, metric: str, delta: int, now: float = None):
+    """Add `delta` to today's total for a user's metric ("xp" or "balance")."""
+    if not delta or _store is None:
+        return
+    key = (int(user_id), metric, _day(now if now is not None else time.time()))
+    _pending[key] = _pending.get(key, 0) + delta
+
+
+class HistoryStore:
+    """SQLite table of (user_id, metric, day) -> delta. Calls block; run them in a thread."""
+
+    def __init__(self, path: str = HISTORY_FILE):
+        self.path = path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS history ("
+            " user_id INTEGER NOT NULL, metric TEXT NOT NULL, day INTEGER NOT NULL, delta INTEGER NOT NULL,"
+            " PRIMARY KEY (user_id, metric, day)) WITHOUT ROWID"
+        )
+        self._db.commit()
+
+    def write(self, batch: dict):
+        """Add a batch of {(user_id, metric, day): delta} in one transaction."""
+        with self._lock, self._db:
+            self._db.executemany(
+                "INSERT INTO history (user_id, metric, day, delta) VALUES (?, ?, ?, ?)"
+                " ON CONFLICT (user_id, metric, day) DO UPDATE SET delta = delta + excluded.delta",
+                [(uid, metric, day, delta) for (uid, metric, day), delta in batch.items()]
+            )
+
+    def compact(self, before_day: int) -> int:
+        """Merge daily rows before `before_day` into weekly rows (keyed by the week's first day)."""
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT INTO history (user_id, metric, day, delta)"
+                " SELECT user_id, metric, day - day % 7, SUM(delta) FROM history"
+                " WHERE day < ? AND day % 7 != 0 GROUP BY user_id, metric, day - day % 7"
+                " ON CONFLICT (user_id, metric, day) DO UPDATE SET delta = delta + excluded.delta",
+                (before_day,)
+            )
+            return self._db.execute("DELETE FROM history WHERE day < ? AND day % 7 != 0", (before_day,)).rowcount
+
+    def series(self, user_id: int, metric: str, first_day: int, last_day: int) -> dict:
+        """{day: delta} for a user between two days, inclusive."""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT day, delta FROM history WHERE user_id = ? AND metric = ? AND day BETWEEN ? AND ?",
+                (user_id, metric, first_day, last_day)
+            ).fetchall()
+        return dict(rows)
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+
+async def flush():
+    """Write pending deltas to the store (in a worker thread)."""
+    global _pending
+    if _store is None or not _pending:
+        return
+    batch, _pending = _pending, {}
+    try:
+        await asyncio.to_thread(_store.write, batch)
+    except sqlite3.Error as e:
+        if len(_pending) + len(batch) > MAX_PENDING:
+            print(f"[history] Flush failed, dropping {len(batch)} deltas: {e}")
+            return
+        # Put the batch back so the next flush retries it
+        for key, delta in batch.items():
+            _pending[key] = _pending.get(key, 0) + delta
+        print(f"[history] Flush failed: {e}")
+
+
+async def series(user_id: int, metric: str, days: int, now: float = None) -> list:
+    """Daily deltas for the last `days` days, oldest first, including unflushed ones."""
+    last = _day(now if now is not None else time.time())
+    first = last - days + 1
+    stored = {}
+    if _store is not None:
+        stored = await asyncio.to_thread(_store.series, user_id, metric, first, last)
+    values = [stored.get(day, 0) for day in range(first, last + 1)]
+    for (uid, m, day), delta in _pending.items():
+        if uid == user_id and m == metric and first <= day <= last:
+            values[day - first] += delta
+    return values
+
+
+def sparkline(values: list) -> str:
+    """Render numbers as a row of block characters."""
+    if not values:
+        return ""
+    low, high = min(values), max(values)
+    if high == low:
+        return SPARK_CHARS[0] * len(values)
+    scale = (len(SPARK_CHARS) - 1) / (high - low)
+    return "".join(SPARK_CHARS[int((v - low) * scale)] for v in values)
+
+
+async def _flush_loop(interval: float, daily_days: int):
+    compacted_day = None
+    while True:
+        await asyncio.sleep(interval)
+        await flush()
+        today = _day(time.time())
+        if today != compacted_day:
+            try:
+                merged = await asyncio.to_thread(_store.compact, today - daily_days)
+                if merged:
+                    print(f"[history] Merged {merged} daily rows into weekly rows")
+            except sqlite3.Error as e:
+                print(f"[history] Compaction failed: {e}")
+            compacted_day = today
+
+
+def start(bot):
+    """Open the store and start the flush task. Returns the task, or None if the store can't open."""
+    global _store
+    interval = float(os.getenv("HISTORY_FLUSH_INTERVAL", DEFAULT_FLUSH_INTERVAL))
+    daily_days = int(os.getenv("HISTORY_DAILY_DAYS", DEFAULT_DAILY_DAYS))
+    try:
+        os.makedirs(os.path.dirname(HISTORY_FILE), exist_ok=True)
+        _store = HistoryStore(HISTORY_FILE)
+    except sqlite3.Error as e:
+        print(f"[history] Failed to open {HISTORY_FILE}, history is disabled: {e}")
+        return None
+    return bot.loop.create_task(_flush_loop(interval, daily_days))
+
+
+async def stop():
+    """Write what's pending and close the store (call on shutdown)."""
+    global _store
+    if _store is None:
+        return
+    await flush()
+    _store.close()
+    _store = None
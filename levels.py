@@ -0,0 +1,117 @@
+"""Level curves — integer-exact XP thresholds with bisect lookup.
+
+A curve is a table of XP thresholds: `thresholds[n]` is the total XP needed to reach
+level n. Looking up a level is a binary search, and the XP for any level is a table
+read, so no float math is involved anywhere.
+
+The default curve is the original `level = floor(sqrt(xp / 50))`, i.e. level n needs
+50 * n² XP. Guilds can pick a different curve with the `level_curve` entry in
+settings.json (see `curve_from_config`).
+"""
+
+import bisect
+from math import isqrt
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional - batch lookups fall back to bisect
+    np = None
+
+# Levels precomputed per curve; quadratic curves extend past this with isqrt
+TABLE_LEVELS = 1000
+DEFAULT_BASE_XP = 50
+
+
+class LevelCurve:
+    """XP thresholds for each level, from level 0 (0 XP) upwards."""
+
+    def __init__(self, thresholds, base_xp: int = None):
+        """`thresholds` must start at 0 and increase strictly. `base_xp` marks a quadratic
+        curve (level n at base_xp * n²), which keeps working past the end of the table."""
+        thresholds = [int(t) for t in thresholds]
+        if not thresholds or thresholds[0] != 0:
+            raise ValueError("level thresholds must start at 0")
+        if any(b <= a for a, b in zip(thresholds, thresholds[1:])):
+            raise ValueError("level thresholds must increase strictly")
+        self.thresholds = thresholds
+        self.base_xp = base_xp
+        self.max_table_xp = thresholds[-1]
+        self._np_thresholds = None
+
+    @classmethod
+    def quadratic(cls, base_xp: int = DEFAULT_BASE_XP, levels: int = TABLE_LEVELS) -> "LevelCurve":
+        """Level n needs base_xp * n² XP."""
+        if base_xp <= 0:
+            raise ValueError("base_xp must be positive")
+        return cls([base_xp * n * n for n in range(levels + 1)], base_xp=base_xp)
+
+    @classmethod
+    def linear(cls, xp_per_level: int, levels: int = TABLE_LEVELS) -> "LevelCurve":
+        """Every level costs the same amount of XP (capped at `levels`)."""
+        if xp_per_level <= 0:
+            raise ValueError("xp_per_level must be positive")
+        return cls([xp_per_level * n for n in range(levels + 1)])
+
+    @property
+    def max_level(self):
+        """Highest reachable level, or None if the curve is unbounded."""
+        return None if self.base_xp else len(self.thresholds) - 1
+
+    def level(self, xp: int) -> int:
+        """Level reached with `xp` total XP."""
+        if xp > self.max_table_xp and self.base_xp:
+            return isqrt(xp // self.base_xp)
+        return bisect.bisect_right(self.thresholds, xp) - 1
+
+    def xp_for(self, level: int) -> int:
+        """Total XP needed to reach `level` (the top level's threshold if the curve is capped)."""
+        if level < len(self.thresholds):
+            return self.thresholds[max(0, level)]
+        if self.base_xp:
+            return self.base_xp * level * level
+        return self.thresholds[-1]
+
+    def levels(self, xp_values) -> list:
+        """Levels for many XP totals at once (used for bulk recalculation)."""
+        if np is not None:
+            if self._np_thresholds is None:
+                self._np_thresholds = np.asarray(self.thresholds, dtype=np.int64)
+            xp = np.asarray(xp_values, dtype=np.int64)
+            result = np.searchsorted(self._np_thresholds, xp, side="right") - 1
+            if self.base_xp:
+                beyond = xp > self.max_table_xp
+                if beyond.any():
+                    # Only a handful of users are ever past the table - finish them exactly
+                    for i in np.flatnonzero(beyond).tolist():
+                        result[i] = isqrt(int(xp[i]) // self.base_xp)
+            return result.tolist()
+        level = self.level
+        return [level(xp) for xp in xp_values]
+
+    def progress(self, xp: int) -> tuple:
+        """Return (level, xp into the level, xp the level spans)."""
+        level = self.level(xp)
+        start = self.xp_for(level)
+        span = self.xp_for(level + 1) - start
+        return level, xp - start, span
+
+
+DEFAULT_CURVE = LevelCurve.quadratic()
+
+
+def curve_from_config(config: dict) -> LevelCurve:
+    """Build a curve from a guild's `level_curve` settings entry.
+
+    Accepted shapes:
+        {"type": "quadratic", "base_xp": 50}
+        {"type": "linear", "xp_per_level": 500, "max_level": 100}
+        {"thresholds": [0, 100, 250, 500, ...]}
+    """
+    if "thresholds" in config:
+        return LevelCurve(config["thresholds"])
+    kind = config.get("type", "quadratic")
+    if kind == "quadratic":
+        return LevelCurve.quadratic(int(config.get("base_xp", DEFAULT_BASE_XP)))
+    if kind == "linear":
+        return LevelCurve.linear(int(config["xp_per_level"]), int(config.get("max_level", TABLE_LEVELS)))
+    raise ValueError(f"unknown level curve type: {kind}")
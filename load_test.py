@@ -0,0 +1,362 @@
+#!/usr/bin/env python3
+"""
+Offline load test.
+Drives the real cogs with fake messages and interactions (no network, no token)
+and reports handler latency and throughput for the hot paths:
+
+    chat         RankSystem.on_message (XP awards)
+    trivia       Trivia.on_message (answers to an active question)
+    pay          Economy /pay
+    leaderboard  RankSystem /leaderboard
+    slots        Casino /slots
+
+Runs in a temporary directory seeded with synthetic rank and economy data, so
+the real data/ folder is never touched.
+
+Usage:
+    python3 load_test.py                          # every scenario, as fast as possible
+    python3 load_test.py chat pay --ops 5000
+    python3 load_test.py --rate 200 --users 50000 # open loop at 200 ops/sec per scenario
+    python3 load_test.py --max-p99 50             # exit 1 if any p99 is above 50 ms
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+SCENARIOS = ["chat", "trivia", "pay", "leaderboard", "slots"]
+GUILD_ID = 1
+CHANNEL_ID = 10
+TRIVIA_CHANNEL_ID = 11
+# Synthetic user ids start here
+USER_ID_BASE = 10_000
+
+
+# ==================== FAKE DISCORD OBJECTS ====================
+
+_ids = itertools.count(1_000_000)
+
+
+class FakeUser:
+    def __init__(self, user_id: int):
+        self.id = user_id
+        self.bot = False
+        self.name = self.display_name = f"user{user_id}"
+        self.mention = f"<@{user_id}>"
+        self.avatar = None
+
+    async def send(self, *args, **kwargs):
+        return FakeMessage(self, None, None, "")
+
+    def __str__(self):
+        return self.name
+
+
+class FakeGuild:
+    def __init__(self, guild_id: int, members: dict):
+        self.id = guild_id
+        self.members = members
+
+    def get_member(self, user_id: int):
+        return self.members.get(user_id)
+
+
+class FakeChannel:
+    def __init__(self, channel_id: int, guild):
+        self.id = channel_id
+        self.guild = guild
+        self.mention = f"<#{channel_id}>"
+        self.sent = 0
+
+    async def send(self, content=None, **kwargs):
+        self.sent += 1
+        return FakeMessage(None, self.guild, self, content or "")
+
+
+class FakeMessage:
+    def __init__(self, author, guild, channel, content: str):
+        self.id = next(_ids)
+        self.author = author
+        self.guild = guild
+        self.channel = channel
+        self.content = content
+
+    async def add_reaction(self, emoji):
+        pass
+
+    async def edit(self, **kwargs):
+        pass
+
+
+class FakeResponse:
+    def __init__(self):
+        self._done = False
+
+    def is_done(self):
+        return self._done
+
+    async def send_message(self, *args, **kwargs):
+        self._done = True
+
+    async def defer(self, *args, **kwargs):
+        self._done = True
+
+    async def edit_message(self, *args, **kwargs):
+        self._done = True
+
+
+class FakeFollowup:
+    def __init__(self, interaction):
+        self.interaction = interaction
+
+    async def send(self, *args, **kwargs):
+        i = self.interaction
+        return FakeMessage(i.user, i.guild, i.channel, "")
+
+
+class FakeInteraction:
+    def __init__(self, user, guild, channel):
+        self.id = next(_ids)
+        self.user = user
+        self.guild = guild
+        self.guild_id = guild.id
+        self.channel = channel
+        self.channel_id = channel.id
+        self.created_at = datetime.now(timezone.utc)
+        self.data = {}
+        self.command = None
+        self.response = FakeResponse()
+        self.followup = FakeFollowup(self)
+
+    async def original_response(self):
+        return FakeMessage(self.user, self.guild, self.channel, "")
+
+
+class FakeBot:
+    """Just enough of commands.Bot for the cogs under test."""
+
+    def __init__(self, loop):
+        self.loop = loop
+        self.cogs = {}
+        self.user = FakeUser(1)
+        self.user.bot = True
+        self.channels = {}
+        self.guild_map = {}
+
+    def get_cog(self, name: str):
+        return self.cogs.get(name)
+
+    def get_channel(self, channel_id: int):
+        return self.channels.get(channel_id)
+
+    def get_guild(self, guild_id: int):
+        return self.guild_map.get(guild_id)
+
+    def get_user(self, user_id: int):
+        return None
+
+
+# ==================== HARNESS ====================
+
+def seed_data(users: int):
+    """Write synthetic ranks.json and economy.json into ./data."""
+    os.makedirs("data", exist_ok=True)
+    rng = random.Random(0)
+    ranks, economy = {}, {}
+    for uid in range(USER_ID_BASE, USER_ID_BASE + users):
+        xp = int(rng.paretovariate(1.2) * 100)
+        ranks[str(uid)] = {"xp": xp, "level": int((xp / 50) ** 0.5)}
+        economy[str(uid)] = {"balance": 1_000_000, "total_earned": 1_000_000}
+    with open("data/ranks.json", "w") as f:
+        json.dump({"users": ranks, "xp_cooldowns": {}}, f)
+    with open("data/economy.json", "w") as f:
+        json.dump({"users": economy}, f)
+
+
+def percentile(sorted_values: list, pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+class ScenarioResult:
+    def __init__(self, name: str, latencies: list, elapsed: float, errors: int):
+        self.name = name
+        self.latencies = sorted(latencies)
+        self.elapsed = elapsed
+        self.errors = errors
+
+    @property
+    def p99_ms(self) -> float:
+        return percentile(self.latencies, 99) * 1000
+
+    def report(self):
+        ops = len(self.latencies)
+        rate = ops / self.elapsed if self.elapsed else 0.0
+        print(f"⚡ {self.name}")
+        print(f"   Ops:         {ops:,} ({self.errors} errors)")
+        print(f"   Throughput:  {rate:,.0f} ops/sec")
+        print(f"   Latency:     p50 {percentile(self.latencies, 50) * 1000:.3f} ms  "
+              f"p99 {self.p99_ms:.3f} ms  max {self.latencies[-1] * 1000 if ops else 0:.3f} ms")
+
+
+async def run_scenario(name: str, make_op, ops: int, rate: float) -> ScenarioResult:
+    """Run `ops` operations. With a rate, ops start on a fixed schedule (open loop) and latency
+    includes time spent waiting behind earlier ops; without one they run back to back."""
+    latencies = []
+    errors = 0
+
+    async def timed(op, scheduled: float):
+        nonlocal errors
+        try:
+            await op()
+        except Exception as e:
+            errors += 1
+            if errors == 1:
+                print(f"   First error in {name}: {e!r}")
+        latencies.append(time.perf_counter() - scheduled)
+
+    start = time.perf_counter()
+    if rate > 0:
+        tasks = []
+        for i in range(ops):
+            scheduled = start + i / rate
+            delay = scheduled - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            tasks.append(asyncio.ensure_future(timed(make_op(), scheduled)))
+        await asyncio.gather(*tasks)
+    else:
+        for _ in range(ops):
+            await timed(make_op(), time.perf_counter())
+    return ScenarioResult(name, latencies, time.perf_counter() - start, errors)
+
+
+async def main_async(args) -> int:
+    seed_data(args.users)
+
+    # Imported after seeding so each cog loads the synthetic data
+    from cogs.casino import Casino
+    from cogs.economy import Economy
+    from cogs.rank import RankSystem
+    from cogs.trivia import Trivia
+
+    bot = FakeBot(asyncio.get_running_loop())
+    for cog_cls in (RankSystem, Economy, Trivia, Casino):
+        cog = cog_cls(bot)
+        bot.cogs[cog.qualified_name] = cog
+    await bot.cogs["Casino"].cog_load()
+    rank, economy, trivia, casino = (bot.cogs[n] for n in ("RankSystem", "Economy", "Trivia", "Casino"))
+
+    user_ids = range(USER_ID_BASE, USER_ID_BASE + args.users)
+    members = {uid: FakeUser(uid) for uid in user_ids}
+    guild = FakeGuild(GUILD_ID, members)
+    channel = FakeChannel(CHANNEL_ID, guild)
+    trivia_channel = FakeChannel(TRIVIA_CHANNEL_ID, guild)
+    bot.channels = {CHANNEL_ID: channel, TRIVIA_CHANNEL_ID: trivia_channel}
+    bot.guild_map = {GUILD_ID: guild}
+    rng = random.Random(args.seed)
+
+    def random_member():
+        return members[USER_ID_BASE + rng.randrange(args.users)]
+
+    def chat_op():
+        message = FakeMessage(random_member(), guild, channel, "just chatting about the match last night")
+        return lambda: rank.on_message(message)
+
+    trivia.active_trivia[TRIVIA_CHANNEL_ID] = {
+        "asker_id": 0,
+        "question": "What is the capital of Australia?",
+        "answers": trivia._normalize_answers("Canberra | ACT"),
+        "answer_display": "Canberra",
+        "xp": 50,
+        "credits": 50,
+        "ends_at": time.time() + 3600,
+        "task": None,
+        "correct_users": [],
+    }
+    guesses = ["||canberra||", "||Canbera||", "||sydney||", "I think it's ||melbourne|| maybe",
+               "||the capital is canberra||", "no idea"]
+
+    def trivia_op():
+        message = FakeMessage(random_member(), guild, trivia_channel, rng.choice(guesses))
+        return lambda: trivia.on_message(message)
+
+    def pay_op():
+        interaction = FakeInteraction(random_member(), guild, channel)
+        return lambda: economy.pay.callback(economy, interaction, random_member(), 1)
+
+    def leaderboard_op():
+        interaction = FakeInteraction(random_member(), guild, channel)
+        return lambda: rank.leaderboard.callback(rank, interaction, rng.randint(1, 5))
+
+    def slots_op():
+        interaction = FakeInteraction(random_member(), guild, channel)
+        return lambda: casino.slots.callback(casino, interaction, 10)
+
+    factories = {
+        "chat": chat_op,
+        "trivia": trivia_op,
+        "pay": pay_op,
+        "leaderboard": leaderboard_op,
+        "slots": slots_op,
+    }
+
+    print("🏋️ Offline Load Test\n")
+    mode = f"open loop at {args.rate:g} ops/sec" if args.rate > 0 else "closed loop (back to back)"
+    print(f"Users: {args.users:,}  Ops per scenario: {args.ops:,}  Mode: {mode}\n")
+
+    failed = []
+    for name in args.scenarios or SCENARIOS:
+        result = await run_scenario(name, factories[name], args.ops, args.rate)
+        result.report()
+        if args.max_p99 is not None and result.p99_ms > args.max_p99:
+            failed.append(name)
+
+    await casino.cog_unload()
+    for task in [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]:
+        task.cancel()
+
+    if failed:
+        print(f"\n❌ p99 above {args.max_p99:g} ms: {', '.join(failed)}")
+        return 1
+    if args.max_p99 is not None:
+        print(f"\n✅ Every scenario's p99 is within {args.max_p99:g} ms")
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-test the bot's cogs offline with fake Discord objects.")
+    parser.add_argument("scenarios", nargs="*", metavar="scenario",
+                        help=f"Scenarios to run ({', '.join(SCENARIOS)}); default is all")
+    parser.add_argument("--ops", type=int, default=500, help="Operations per scenario")
+    parser.add_argument("--rate", type=float, default=0, help="Target ops/sec (0 = as fast as possible)")
+    parser.add_argument("--users", type=int, default=5_000, help="Synthetic users to seed")
+    parser.add_argument("--seed", type=int, default=None, help="Seed for reproducible runs")
+    parser.add_argument("--max-p99", type=float, default=None,
+                        help="Fail (exit 1) if any scenario's p99 latency exceeds this many ms")
+    args = parser.parse_args()
+    unknown = [name for name in args.scenarios if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"unknown scenario(s): {', '.join(unknown)} (choose from {', '.join(SCENARIOS)})")
+
+    sys.path.insert(0, ROOT)
+    with tempfile.TemporaryDirectory(prefix="bot-load-test-") as workdir:
+        os.chdir(workdir)
+        try:
+            return asyncio.run(main_async(args))
+        finally:
+            os.chdir(ROOT)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,169 @@
+"""Event loop watchdog — measures loop lag and reports what was blocking the loop.
+
+Two halves work together:
+  * a heartbeat task on the event loop that measures how late its sleeps wake up
+    (feeding the loop lag metrics), and turns on asyncio's slow-callback logging
+    while the loop is lagging;
+  * a monitor thread that notices when the heartbeat is overdue, samples the loop
+    thread's stack while it is stuck, and prints which cog and command was running.
+
+Configured with environment variables (all optional):
+    WATCHDOG_LAG_LIMIT       Report stalls longer than this many seconds (default 0.5, 0 disables reports)
+    WATCHDOG_SLOW_CALLBACK   asyncio slow-callback threshold in seconds while lagging (default 0.1)
+"""
+
+import asyncio
+import os
+import sys
+import threading
+import time
+from collections import Counter
+
+import metrics
+
+# Seconds between heartbeats
+HEARTBEAT_INTERVAL = 0.5
+# Report a stall once the heartbeat is this many seconds overdue
+LAG_LIMIT = 0.5
+# Callbacks slower than this are logged by asyncio while debug mode is on
+SLOW_CALLBACK_DURATION = 0.1
+# Stack samples taken per stall, and the gap between them
+STALL_SAMPLES = 5
+SAMPLE_SPACING = 0.02
+# Quiet heartbeats before asyncio debug mode is switched back off
+QUIET_BEATS = 20
+
+_COGS_DIR = os.sep + "cogs" + os.sep
+
+
+def _describe_frame(frame) -> tuple:
+    """Return (cog, command, stack) for a frame from the loop thread.
+
+    `stack` is a list of "file:line function" strings, outermost first. The cog is the
+    outermost frame inside cogs/, and the command comes from an `interaction` local when
+    there is one (otherwise the handler's function name is used).
+    """
+    stack = []
+    cog = command = None
+    while frame is not None:
+        code = frame.f_code
+        stack.append(f"{os.path.basename(code.co_filename)}:{frame.f_lineno} {code.co_name}")
+        if _COGS_DIR in code.co_filename:
+            # Keep overwriting so the outermost cog frame wins
+            owner = frame.f_locals.get("self")
+            cog = type(owner).__name__ if owner is not None else os.path.basename(code.co_filename)[:-3]
+            command = code.co_name
+            interaction = frame.f_locals.get("interaction")
+            app_command = getattr(interaction, "command", None)
+            if app_command is not None:
+                command = "/" + app_command.qualified_name
+        frame = frame.f_back
+    stack.reverse()
+    return cog, command, stack
+
+
+class LoopWatchdog:
+    """Heartbeat task plus monitor thread for one event loop."""
+
+    def __init__(self, loop, lag_limit: float = LAG_LIMIT, slow_callback: float = SLOW_CALLBACK_DURATION,
+                 interval: float = HEARTBEAT_INTERVAL):
+        self.loop = loop
+        self.lag_limit = lag_limit
+        self.slow_callback = slow_callback
+        self.interval = interval
+        self.stalls = 0
+        self._beat = time.perf_counter()
+        self._loop_thread = None
+        self._reported_beat = None
+        self._debug_enabled_here = False
+        self._quiet = 0
+        self._stop = threading.Event()
+        self._task = None
+        self._thread = None
+
+    def start(self):
+        self._task = self.loop.create_task(self._heartbeat())
+        if self.lag_limit > 0:
+            self._thread = threading.Thread(target=self._monitor, name="loop-watchdog", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._task and not self._task.done():
+            self._task.cancel()
+        if self._debug_enabled_here:
+            self.loop.set_debug(False)
+
+    async def _heartbeat(self):
+        """Measure loop lag from sleep overshoot and toggle slow-callback logging."""
+        self._loop_thread = threading.get_ident()
+        try:
+            while True:
+                self._beat = start = time.perf_counter()
+                await asyncio.sleep(self.interval)
+                lag = max(0.0, time.perf_counter() - start - self.interval)
+                metrics.LOOP_LAG.set(lag)
+                metrics.LOOP_LAG_HIST.observe(lag)
+
+                if lag >= self.slow_callback:
+                    self._quiet = 0
+                    if not self.loop.get_debug():
+                        self.loop.slow_callback_duration = self.slow_callback
+                        self.loop.set_debug(True)
+                        self._debug_enabled_here = True
+                        print(f"[watchdog] Loop lag {lag * 1000:.0f}ms - slow-callback logging enabled")
+                elif self._debug_enabled_here:
+                    self._quiet += 1
+                    if self._quiet >= QUIET_BEATS:
+                        self.loop.set_debug(False)
+                        self._debug_enabled_here = False
+                        print("[watchdog] Loop lag recovered - slow-callback logging disabled")
+        except asyncio.CancelledError:
+            return
+
+    def _monitor(self):
+        """Runs in its own thread: sample the loop thread's stack whenever the heartbeat is overdue."""
+        while not self._stop.wait(self.interval / 2):
+            beat = self._beat
+            overdue = time.perf_counter() - beat - self.interval
+            if overdue < self.lag_limit or beat == self._reported_beat or self._loop_thread is None:
+                continue
+            self._reported_beat = beat
+
+            samples = []
+            for _ in range(STALL_SAMPLES):
+                frame = sys._current_frames().get(self._loop_thread)
+                if frame is None or self._beat != beat:
+                    break  # The loop has moved on
+                samples.append(_describe_frame(frame))
+                del frame
+                time.sleep(SAMPLE_SPACING)
+            if samples:
+                self._report(overdue, samples)
+
+    def _report(self, overdue: float, samples: list):
+        """Print the most common stack seen during a stall."""
+        self.stalls += 1
+        counts = Counter((cog, command, tuple(stack)) for cog, command, stack in samples)
+        (cog, command, stack), hits = counts.most_common(1)[0]
+        metrics.LOOP_STALLS.inc(cog=cog or "none")
+
+        where = f"cog {cog}, {command}" if cog else "outside any cog"
+        print(f"[watchdog] Event loop blocked for {overdue:.2f}s+ ({where}); "
+              f"{hits}/{len(samples)} samples in this stack:")
+        # The innermost frames are the interesting ones
+        for line in stack[-12:]:
+            print(f"[watchdog]     {line}")
+
+
+def start(bot) -> LoopWatchdog:
+    """Create and start the watchdog for the bot's loop using the environment settings."""
+    try:
+        lag_limit = float(os.getenv("WATCHDOG_LAG_LIMIT", LAG_LIMIT))
+        slow_callback = float(os.getenv("WATCHDOG_SLOW_CALLBACK", SLOW_CALLBACK_DURATION))
+    except ValueError as e:
+        print(f"[watchdog] Invalid setting, using defaults: {e}")
+        lag_limit, slow_callback = LAG_LIMIT, SLOW_CALLBACK_DURATION
+    watchdog = LoopWatchdog(bot.loop, lag_limit, slow_callback)
+    watchdog.start()
+    return watchdog
@@ -0,0 +1,238 @@
+"""Metrics — counters, gauges and histograms, exposed in Prometheus text format.
+
+Metric objects are module-level so any cog can import and update them cheaply:
+
+    from metrics import XP_AWARDED
+    XP_AWARDED.inc(amount)
+
+Exposure is configured with environment variables (both optional, both may be set):
+    METRICS_PORT     Serve /metrics on 127.0.0.1:<port> (METRICS_HOST overrides the address)
+    METRICS_FILE     Write the same text to this file every METRICS_INTERVAL seconds (default 15)
+"""
+
+import asyncio
+import bisect
+import os
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# Default histogram buckets, in seconds
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_REGISTRY = []
+
+
+def _label_key(labels: dict) -> tuple:
+    return tuple(sorted(labels.items()))
+
+
+def _format_labels(key: tuple) -> str:
+    if not key:
+        return ""
+    inner = ",".join(f'{k}="{str(v).replace(chr(34), chr(39))}"' for k, v in key)
+    return "{" + inner + "}"
+
+
+def _format_value(value) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """A value that only goes up."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, help_text: str):
+        self.name = name
+        self.help = help_text
+        self._values = {}
+        _REGISTRY.append(self)
+
+    def inc(self, amount=1, **labels):
+        key = _label_key(labels) if labels else ()
+        self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels):
+        return self._values.get(_label_key(labels), 0)
+
+    def samples(self):
+        for key, value in self._values.items():
+            yield self.name, key, value
+
+
+class Gauge:
+    """A value that can go up and down, or be read from a callback at scrape time."""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, help_text: str):
+        self.name = name
+        self.help = help_text
+        self._values = {}
+        self._callback = None
+        _REGISTRY.append(self)
+
+    def set(self, value, **labels):
+        self._values[_label_key(labels)] = value
+
+    def set_function(self, callback):
+        """Read the value from `callback()` whenever metrics are rendered."""
+        self._callback = callback
+
+    def value(self, **labels):
+        return self._values.get(_label_key(labels), 0)
+
+    def samples(self):
+        if self._callback is not None:
+            try:
+                self._values[()] = self._callback()
+            except Exception as e:
+                print(f"[metrics] Gauge {self.name} callback failed: {e}")
+        for key, value in self._values.items():
+            yield self.name, key, value
+
+
+class Histogram:
+    """Counts observations into cumulative buckets (plus sum and count)."""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, help_text: str, buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.help = help_text
+        self.buckets = tuple(sorted(buckets))
+        # label key -> [bucket counts..., sum, count]
+        self._series = {}
+        _REGISTRY.append(self)
+
+    def observe(self, value: float, **labels):
+        key = _label_key(labels) if labels else ()
+        series = self._series.get(key)
+        if series is None:
+            series = self._series[key] = [0] * len(self.buckets) + [0.0, 0]
+        i = bisect.bisect_left(self.buckets, value)
+        if i < len(self.buckets):
+            series[i] += 1
+        series[-2] += value
+        series[-1] += 1
+
+    def samples(self):
+        n = len(self.buckets)
+        for key, series in self._series.items():
+            cumulative = 0
+            for i, bound in enumerate(self.buckets):
+                cumulative += series[i]
+                yield f"{self.name}_bucket", key + (("le", _format_value(bound)),), cumulative
+            yield f"{self.name}_bucket", key + (("le", "+Inf"),), series[n + 1]
+            yield f"{self.name}_sum", key, series[n]
+            yield f"{self.name}_count", key, series[n + 1]
+
+
+def render() -> str:
+    """Render every registered metric in Prometheus text exposition format."""
+    lines = []
+    for metric in _REGISTRY:
+        lines.append(f"# HELP {metric.name} {metric.help}")
+        lines.append(f"# TYPE {metric.name} {metric.kind}")
+        for name, key, value in metric.samples():
+            lines.append(f"{name}{_format_labels(key)} {_format_value(value)}")
+    return "\n".join(lines) + "\n"
+
+
+# ==================== BOT METRICS ====================
+
+COMMAND_LATENCY = Histogram(
+    "bot_command_latency_seconds",
+    "Time from interaction creation to command completion, by command",
+)
+COMMANDS_TOTAL = Counter("bot_commands_total", "Application commands completed, by command")
+MESSAGES_TOTAL = Counter("bot_messages_total", "Guild messages seen by the rank system")
+XP_AWARDS_TOTAL = Counter("bot_xp_awards_total", "Number of XP awards")
+XP_AWARDED = Counter("bot_xp_awarded_total", "Total XP awarded")
+XP_SPAM_PENALTIES = Counter("bot_xp_spam_penalties_total", "XP awards reduced by the spam tracker")
+LEADERBOARD_PAGES = Counter("bot_leaderboard_pages_total", "Leaderboard pages served, by board and cache result")
+ECONOMY_WRITES = Counter("bot_economy_writes_total", "Full saves of economy.json")
+DUPLICATE_INTERACTIONS = Counter("bot_duplicate_interactions_total", "Repeated interactions ignored by the dedup cache, by command")
+PERSIST_SECONDS = Histogram(
+    "bot_persist_flush_seconds",
+    "Time spent writing a data file, by file",
+)
+LOOP_LAG = Gauge("bot_event_loop_lag_seconds", "Most recent event loop lag measurement")
+LOOP_LAG_HIST = Histogram("bot_event_loop_lag_hist_seconds", "Event loop lag measurements")
+LOOP_STALLS = Counter("bot_event_loop_stalls_total", "Event loop stalls reported by the watchdog, by cog")
+GAME_SESSIONS = Gauge("bot_game_sessions", "Active Pong/Snake/Life sessions")
+BLACKJACK_SESSIONS = Gauge("bot_blackjack_sessions", "Open blackjack hands")
+BLACKJACK_SESSION_BYTES = Gauge("bot_blackjack_session_bytes", "Approximate memory held by open blackjack hands")
+
+
+# ==================== EXPOSURE ====================
+
+async def _handle_http(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+    """Minimal HTTP/1.0 handler: GET /metrics returns the rendered metrics."""
+    try:
+        request_line = await asyncio.wait_for(reader.readline(), timeout=5)
+        # Drain headers
+        while (await asyncio.wait_for(reader.readline(), timeout=5)) not in (b"\r\n", b"\n", b""):
+            pass
+        parts = request_line.decode("latin-1").split()
+        if len(parts) >= 2 and parts[0] == "GET" and parts[1].split("?")[0] in ("/", "/metrics"):
+            body = render().encode()
+            status = "200 OK"
+        else:
+            body = b"Not Found\n"
+            status = "404 Not Found"
+        writer.write(
+            f"HTTP/1.0 {status}\r\nContent-Type: text/plain; version=0.0.4\r\n"
+            f"Content-Length: {len(body)}\r\n\r\n".encode() + body
+        )
+        await writer.drain()
+    except Exception:
+        pass
+    finally:
+        writer.close()
+
+
+async def _dump_loop(path: str, interval: float):
+    """Write metrics to a file periodically."""
+    try:
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                tmp_path = path + ".tmp"
+                with open(tmp_path, "w") as f:
+                    f.write(render())
+                os.replace(tmp_path, path)
+            except OSError as e:
+                print(f"[metrics] Failed to write {path}: {e}")
+    except asyncio.CancelledError:
+        return
+
+
+async def start(bot):
+    """Start whichever exporters are configured. Returns the tasks started.
+
+    Loop lag is measured by the watchdog (`loop_watchdog.py`), which updates LOOP_LAG.
+    """
+    tasks = []
+
+    port = os.getenv("METRICS_PORT")
+    if port:
+        host = os.getenv("METRICS_HOST", "127.0.0.1")
+        try:
+            server = await asyncio.start_server(_handle_http, host, int(port))
+            tasks.append(bot.loop.create_task(server.serve_forever()))
+            print(f"[metrics] Serving http://{host}:{port}/metrics")
+        except (OSError, ValueError) as e:
+            print(f"[metrics] Failed to start metrics server: {e}")
+
+    path = os.getenv("METRICS_FILE")
+    if path:
+        interval = float(os.getenv("METRICS_INTERVAL", "15"))
+        tasks.append(bot.loop.create_task(_dump_loop(path, interval)))
+        print(f"[metrics] Writing metrics to {path} every {interval:g}s")
+
+    return tasks
@@ -0,0 +1,89 @@
+"""Button paginator for leaderboards (`/leaderboard`, `/rich`).
+
+The view keeps a page cursor into a guild's `RankingIndex`. Each button press renders
+one page from the index (usually straight from its page cache) and edits the message in
+place, so paging never re-sorts anything or sends a fresh message.
+"""
+
+import discord
+
+from ranking import PAGE_SIZE
+
+# Seconds of inactivity before the buttons are disabled
+PAGINATOR_TIMEOUT = 120
+
+
+def leaderboard_embed(title: str, color: discord.Color, rows: list, page: int, total_pages: int) -> discord.Embed:
+    """Embed for one page of rendered rows [(position, name, value)]."""
+    embed = discord.Embed(title=title, color=color)
+    for position, name, value in rows:
+        embed.add_field(name=f"#{position} — {name}", value=value, inline=False)
+    embed.set_footer(text=f"Page {page} of {total_pages}")
+    return embed
+
+
+class LeaderboardView(discord.ui.View):
+    """First/previous/next/last buttons over a guild's ranking. Only the invoker can page."""
+
+    def __init__(self, index, guild, owner_id: int, title: str, color: discord.Color, format_value, page: int = 1):
+        super().__init__(timeout=PAGINATOR_TIMEOUT)
+        self.index = index
+        self.guild = guild
+        self.owner_id = owner_id
+        self.title = title
+        self.color = color
+        self.format_value = format_value
+        self.page = page
+        self.total_pages = 1
+        self.message = None
+
+    def render(self) -> discord.Embed:
+        """Embed for the current page; clamps the cursor if the board shrank."""
+        self.total_pages = max(1, (len(self.index.for_guild(self.guild)) + PAGE_SIZE - 1) // PAGE_SIZE)
+        self.page = min(max(1, self.page), self.total_pages)
+        rows, _ = self.index.rows(self.guild, self.page, self.format_value)
+        self.first.disabled = self.previous.disabled = self.page <= 1
+        self.next.disabled = self.last.disabled = self.page >= self.total_pages
+        return leaderboard_embed(self.title, self.color, rows, self.page, self.total_pages)
+
+    async def send(self, interaction: discord.Interaction):
+        """Send the first page as the interaction response."""
+        embed = self.render()
+        await interaction.response.send_message(embed=embed, view=self)
+        self.message = await interaction.original_response()
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        if interaction.user.id != self.owner_id:
+            await interaction.response.send_message("Run the command yourself to browse pages.", ephemeral=True)
+            return False
+        return True
+
+    async def _go(self, interaction: discord.Interaction, page: int):
+        self.page = page
+        await interaction.response.edit_message(embed=self.render(), view=self)
+
+    @discord.ui.button(emoji="⏮️", style=discord.ButtonStyle.secondary)
+    async def first(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self._go(interaction, 1)
+
+    @discord.ui.button(emoji="◀️", style=discord.ButtonStyle.primary)
+    async def previous(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self._go(interaction, self.page - 1)
+
+    @discord.ui.button(emoji="▶️", style=discord.ButtonStyle.primary)
+    async def next(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self._go(interaction, self.page + 1)
+
+    @discord.ui.button(emoji="⏭️", style=discord.ButtonStyle.secondary)
+    async def last(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self._go(interaction, self.total_pages)
+
+    async def on_timeout(self):
+        """Disable the buttons once nobody is paging."""
+        for item in self.children:
+            item.disabled = True
+        if self.message is not None:
+            try:
+                await self.message.edit(view=self)
+            except discord.HTTPException:
+                pass
@@ -0,0 +1,220 @@
+"""Ranking index and leaderboard page cache.
+
+`RankingIndex` keeps, per guild, the guild's members sorted by a score (XP, balance)
+in a plain list maintained with `bisect`. It is built the first time a guild's board
+is needed and then kept up to date as scores change, so leaderboards never re-sort
+every user or call `guild.get_member` for everyone in the data file.
+
+Rendered pages (names and values, and optionally a PNG) are cached per guild and page.
+When a score changes, only the pages between the user's old and new positions are
+dropped, so activity below the cached pages costs nothing.
+"""
+
+import bisect
+import io
+import time
+
+from metrics import LEADERBOARD_PAGES
+
+try:
+    from PIL import Image, ImageDraw, ImageFont
+except ImportError:  # Pillow is optional - image leaderboards are unavailable without it
+    Image = None
+
+# Entries per leaderboard page
+PAGE_SIZE = 10
+# Cached pages are re-rendered at least this often (seconds), so member names stay fresh
+PAGE_TTL = 300
+
+
+class GuildRanking:
+    """One guild's members sorted by score, best first (ties broken by user id)."""
+
+    __slots__ = ("entries", "scores")
+
+    def __init__(self, scores: dict):
+        # scores: user_id -> score
+        self.scores = dict(scores)
+        self.entries = sorted((-score, uid) for uid, score in self.scores.items())
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, user_id: int) -> bool:
+        return user_id in self.scores
+
+    def position(self, user_id: int):
+        """0-based position of a user, or None if they aren't ranked."""
+        score = self.scores.get(user_id)
+        if score is None:
+            return None
+        return bisect.bisect_left(self.entries, (-score, user_id))
+
+    def standing(self, user_id: int):
+        """(1-based rank, top percent) for a user, e.g. (4213, 3.5) for "#4,213, top 3.5%"."""
+        position = self.position(user_id)
+        if position is None:
+            return None
+        return position + 1, (position + 1) * 100 / len(self.entries)
+
+    def update(self, user_id: int, score: int) -> tuple:
+        """Set a user's score. Returns (old_position, new_position); old is None for new users."""
+        old = self.remove(user_id)
+        entry = (-score, user_id)
+        new = bisect.bisect_left(self.entries, entry)
+        self.entries.insert(new, entry)
+        self.scores[user_id] = score
+        return old, new
+
+    def remove(self, user_id: int):
+        """Remove a user. Returns their old position, or None."""
+        score = self.scores.pop(user_id, None)
+        if score is None:
+            return None
+        old = bisect.bisect_left(self.entries, (-score, user_id))
+        del self.entries[old]
+        return old
+
+    def page(self, start: int, count: int = PAGE_SIZE) -> list:
+        """[(user_id, score)] for positions start .. start + count - 1."""
+        return [(uid, -neg) for neg, uid in self.entries[start:start + count]]
+
+
+class PageCache:
+    """Rendered pages keyed by (guild_id, page) and kind ("rows", "image"), valid for `ttl` seconds."""
+
+    def __init__(self, name: str, page_size: int = PAGE_SIZE, ttl: float = PAGE_TTL):
+        self.name = name
+        self.page_size = page_size
+        self.ttl = ttl
+        # (guild_id, page) -> {kind: (expires, value)}
+        self.pages = {}
+
+    def get(self, guild_id: int, page: int, kind: str = "rows"):
+        entry = self.pages.get((guild_id, page), {}).get(kind)
+        if entry is None or entry[0] < time.monotonic():
+            LEADERBOARD_PAGES.inc(board=self.name, result="miss")
+            return None
+        LEADERBOARD_PAGES.inc(board=self.name, result="hit")
+        return entry[1]
+
+    def put(self, guild_id: int, page: int, value, kind: str = "rows"):
+        self.pages.setdefault((guild_id, page), {})[kind] = (time.monotonic() + self.ttl, value)
+
+    def invalidate(self, guild_id: int, first: int, last: int):
+        """Drop the cached pages covering positions first..last (0-based)."""
+        for page in range(first // self.page_size + 1, last // self.page_size + 2):
+            self.pages.pop((guild_id, page), None)
+
+    def clear(self):
+        self.pages.clear()
+
+
+class RankingIndex:
+    """Per-guild rankings over one field of a user data dict (e.g. ranks["<uid>"]["xp"])."""
+
+    def __init__(self, bot, name: str, data: dict, field: str):
+        self.bot = bot
+        self.data = data
+        self.field = field
+        self.cache = PageCache(name)
+        # guild_id -> GuildRanking, built on first use
+        self.guilds = {}
+
+    def for_guild(self, guild) -> GuildRanking:
+        """The guild's ranking, building it from the data on first use."""
+        ranking = self.guilds.get(guild.id)
+        if ranking is None:
+            field = self.field
+            ranking = GuildRanking({
+                int(uid): entry.get(field, 0)
+                for uid, entry in self.data.items()
+                if guild.get_member(int(uid))
+            })
+            self.guilds[guild.id] = ranking
+        return ranking
+
+    def changed(self, user_id: int):
+        """Re-rank a user whose score changed, in every built guild they belong to."""
+        entry = self.data.get(str(user_id))
+        if entry is None:
+            return
+        score = entry.get(self.field, 0)
+        for guild_id, ranking in self.guilds.items():
+            if user_id not in ranking:
+                guild = self.bot.get_guild(guild_id)
+                if guild is None or not guild.get_member(user_id):
+                    continue
+            elif ranking.scores[user_id] == score:
+                continue
+            old, new = ranking.update(user_id, score)
+            if old is None:
+                # A newcomer shifts everyone below them (and the page count)
+                self.cache.invalidate(guild_id, new, len(ranking) - 1)
+            else:
+                self.cache.invalidate(guild_id, min(old, new), max(old, new))
+
+    def member_left(self, guild_id: int, user_id: int):
+        ranking = self.guilds.get(guild_id)
+        if ranking is None:
+            return
+        old = ranking.remove(user_id)
+        if old is not None:
+            self.cache.invalidate(guild_id, old, len(ranking))
+
+    def member_joined(self, guild_id: int, user_id: int):
+        if guild_id in self.guilds:
+            self.changed(user_id)
+
+    def reset(self, data: dict = None):
+        """Forget every guild ranking (after bulk edits); they rebuild on next use."""
+        if data is not None:
+            self.data = data
+        self.guilds.clear()
+        self.cache.clear()
+
+    def rows(self, guild, page: int, format_value) -> tuple:
+        """Rendered rows for a 1-based page: ([(position, name, value)], total_pages).
+
+        `format_value(score)` turns a score into the displayed text. Rows are cached until
+        someone on the page changes position (or PAGE_TTL passes).
+        """
+        ranking = self.for_guild(guild)
+        total_pages = (len(ranking) + PAGE_SIZE - 1) // PAGE_SIZE
+        rows = self.cache.get(guild.id, page)
+        if rows is None:
+            start = (page - 1) * PAGE_SIZE
+            rows = []
+            for i, (user_id, score) in enumerate(ranking.page(start), start=start + 1):
+                member = guild.get_member(user_id)
+                name = member.display_name if member else f"Unknown ({user_id})"
+                rows.append((i, name, format_value(score)))
+            self.cache.put(guild.id, page, rows)
+        return rows, total_pages
+
+    def image(self, guild_id: int, page: int):
+        """Cached PNG for a page, or None."""
+        return self.cache.get(guild_id, page, kind="image")
+
+    def put_image(self, guild_id: int, page: int, png: bytes):
+        self.cache.put(guild_id, page, png, kind="image")
+
+
+def render_image(title: str, rows: list) -> bytes:
+    """Draw a leaderboard page as a PNG. Needs Pillow; slow enough to run in a worker thread."""
+    font = ImageFont.load_default()
+    row_height = 28
+    width = 520
+    img = Image.new("RGB", (width, 56 + row_height * max(1, len(rows))), (47, 49, 54))
+    draw = ImageDraw.Draw(img)
+    draw.text((16, 16), title, fill=(255, 215, 0), font=font)
+    for n, (position, name, value) in enumerate(rows):
+        y = 48 + n * row_height
+        if n % 2 == 0:
+            draw.rectangle((8, y - 4, width - 8, y + row_height - 8), fill=(54, 57, 63))
+        draw.text((16, y), f"#{position}", fill=(185, 187, 190), font=font)
+        draw.text((72, y), name[:32], fill=(255, 255, 255), font=font)
+        draw.text((320, y), value, fill=(185, 187, 190), font=font)
+    buffer = io.BytesIO()
+    img.save(buffer, format="PNG")
+    return buffer.getvalue()
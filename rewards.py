@@ -0,0 +1,150 @@
+"""Rewards engine — daily streaks, weekly activity rewards and scheduled payouts.
+
+Streaks and weekly claim counts are kept on each economy account and updated by /daily,
+so they cost nothing extra to persist. Everything time-based runs from one `Schedule`:
+a small list of jobs in `data/rewards.json`, driven by a single loop that sleeps until
+the next job is due and hands it to the economy cog, which credits everyone in one batch
+with one save.
+
+Job kinds:
+    weekly   Pays WEEKLY_REWARD to everyone who claimed /daily on at least
+             WEEKLY_MIN_CLAIMS days of the week just ended (created automatically)
+    payout   Admin-scheduled payout of `amount` to a guild's members (or one role),
+             optionally repeating every `every` seconds
+"""
+
+import asyncio
+import json
+import os
+import time
+
+from daily import day_of
+
+REWARDS_FILE = "data/rewards.json"
+# Extra credits per consecutive /daily day after the first, and the most days that count
+STREAK_BONUS = 10
+STREAK_CAP = 7
+WEEKLY_REWARD = 500
+WEEKLY_MIN_CLAIMS = 4
+WEEK = 7 * 86400
+# Longest the scheduler sleeps without re-checking (new jobs wake it immediately)
+MAX_SLEEP = 3600
+
+
+def streak_bonus(streak: int) -> int:
+    """Bonus credits for a /daily claim on day `streak` of a streak (day 1 earns none)."""
+    return min(max(streak - 1, 0), STREAK_CAP) * STREAK_BONUS
+
+
+def week_of(ts: float) -> int:
+    """Weeks since the epoch, starting on Mondays (UTC)."""
+    # 1970-01-01 was a Thursday
+    return (day_of(ts) + 3) // 7
+
+
+def week_start(week: int) -> float:
+    return (week * 7 - 3) * 86400
+
+
+class Job:
+    """One scheduled reward."""
+
+    __slots__ = ("id", "kind", "due", "every", "amount", "guild_id", "role_id", "channel_id")
+
+    def __init__(self, id: int, kind: str, due: float, every: float = 0, amount: int = 0,
+                 guild_id: int = None, role_id: int = None, channel_id: int = None):
+        self.id = id
+        self.kind = kind
+        self.due = due
+        # Seconds between runs; 0 runs once
+        self.every = every
+        self.amount = amount
+        self.guild_id = guild_id
+        self.role_id = role_id
+        # Where to announce the payout
+        self.channel_id = channel_id
+
+    def to_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Job":
+        return cls(**{name: data.get(name) for name in cls.__slots__ if name in data})
+
+
+class Schedule:
+    """Persisted reward jobs, run by one loop."""
+
+    def __init__(self, path: str = REWARDS_FILE, now: float = None):
+        self.path = path
+        self.jobs = {}
+        self.next_id = 1
+        self._wake = asyncio.Event()
+        self._load()
+        if not any(job.kind == "weekly" for job in self.jobs.values()):
+            now = now if now is not None else time.time()
+            self.add("weekly", week_start(week_of(now) + 1), every=WEEK)
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r") as f:
+                data = json.load(f)
+            for entry in data.get("jobs", []):
+                job = Job.from_dict(entry)
+                self.jobs[job.id] = job
+            self.next_id = max([data.get("next_id", 1)] + [job.id + 1 for job in self.jobs.values()])
+        except (ValueError, TypeError) as e:
+            print(f"[rewards] Failed to read {self.path}, starting with an empty schedule: {e}")
+
+    def save(self):
+        tmp_file = self.path + ".tmp"
+        with open(tmp_file, "w") as f:
+            json.dump({"next_id": self.next_id, "jobs": [job.to_dict() for job in self.jobs.values()]}, f, indent=4)
+        os.replace(tmp_file, self.path)
+
+    def add(self, kind: str, due: float, **fields) -> Job:
+        job = Job(self.next_id, kind, due, **fields)
+        self.next_id += 1
+        self.jobs[job.id] = job
+        self.save()
+        self._wake.set()
+        return job
+
+    def cancel(self, job_id: int) -> bool:
+        job = self.jobs.get(job_id)
+        if job is None or job.kind == "weekly":
+            return False
+        del self.jobs[job_id]
+        self.save()
+        return True
+
+    def _finish(self, job: Job, now: float):
+        """Reschedule a repeating job past `now` (skipping runs missed while offline) or drop it."""
+        if job.every:
+            missed = int((now - job.due) // job.every) + 1
+            job.due += missed * job.every
+        else:
+            self.jobs.pop(job.id, None)
+
+    async def run(self, handler):
+        """Run jobs as they fall due: `await handler(job)` then reschedule. Runs until cancelled."""
+        while True:
+            now = time.time()
+            due = sorted((job for job in self.jobs.values() if job.due <= now), key=lambda job: job.due)
+            for job in due:
+                try:
+                    await handler(job)
+                except Exception as e:
+                    print(f"[rewards] Job {job.id} ({job.kind}) failed: {e}")
+                self._finish(job, now)
+            if due:
+                self.save()
+
+            next_due = min((job.due for job in self.jobs.values()), default=now + MAX_SLEEP)
+            self._wake.clear()
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=min(max(next_due - time.time(), 0), MAX_SLEEP))
+            except asyncio.TimeoutError:
+                pass
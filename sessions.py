@@ -0,0 +1,173 @@
+"""Game session manager — sessions keyed by message id and driven by one shared tick loop."""
+
+import asyncio
+import time
+from collections import OrderedDict
+
+# How often the shared loop wakes up to advance games (seconds)
+TICK_INTERVAL = 0.1
+# Sessions with no button presses for this long are ended automatically
+IDLE_TIMEOUT = 180
+# Hard cap on concurrent sessions; the least recently active one is evicted first
+MAX_SESSIONS = 500
+
+
+class GameSession:
+    """A running game attached to a single message."""
+
+    __slots__ = (
+        "kind", "game", "players", "max_players", "interval", "updates_left",
+        "message", "view", "next_update", "last_active", "editing",
+    )
+
+    def __init__(self, kind: str, game, owner_id: int, max_players: int = 1, interval: float = None):
+        self.kind = kind
+        self.game = game
+        self.players = [owner_id]
+        self.max_players = max_players
+        # Seconds between automatic updates; None means the game only advances on input
+        self.interval = interval
+        # Number of automatic updates left, or None for no limit
+        self.updates_left = None
+        self.message = None
+        self.view = None
+        now = time.monotonic()
+        self.next_update = now + (interval or 0)
+        self.last_active = now
+        self.editing = False
+
+    @property
+    def owner_id(self) -> int:
+        return self.players[0]
+
+    def is_player(self, user_id: int) -> bool:
+        return user_id in self.players
+
+    def add_player(self, user_id: int) -> bool:
+        """Add a player to the session. Returns False if already joined or full."""
+        if user_id in self.players or len(self.players) >= self.max_players:
+            return False
+        self.players.append(user_id)
+        return True
+
+    def start_auto(self, interval: float, updates: int = None):
+        """Start (or restart) automatic updates every `interval` seconds."""
+        self.interval = interval
+        self.updates_left = updates
+        self.next_update = time.monotonic() + interval
+
+    def stop_auto(self):
+        """Stop automatic updates."""
+        self.interval = None
+        self.updates_left = None
+
+
+class SessionManager:
+    """Owns every active game session and advances them from a single loop task.
+
+    Sessions are keyed by the id of the message that displays them, so one user can host
+    several games and several users can share one. Memory is bounded by `max_sessions`
+    (least recently active sessions are evicted) and by `idle_timeout`.
+    """
+
+    def __init__(self, bot, tick_interval: float = TICK_INTERVAL, idle_timeout: float = IDLE_TIMEOUT,
+                 max_sessions: int = MAX_SESSIONS):
+        self.bot = bot
+        self.tick_interval = tick_interval
+        self.idle_timeout = idle_timeout
+        self.max_sessions = max_sessions
+        # message_id -> GameSession, ordered from least to most recently active
+        self.sessions = OrderedDict()
+        self._task = None
+
+    def __len__(self):
+        return len(self.sessions)
+
+    def get(self, message_id: int):
+        """Return the session for a message, or None."""
+        return self.sessions.get(message_id)
+
+    def touch(self, session: GameSession):
+        """Mark a session as recently used (call on every player input)."""
+        session.last_active = time.monotonic()
+        if session.message and session.message.id in self.sessions:
+            self.sessions.move_to_end(session.message.id)
+
+    async def add(self, session: GameSession, message):
+        """Register a session under its message and make sure the tick loop is running."""
+        session.message = message
+        self.sessions[message.id] = session
+        self.sessions.move_to_end(message.id)
+
+        while len(self.sessions) > self.max_sessions:
+            _, oldest = next(iter(self.sessions.items()))
+            await self.end(oldest, "\n**Session closed to make room for new games.**")
+
+        if self._task is None or self._task.done():
+            self._task = self.bot.loop.create_task(self._run())
+
+    def remove(self, session: GameSession):
+        """Forget a session without touching its message."""
+        if session.message:
+            self.sessions.pop(session.message.id, None)
+        if session.view:
+            session.view.stop()
+
+    async def end(self, session: GameSession, suffix: str = ""):
+        """Remove a session and show its final state with the controls removed."""
+        self.remove(session)
+        if session.message:
+            try:
+                await session.message.edit(content=f"{session.game.render()}{suffix}", view=None)
+            except Exception as e:
+                print(f"[sessions] Failed to close {session.kind} session: {e}")
+
+    def stop(self):
+        """Cancel the tick loop (call from cog_unload)."""
+        if self._task and not self._task.done():
+            self._task.cancel()
+        for session in list(self.sessions.values()):
+            self.remove(session)
+
+    async def _push(self, session: GameSession):
+        """Send the latest frame of a session to Discord."""
+        session.editing = True
+        try:
+            if getattr(session.game, "game_over", False):
+                await self.end(session)
+            else:
+                await session.message.edit(content=session.game.render())
+        except Exception as e:
+            # Message deleted or no longer editable - drop the session
+            print(f"[sessions] Dropping {session.kind} session: {e}")
+            self.remove(session)
+        finally:
+            session.editing = False
+
+    async def _run(self):
+        """Advance every due session once per tick until no sessions remain."""
+        try:
+            while self.sessions:
+                await asyncio.sleep(self.tick_interval)
+                now = time.monotonic()
+
+                # Sessions are ordered by activity, so idle ones sit at the front
+                for session in list(self.sessions.values()):
+                    if now - session.last_active < self.idle_timeout:
+                        break
+                    await self.end(session, "\n**Session ended (idle).**")
+
+                for session in list(self.sessions.values()):
+                    if session.interval is None or session.editing or now < session.next_update:
+                        continue
+                    session.next_update = now + session.interval
+                    session.game.update()
+                    if session.updates_left is not None:
+                        session.updates_left -= 1
+                        if session.updates_left <= 0:
+                            session.stop_auto()
+                    # Edits run concurrently so one slow message can't stall the others;
+                    # `editing` keeps it to at most one in-flight edit per session
+                    self.bot.loop.create_task(self._push(session))
+        except asyncio.CancelledError:
+            return
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Offline casino simulator.
+Plays millions of rounds through the same payout rules the Casino cog uses
+(`casino_rules.py`, `cards.py`) without connecting to Discord, and reports
+house edge, variance and throughput for each game.
+
+Usage:
+    python3 simulate_casino.py                        # every game, 1,000,000 rounds each
+    python3 simulate_casino.py slots --rounds 5000000
+    python3 simulate_casino.py roulette --bet-type 17
+    python3 simulate_casino.py blackjack --seed 42
+    python3 simulate_casino.py slots --slots-config my_reels.json   # try a custom reel set
+
+Uses numpy for batched random draws when it is installed, and the standard
+library otherwise.
+"""
+
+import argparse
+import json
+import math
+import random
+import sys
+import time
+from collections import Counter
+
+from cards import Hand, Shoe, dealer_play
+from casino_rules import (
+    CLASSIC_SLOTS,
+    ROULETTE_POCKETS,
+    SlotMachine,
+    blackjack_natural_payout,
+    blackjack_payout,
+    roulette_payout,
+    slot_machine_from_config,
+)
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional - fall back to the random module
+    np = None
+
+# Rounds drawn per batch; keeps memory flat no matter how many rounds are simulated
+CHUNK_SIZE = 100_000
+
+
+class RoundStats:
+    """Accumulates per-round net results (payout - bet) in units of the bet."""
+
+    def __init__(self, name: str, bet: int):
+        self.name = name
+        self.bet = bet
+        self.rounds = 0
+        self.total = 0.0
+        self.total_sq = 0.0
+        self.wins = 0
+        self.elapsed = 0.0
+
+    def add(self, payout: int, count: int = 1):
+        """Record `count` rounds that each paid `payout`."""
+        net = (payout - self.bet) / self.bet
+        self.rounds += count
+        self.total += net * count
+        self.total_sq += net * net * count
+        if payout > self.bet:
+            self.wins += count
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.rounds if self.rounds else 0.0
+
+    @property
+    def house_edge(self) -> float:
+        """Expected loss per credit bet (positive favours the house)."""
+        return -self.mean
+
+    @property
+    def variance(self) -> float:
+        if not self.rounds:
+            return 0.0
+        return max(0.0, self.total_sq / self.rounds - self.mean ** 2)
+
+    def report(self):
+        stderr = math.sqrt(self.variance / self.rounds) if self.rounds else 0.0
+        rate = self.rounds / self.elapsed if self.elapsed else 0.0
+        print(f"🎲 {self.name}")
+        print(f"   Rounds:      {self.rounds:,}")
+        print(f"   House edge:  {self.house_edge * 100:+.3f}% (±{1.96 * stderr * 100:.3f}% at 95%)")
+        print(f"   RTP:         {(1 + self.mean) * 100:.3f}%")
+        print(f"   Win rate:    {self.wins / self.rounds * 100:.2f}%" if self.rounds else "   Win rate:    n/a")
+        print(f"   Variance:    {self.variance:.4f} (std dev {math.sqrt(self.variance):.4f} bets/round)")
+        print(f"   Throughput:  {rate:,.0f} rounds/sec")
+
+
+def _chunks(rounds: int):
+    while rounds > 0:
+        size = min(CHUNK_SIZE, rounds)
+        yield size
+        rounds -= size
+
+
+def _numpy_spin_codes(machine: SlotMachine, size: int, np_rng):
+    """Vectorised alias sampling: returns one int code per spin (r0 * k² + r1 * k + r2)."""
+    k = len(machine.emojis)
+    codes = np.zeros(size, dtype=np.int64)
+    for prob, alias in machine.reels:
+        u = np_rng.random(size) * k
+        col = u.astype(np.int64)
+        keep = (u - col) < np.asarray(prob)[col]
+        codes = codes * k + np.where(keep, col, np.asarray(alias)[col])
+    return codes
+
+
+def simulate_slots(rounds: int, bet: int, rng: random.Random, np_rng=None,
+                   machine: SlotMachine = CLASSIC_SLOTS) -> RoundStats:
+    """Spin the slot machine `rounds` times."""
+    stats = RoundStats("Slots", bet)
+    k = len(machine.emojis)
+    start = time.perf_counter()
+    for size in _chunks(rounds):
+        if np_rng is not None:
+            counts = np.bincount(_numpy_spin_codes(machine, size, np_rng), minlength=k ** 3).tolist()
+            outcomes = {(c // (k * k), c // k % k, c % k): n for c, n in enumerate(counts) if n}
+        else:
+            outcomes = Counter(machine.spin_indices(size, rng))
+        # Only a few hundred distinct spins exist, so score each once and weight by count
+        for (r0, r1, r2), count in outcomes.items():
+            emojis = machine.emojis
+            payout, _ = machine.payout(bet, (emojis[r0], emojis[r1], emojis[r2]))
+            stats.add(payout, count)
+    stats.elapsed = time.perf_counter() - start
+    return stats
+
+
+def simulate_roulette(rounds: int, bet: int, bet_type: str, rng: random.Random, np_rng=None) -> RoundStats:
+    """Spin the roulette wheel `rounds` times with the same bet each time."""
+    stats = RoundStats(f"Roulette ({bet_type})", bet)
+    start = time.perf_counter()
+    for size in _chunks(rounds):
+        if np_rng is not None:
+            pockets = np.bincount(np_rng.integers(0, ROULETTE_POCKETS, size=size), minlength=ROULETTE_POCKETS)
+            outcomes = enumerate(pockets.tolist())
+        else:
+            outcomes = Counter(rng.choices(range(ROULETTE_POCKETS), k=size)).items()
+        for result, count in outcomes:
+            if count:
+                stats.add(roulette_payout(bet, bet_type, result), count)
+    stats.elapsed = time.perf_counter() - start
+    return stats
+
+
+def simulate_blackjack(rounds: int, bet: int, rng: random.Random, stand_on: int = 17) -> RoundStats:
+    """Play `rounds` hands from one shoe; the player hits until reaching `stand_on`."""
+    stats = RoundStats(f"Blackjack (player stands on {stand_on})", bet)
+    shoe = Shoe(rng=rng)
+    start = time.perf_counter()
+    for _ in range(rounds):
+        shoe.start_hand()
+        player = Hand((shoe.draw(), shoe.draw()))
+        dealer = Hand((shoe.draw(), shoe.draw()))
+        payout = blackjack_natural_payout(bet, player, dealer)
+        if payout is None:
+            while player.total < stand_on:
+                player.add(shoe.draw())
+            if not player.is_bust:
+                dealer_play(dealer, shoe)
+            payout = blackjack_payout(bet, player, dealer)
+        stats.add(payout)
+    stats.elapsed = time.perf_counter() - start
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulate casino games offline to verify payouts.")
+    parser.add_argument("game", nargs="?", default="all", choices=["all", "slots", "roulette", "blackjack"])
+    parser.add_argument("--rounds", type=int, default=1_000_000, help="Rounds to simulate per game")
+    parser.add_argument("--bet", type=int, default=100, help="Bet size in credits")
+    parser.add_argument("--bet-type", default="red", help="Roulette bet: red, black, odd, even, or 0-36")
+    parser.add_argument("--stand-on", type=int, default=17, help="Blackjack player stands at this total")
+    parser.add_argument("--seed", type=int, default=None, help="Seed for reproducible runs")
+    parser.add_argument("--slots-config", default=None,
+                        help="JSON file with a reel set in the settings.json `slots` format")
+    args = parser.parse_args()
+
+    machine = CLASSIC_SLOTS
+    if args.slots_config:
+        with open(args.slots_config) as f:
+            machine = slot_machine_from_config(json.load(f))
+
+    rng = random.Random(args.seed)
+    np_rng = np.random.default_rng(args.seed) if np is not None else None
+
+    print("🎰 Casino Simulator\n")
+    print(f"RNG: {'numpy (batched)' if np_rng is not None else 'random (batched)'}\n")
+
+    if args.game in ("all", "slots"):
+        simulate_slots(args.rounds, args.bet, rng, np_rng, machine).report()
+    if args.game in ("all", "roulette"):
+        simulate_roulette(args.rounds, args.bet, args.bet_type, rng, np_rng).report()
+    if args.game in ("all", "blackjack"):
+        simulate_blackjack(args.rounds, args.bet, rng, args.stand_on).report()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,141 @@
+"""Anti-spam scoring for message XP — sliding-window rates and near-duplicate detection.
+
+Each (user, channel) pair keeps a fixed-size ring buffer of recent message times and the
+content sketches of its last few messages, packed into `array`s (about 1 KB per pair
+including the map entry). Pairs live in an LRU map: a pair idle for longer than
+RATE_WINDOW is dropped, and the map never holds more than MAX_TRACKED pairs, which is
+sized from MEMORY_BUDGET, so memory stays bounded however many users are active.
+
+`SpamTracker.record()` runs on every guild message (including ones inside the XP
+cooldown, so bursts are seen in full) and returns a factor between 0 and 1 that the
+XP award is multiplied by.
+"""
+
+import heapq
+import re
+from array import array
+from collections import OrderedDict
+
+# Message times remembered per (user, channel) - also the most a window can count
+RING_SIZE = 16
+# Content sketches remembered per (user, channel)
+RECENT_CONTENT = 4
+# Sliding window for message rate (seconds) and how many messages in it earn full XP
+RATE_WINDOW = 60
+RATE_ALLOWANCE = 6
+# Characters per shingle and hashes kept per sketch
+SHINGLE = 4
+SKETCH_SIZE = 8
+# (similarity, XP factor) - the first threshold reached applies
+DUPLICATE_PENALTIES = ((0.8, 0.1), (0.5, 0.5))
+# Memory the tracker may use, and the measured cost of one tracked pair with full
+# buffers (tracemalloc: Activity, its arrays, the key tuple and the LRU map entry)
+MEMORY_BUDGET = 32 * 1024 * 1024
+PAIR_BYTES = 1024
+# Tracked (user, channel) pairs before the least recently active are dropped
+MAX_TRACKED = MEMORY_BUDGET // PAIR_BYTES
+
+_SQUASH = re.compile(r"[^a-z0-9]+")
+
+
+def content_sketch(content: str) -> frozenset:
+    """Bottom-k sketch of the message's character shingles.
+
+    Each overlapping SHINGLE-character window is hashed, and the SKETCH_SIZE smallest
+    hashes are kept. Two messages' sketches overlap roughly as much as their text does,
+    so near-duplicates ("buy now!!!" / "buy now!!!!") score close to 1.
+    """
+    text = _SQUASH.sub(" ", content.lower()).strip()
+    if len(text) <= SHINGLE:
+        return frozenset((hash(text),))
+    shingles = {hash(text[i:i + SHINGLE]) for i in range(len(text) - SHINGLE + 1)}
+    return frozenset(heapq.nsmallest(SKETCH_SIZE, shingles))
+
+
+def similarity(a: frozenset, b: frozenset) -> float:
+    """Estimated resemblance of two sketches (0 = unrelated, 1 = same text)."""
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+class Activity:
+    """Recent activity for one user in one channel."""
+
+    __slots__ = ("times", "pos", "last", "hashes", "lengths")
+
+    def __init__(self):
+        self.times = array("d", bytes(8 * RING_SIZE))
+        self.pos = 0
+        self.last = 0.0
+        # The last RECENT_CONTENT sketches' hashes back to back, oldest first, and their sizes
+        self.hashes = array("q")
+        self.lengths = array("B")
+
+    def add_time(self, now: float) -> int:
+        """Record a message and return how many fall inside the rate window."""
+        self.times[self.pos] = now
+        self.pos = (self.pos + 1) % RING_SIZE
+        self.last = now
+        cutoff = now - RATE_WINDOW
+        return sum(1 for t in self.times if t > cutoff)
+
+    def add_sketch(self, sketch: frozenset) -> float:
+        """Record a message's sketch and return its highest similarity to the recent ones."""
+        best, start = 0.0, 0
+        for length in self.lengths:
+            shared = len(sketch.intersection(self.hashes[start:start + length]))
+            best = max(best, shared / (len(sketch) + length - shared))
+            start += length
+        self.hashes.extend(sketch)
+        self.lengths.append(len(sketch))
+        if len(self.lengths) > RECENT_CONTENT:
+            del self.hashes[:self.lengths[0]]
+            del self.lengths[0]
+        return best
+
+
+class SpamTracker:
+    """Bounded LRU of per-(user, channel) activity."""
+
+    def __init__(self, max_tracked: int = MAX_TRACKED):
+        self.max_tracked = max_tracked
+        self.activity = OrderedDict()
+
+    def __len__(self):
+        return len(self.activity)
+
+    def _expire(self, now: float):
+        """Drop pairs idle for longer than the rate window (least recently active first)."""
+        cutoff = now - RATE_WINDOW
+        while self.activity:
+            oldest = next(iter(self.activity.values()))
+            if oldest.last > cutoff:
+                break
+            self.activity.popitem(last=False)
+
+    def record(self, user_id: int, channel_id: int, content: str, now: float) -> float:
+        """Record a message and return the XP factor for it (1.0 = no penalty)."""
+        self._expire(now)
+        key = (user_id, channel_id)
+        activity = self.activity.get(key)
+        if activity is None:
+            activity = self.activity[key] = Activity()
+            if len(self.activity) > self.max_tracked:
+                self.activity.popitem(last=False)
+        else:
+            self.activity.move_to_end(key)
+
+        factor = 1.0
+        count = activity.add_time(now)
+        if count > RATE_ALLOWANCE:
+            # Scale XP down the further the burst goes past the allowance
+            factor = RATE_ALLOWANCE / count
+
+        if content:
+            resemblance = activity.add_sketch(content_sketch(content))
+            for threshold, penalty in DUPLICATE_PENALTIES:
+                if resemblance >= threshold:
+                    factor *= penalty
+                    break
+        return factor
@@ -0,0 +1,84 @@
+"""Voice XP accrual — time spent in voice channels, credited in batches.
+
+Voice state events only update a small per-member record (O(1), no saving). The rank
+cog's single ticker calls `collect()` once a minute to turn the accrued time of every
+member into whole XP, then credits all of them with one save.
+"""
+
+
+class VoiceSession:
+    """One member's current voice channel and the XP accrued since the last collection."""
+
+    __slots__ = ("channel_id", "since", "eligible", "rate", "xp")
+
+    def __init__(self, channel_id: int, now: float, eligible: bool, rate: float):
+        self.channel_id = channel_id
+        # Accrued up to this time
+        self.since = now
+        # Whether the time since `since` earns XP (not deafened/AFK, not alone)
+        self.eligible = eligible
+        # XP per minute in this channel
+        self.rate = rate
+        # Fractional XP not yet credited
+        self.xp = 0.0
+
+    def accrue(self, now: float):
+        if self.eligible and now > self.since:
+            self.xp += (now - self.since) / 60 * self.rate
+        self.since = now
+
+
+class VoiceTracker:
+    """Voice sessions keyed by (guild_id, user_id)."""
+
+    def __init__(self):
+        self.sessions = {}
+        # Sessions that ended since the last collection, still holding XP
+        self._finished = []
+
+    def __len__(self):
+        return len(self.sessions)
+
+    def update(self, key: tuple, channel_id: int, now: float, eligible: bool, rate: float):
+        """Member joined, moved, or changed mute/deafen state."""
+        session = self.sessions.get(key)
+        if session is None:
+            self.sessions[key] = VoiceSession(channel_id, now, eligible, rate)
+            return
+        # Time so far counts under the old state
+        session.accrue(now)
+        if session.channel_id != channel_id:
+            self._finished.append((key, session.channel_id, session.xp))
+            session.xp = 0.0
+        session.channel_id = channel_id
+        session.eligible = eligible
+        session.rate = rate
+
+    def leave(self, key: tuple, now: float):
+        """Member left voice."""
+        session = self.sessions.pop(key, None)
+        if session is not None:
+            session.accrue(now)
+            self._finished.append((key, session.channel_id, session.xp))
+
+    def collect(self, now: float) -> dict:
+        """Accrue every session up to `now` and take out the whole XP earned.
+
+        Returns {(guild_id, user_id): (xp, channel_id)}; fractions carry over to the next
+        collection. For members who moved, the channel is the one they are in now.
+        """
+        awards = {}
+        for key, channel_id, xp in self._finished:
+            if xp >= 1:
+                total, _ = awards.get(key, (0, channel_id))
+                awards[key] = (total + int(xp), channel_id)
+        self._finished = []
+
+        for key, session in self.sessions.items():
+            session.accrue(now)
+            whole = int(session.xp)
+            if whole:
+                session.xp -= whole
+                total, _ = awards.get(key, (0, session.channel_id))
+                awards[key] = (total + whole, session.channel_id)
+        return awards
@@ -0,0 +1,136 @@
+"""XP rules — per-guild and per-channel message XP settings, compiled into a lookup table.
+
+Rules come from the optional `xp_rules` entry of each guild in settings.json and are
+merged once at load time into one `XPRule` per configured (guild, channel), so
+handling a message is a dict lookup plus a little arithmetic:
+
+    "xp_rules": {
+        "cooldown": 10,                 # seconds between XP awards per user
+        "min_xp": 15, "max_xp": 25,     # random base XP per message
+        "multiplier": 1.0,
+        "no_xp_channels": [123],        # channels (or thread parents) that never give XP
+        "channels": {"456": {"multiplier": 2.0, "cooldown": 5}},
+        "role_boosts": {"789": 1.5},    # the best boost among the member's roles applies
+        "length_weighting": {"full_length": 80, "min_factor": 0.5},
+        "voice_xp_per_minute": 5        # XP per minute in voice (0 turns voice XP off)
+    }
+
+Channel entries accept the same keys as the guild (except `channels` and `no_xp_channels`)
+and override them. A guild with `"xp_enabled": false` gives no message or voice XP at all.
+"""
+
+import random
+
+DEFAULT_COOLDOWN = 10
+DEFAULT_MIN_XP = 15
+DEFAULT_MAX_XP = 25
+DEFAULT_VOICE_XP = 5
+
+
+class XPRule:
+    """Effective XP settings for one guild or channel."""
+
+    __slots__ = ("enabled", "cooldown", "min_xp", "max_xp", "multiplier", "role_boosts",
+                 "full_length", "min_factor", "voice_xp")
+
+    def __init__(self, enabled=True, cooldown=DEFAULT_COOLDOWN, min_xp=DEFAULT_MIN_XP, max_xp=DEFAULT_MAX_XP,
+                 multiplier=1.0, role_boosts=None, full_length=0, min_factor=1.0, voice_xp=DEFAULT_VOICE_XP):
+        if min_xp > max_xp:
+            raise ValueError("min_xp must not exceed max_xp")
+        self.enabled = enabled
+        self.cooldown = cooldown
+        self.min_xp = min_xp
+        self.max_xp = max_xp
+        self.multiplier = multiplier
+        # ((role_id, boost), ...) sorted best first, so the first role the member has wins
+        self.role_boosts = tuple(sorted((role_boosts or {}).items(), key=lambda item: -item[1]))
+        # Messages shorter than `full_length` characters earn between min_factor and 1x
+        self.full_length = full_length
+        self.min_factor = min_factor
+        # XP per minute spent in a voice channel (before the multiplier)
+        self.voice_xp = voice_xp
+
+    def with_overrides(self, config: dict) -> "XPRule":
+        """Return a copy of this rule with the keys in `config` applied."""
+        length = config.get("length_weighting", {})
+        boosts = dict(self.role_boosts)
+        boosts.update({int(k): float(v) for k, v in config.get("role_boosts", {}).items()})
+        return XPRule(
+            enabled=config.get("enabled", self.enabled),
+            cooldown=float(config.get("cooldown", self.cooldown)),
+            min_xp=int(config.get("min_xp", self.min_xp)),
+            max_xp=int(config.get("max_xp", self.max_xp)),
+            multiplier=float(config.get("multiplier", self.multiplier)),
+            role_boosts=boosts,
+            full_length=int(length.get("full_length", self.full_length)),
+            min_factor=float(length.get("min_factor", self.min_factor)),
+            voice_xp=float(config.get("voice_xp_per_minute", self.voice_xp)),
+        )
+
+    def xp_for(self, message, rng=random) -> int:
+        """XP earned by a message under this rule."""
+        factor = self.multiplier
+        if self.role_boosts:
+            get_role = getattr(message.author, "get_role", None)
+            if get_role is not None:
+                for role_id, boost in self.role_boosts:
+                    if get_role(role_id):
+                        factor *= boost
+                        break
+        if self.full_length:
+            length = len(message.content)
+            if length < self.full_length:
+                factor *= self.min_factor + (1 - self.min_factor) * length / self.full_length
+        return int(rng.randint(self.min_xp, self.max_xp) * factor)
+
+
+DEFAULT_RULE = XPRule()
+DISABLED_RULE = XPRule(enabled=False, voice_xp=0)
+
+
+class XPRuleTable:
+    """Compiled XP rules keyed by guild and by (guild_id, channel_id)."""
+
+    def __init__(self):
+        self.guilds = {}
+        self.channels = {}
+
+    def __len__(self):
+        return len(self.guilds) + len(self.channels)
+
+    def add_guild(self, guild_id: int, guild_config: dict):
+        """Compile one guild's settings entry."""
+        if guild_config.get("xp_enabled") is False:
+            self.guilds[guild_id] = DISABLED_RULE
+            return
+        config = guild_config.get("xp_rules") or {}
+        guild_rule = DEFAULT_RULE.with_overrides(config)
+        self.guilds[guild_id] = guild_rule
+        for channel_id in config.get("no_xp_channels", []):
+            self.channels[(guild_id, int(channel_id))] = DISABLED_RULE
+        for channel_id, channel_config in config.get("channels", {}).items():
+            self.channels[(guild_id, int(channel_id))] = guild_rule.with_overrides(channel_config)
+
+    def rule_for(self, guild_id: int, channel) -> XPRule:
+        """Rule for a message channel; threads fall back to their parent channel's rule."""
+        rule = self.channels.get((guild_id, channel.id))
+        if rule is None:
+            parent_id = getattr(channel, "parent_id", None)
+            if parent_id is not None:
+                rule = self.channels.get((guild_id, parent_id))
+            if rule is None:
+                rule = self.guilds.get(guild_id, DEFAULT_RULE)
+        return rule
+
+
+def compile_rules(settings: dict) -> XPRuleTable:
+    """Compile every guild in a settings.json mapping. Guilds with bad entries keep the defaults."""
+    table = XPRuleTable()
+    for gid, config in settings.items():
+        if not isinstance(config, dict):
+            continue
+        try:
+            table.add_guild(int(gid), config)
+        except (TypeError, ValueError, AttributeError) as e:
+            print(f"[xp_rules] Ignoring invalid XP rules for guild {gid}: {e}")
+    return table